@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Category, Channel, Message, TelegramSession, BotSettings, TelegramChannel
+from .models import Category, Channel, Message, TelegramSession, BotSettings, TelegramChannel, Subscription, ParserLease, OutboxOffset, MessageEntity, ServiceHeartbeat
 import subprocess
 import os
 import sys
@@ -7,6 +7,7 @@ import logging
 from django.http import HttpResponseRedirect
 from django.urls import path
 from django.contrib import messages
+from django.utils import timezone
 
 logger = logging.getLogger('admin_panel')
 
@@ -18,17 +19,73 @@ class CategoryAdmin(admin.ModelAdmin):
 
 @admin.register(Channel)
 class ChannelAdmin(admin.ModelAdmin):
-    list_display = ('name', 'category', 'is_active', 'session', 'updated_at')
-    list_filter = ('is_active', 'category', 'session')
+    list_display = ('name', 'category', 'is_active', 'session', 'session_auto', 'updated_at')
+    list_filter = ('is_active', 'category', 'session', 'session_auto')
     search_fields = ('name', 'url')
     readonly_fields = ('created_at', 'updated_at')
+    
+    def save_model(self, request, obj, form, change):
+        # A session picked by hand is pinned, the balancer won't move it
+        if 'session' in form.changed_data:
+            obj.session_auto = False
+        super().save_model(request, obj, form, change)
+
+class EntityIndexFilter(admin.SimpleListFilter):
+    """
+    Filter messages through the entity index. Offers the most frequent recent
+    values, any other value can be given in the URL, e.g. ?hashtag=news
+    """
+    kind = None
+    
+    def lookups(self, request, model_admin):
+        from tg_bot.entity_index import top_values
+        return [(value, value) for value in top_values(self.kind, limit=15)]
+    
+    def queryset(self, request, queryset):
+        from tg_bot import entity_index
+        if not self.value():
+            return queryset
+        lookups = {
+            entity_index.HASHTAG: entity_index.messages_with_hashtag,
+            entity_index.MENTION: entity_index.messages_with_mention,
+            'domain': entity_index.messages_linking_domain,
+        }
+        return queryset.filter(id__in=lookups[self.kind](self.value()).values('id'))
+
+class HashtagFilter(EntityIndexFilter):
+    title = 'hashtag'
+    parameter_name = 'hashtag'
+    kind = 'hashtag'
+
+class MentionFilter(EntityIndexFilter):
+    title = 'mention'
+    parameter_name = 'mention'
+    kind = 'mention'
+
+class LinkedDomainFilter(EntityIndexFilter):
+    title = 'linked domain'
+    parameter_name = 'domain'
+    kind = 'domain'
+
+class MessageEntityInline(admin.TabularInline):
+    """Hashtags, mentions and links of a message, written by the parser"""
+    model = MessageEntity
+    fields = ('kind', 'value', 'domain')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+    
+    def has_add_permission(self, request, obj=None):
+        return False
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
-    list_display = ('telegram_message_id', 'channel', 'created_at', 'media_type')
-    list_filter = ('media_type', 'channel', 'created_at')
+    list_display = ('telegram_message_id', 'channel', 'created_at', 'media_type', 'language')
+    list_filter = ('media_type', 'language', HashtagFilter, MentionFilter, LinkedDomainFilter, 'channel', 'created_at')
     search_fields = ('text', 'telegram_message_id', 'telegram_channel_id')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at', 'updated_at', 'language', 'enriched_at',
+                       'duplicate_of', 'duplicate_count', 'media_hash')
+    inlines = [MessageEntityInline]
 
 @admin.register(TelegramSession)
 class TelegramSessionAdmin(admin.ModelAdmin):
@@ -51,10 +108,17 @@ class TelegramSessionAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
         ('Системна інформація', {
-            'fields': ('created_at', 'updated_at'),
+            'fields': ('flood_wait_until', 'join_flood_wait_until', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
+    actions = ['reconnect_in_parser']
+    
+    def reconnect_in_parser(self, request, queryset):
+        # The parser reconnects sessions whose updated_at changed
+        count = queryset.update(updated_at=timezone.now())
+        self.message_user(request, f"{count} сесій буде перепідключено парсером", messages.SUCCESS)
+    reconnect_in_parser.short_description = "Перепідключити в парсері"
 
 @admin.register(BotSettings)
 class BotSettingsAdmin(admin.ModelAdmin):
@@ -160,3 +224,47 @@ class TelegramChannelAdmin(admin.ModelAdmin):
     search_fields = ('title', 'username', 'channel_id')
     readonly_fields = ('created_at', 'updated_at')
 
+@admin.register(Subscription)
+class SubscriptionAdmin(admin.ModelAdmin):
+    list_display = ('chat_id', 'username', 'category', 'is_active', 'created_at')
+    list_filter = ('is_active', 'category')
+    search_fields = ('chat_id', 'username')
+    readonly_fields = ('created_at', 'updated_at')
+
+@admin.register(ParserLease)
+class ParserLeaseAdmin(admin.ModelAdmin):
+    list_display = ('name', 'owner', 'acquired_at', 'heartbeat_at', 'expires_at')
+    readonly_fields = ('name', 'owner', 'acquired_at', 'heartbeat_at', 'expires_at')
+    
+    def has_add_permission(self, request):
+        return False
+
+@admin.register(OutboxOffset)
+class OutboxOffsetAdmin(admin.ModelAdmin):
+    list_display = ('consumer', 'position', 'updated_at')
+    readonly_fields = ('consumer', 'position', 'updated_at')
+    
+    def has_add_permission(self, request):
+        return False
+
+@admin.register(MessageEntity)
+class MessageEntityAdmin(admin.ModelAdmin):
+    list_display = ('kind', 'value', 'domain', 'message')
+    list_filter = ('kind',)
+    # exact lookups only, they use the index
+    search_fields = ('=value', '=domain')
+    raw_id_fields = ('message',)
+    list_select_related = ('message',)
+    
+    def has_add_permission(self, request):
+        return False
+
+@admin.register(ServiceHeartbeat)
+class ServiceHeartbeatAdmin(admin.ModelAdmin):
+    list_display = ('name', 'kind', 'state', 'host', 'pid', 'heartbeat_at', 'messages_ingested', 'last_error_at')
+    list_filter = ('kind', 'state')
+    readonly_fields = ('name', 'kind', 'state', 'host', 'pid', 'started_at', 'heartbeat_at', 'interval',
+                       'cycle_seconds', 'channels_polled', 'messages_ingested', 'last_error', 'last_error_at', 'details')
+    
+    def has_add_permission(self, request):
+        return False
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AdminPanelConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'admin_panel'
+
+    def ready(self):
+        from admin_panel.feed_cache import connect_signals
+        connect_signals()
@@ -0,0 +1,239 @@
+"""
+Stylesheets of the public pages, built by ``python manage.py build_assets``.
+
+The libraries are vendored in static/vendor, no page loads anything from a
+CDN:
+
+    vendor/bootstrap    Bootstrap 5.3.2, bootstrap.min.css and bootstrap.min.js
+    vendor/fontawesome  Font Awesome Free 6.4.2, all.min.css and the webfonts
+    vendor/jquery       jQuery 3.7.1
+
+A page takes a few dozen of the thousands of rules in Bootstrap and Font
+Awesome. The build tree-shakes the stylesheets of every bundle against the
+markup of its page: a rule stays when each class, id and attribute its
+selector names occurs somewhere in the content files. Two files are written
+to static/build per bundle:
+
+    <name>.critical.css  the stylesheets in "critical", shaken against the
+                         markup above the ``{# fold #}`` marker, inlined in
+                         a <style> tag so the first paint needs no request
+    <name>.css           the stylesheets in "deferred", shaken against the
+                         whole page and its scripts, loaded after first paint
+
+The scripts are part of the content because they add classes at runtime
+(Bootstrap's ``show`` and ``collapsing``). A bundle without deferred
+stylesheets is inlined as a whole, the error pages have nothing to load.
+When the bundle is not built, as on a fresh checkout, stylesheet_tags()
+links the full stylesheets instead.
+"""
+import os
+import re
+import logging
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+logger = logging.getLogger(__name__)
+
+BOOTSTRAP_CSS = 'vendor/bootstrap/bootstrap.min.css'
+FONTAWESOME_CSS = 'vendor/fontawesome/css/all.min.css'
+
+BUNDLES = {
+    # public feed, templates/admin_panel/index.html
+    'index': {
+        'critical': [BOOTSTRAP_CSS, 'css/index.css'],
+        'deferred': [BOOTSTRAP_CSS, FONTAWESOME_CSS, 'css/index.css'],
+        'content': ['templates/admin_panel/index.html'],
+        'scripts': ['vendor/jquery/jquery.min.js', 'vendor/bootstrap/bootstrap.min.js'],
+    },
+    # bot status page, core.direct_views.direct_index_view
+    'status': {
+        'critical': [BOOTSTRAP_CSS, 'css/status.css'],
+        'deferred': [BOOTSTRAP_CSS, FONTAWESOME_CSS, 'css/status.css'],
+        'content': ['core/direct_views.py'],
+        'scripts': [],
+    },
+    # fallback pages the views return when rendering failed
+    'error': {
+        'critical': [BOOTSTRAP_CSS],
+        'deferred': [],
+        'content': ['admin_panel/views.py', 'core/views.py'],
+        'scripts': [],
+    },
+}
+
+BUILD_DIR = 'build'
+FOLD_MARKER = '{# fold #}'
+
+# A selector's class and id names, a class name may hold escaped characters
+SELECTOR_NAME = re.compile(r'[.#]((?:\\.|[\w-])+)')
+# Attribute selectors, the name and for an exact match the value
+SELECTOR_ATTRIBUTE = re.compile(r'\[\s*([\w-]+)\s*(?:(\W?)=\s*["\']?([^"\'\]]*)["\']?)?\s*(?:[is]\s*)?\]')
+# :not(), :is(), :where() and :has() arguments, matching does not need them
+SELECTOR_ARGUMENTS = re.compile(r':[\w-]+\((?:[^()]|\([^()]*\))*\)')
+CONTENT_WORD = re.compile(r'[\w-]+')
+URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+KEYFRAMES_NAME = re.compile(r'[\w-]+')
+NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+_critical_cache = {}
+
+def build_path(name, critical=False):
+    """Path of a built stylesheet, relative to the static dirs"""
+    return f"{BUILD_DIR}/{name}{'.critical' if critical else ''}.css"
+
+def content_words(text):
+    """Every word a selector could name in the markup or script"""
+    return set(CONTENT_WORD.findall(text))
+
+def selector_matches(selector, words):
+    """Whether the classes, ids and attributes of a selector all occur in words"""
+    selector = SELECTOR_ARGUMENTS.sub('', selector)
+    required = {name.replace('\\', '') for name in SELECTOR_NAME.findall(selector)}
+    for attribute, operator, value in SELECTOR_ATTRIBUTE.findall(selector):
+        required.add(attribute)
+        if not operator and value:
+            required.update(CONTENT_WORD.findall(value))
+    return required <= words
+
+def split_selectors(prelude):
+    """Split a selector list on the commas outside of parentheses and brackets"""
+    selectors, depth, start = [], 0, 0
+    for index, char in enumerate(prelude):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:index])
+            start = index + 1
+    selectors.append(prelude[start:])
+    return [selector.strip() for selector in selectors if selector.strip()]
+
+def _compact(text):
+    # CSS strings cannot hold a raw newline, so a line break is always whitespace
+    return re.sub(r'\s*\n\s*', ' ', text).strip()
+
+def _shake_rules(rules, words, font_faces):
+    import tinycss2
+
+    kept, keyframes = [], []
+    for rule in rules:
+        if rule.type == 'qualified-rule':
+            selectors = [
+                selector for selector in split_selectors(_compact(tinycss2.serialize(rule.prelude)))
+                if selector_matches(selector, words)
+            ]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{_compact(tinycss2.serialize(rule.content))}}}")
+        elif rule.type == 'at-rule':
+            keyword = rule.lower_at_keyword
+            prelude = _compact(tinycss2.serialize(rule.prelude))
+            if keyword in ('media', 'supports', 'container', 'layer') and rule.content is not None:
+                nested = tinycss2.parse_rule_list(rule.content, skip_comments=True, skip_whitespace=True)
+                inner, inner_keyframes = _shake_rules(nested, words, font_faces)
+                keyframes.extend(inner_keyframes)
+                if inner:
+                    kept.append(f"@{keyword} {prelude}{{{''.join(inner)}}}")
+            elif keyword.endswith('keyframes'):
+                keyframes.append((prelude, f"@{keyword} {prelude}{{{_compact(tinycss2.serialize(rule.content))}}}"))
+            elif keyword == 'font-face':
+                if font_faces:
+                    kept.append(f"@font-face{{{_compact(tinycss2.serialize(rule.content))}}}")
+            elif keyword != 'charset':
+                kept.append(_compact(rule.serialize()))
+    return kept, keyframes
+
+def shake(css, words, font_faces=True):
+    """The rules of a stylesheet that the content words can match, serialized
+
+    Keyframes stay when a kept rule refers to them, font faces only with
+    font_faces, the browser downloads a font when a glyph of it is shown.
+    """
+    import tinycss2
+
+    rules = tinycss2.parse_stylesheet(css, skip_comments=True, skip_whitespace=True)
+    kept, keyframes = _shake_rules(rules, words, font_faces)
+    used = set(KEYFRAMES_NAME.findall(''.join(kept)))
+    kept.extend(serialized for name, serialized in keyframes if name in used)
+    # Serializing unescapes the icon code points, escape them again so the
+    # stylesheet is ASCII whatever charset it is read with
+    return NON_ASCII.sub(lambda match: f'\\{ord(match.group()):x} ', '\n'.join(kept))
+
+def rebase_urls(css, source, target):
+    """Rewrite the relative url()s of a stylesheet moved from source to target
+
+    Both are paths relative to the static dirs, with target None the urls
+    become absolute STATIC_URL ones, for a stylesheet inlined in a page.
+    """
+    source_dir = os.path.dirname(source)
+
+    def rebase(match):
+        url = match.group(2).strip()
+        if url.startswith(('data:', '/', '#')) or '://' in url:
+            return match.group(0)
+        path = os.path.normpath(os.path.join(source_dir, url)).replace(os.sep, '/')
+        if target is None:
+            return f'url("{settings.STATIC_URL}{path}")'
+        return f'url("{os.path.relpath(path, os.path.dirname(target))}")'.replace(os.sep, '/')
+
+    return URL.sub(rebase, css)
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+def build_bundle(name, base_dir, static_dir):
+    """Tree-shake a bundle, returns {path relative to static_dir: css}"""
+    bundle = BUNDLES[name]
+    page = ''.join(_read(os.path.join(base_dir, path)) for path in bundle['content'])
+    scripts = ''.join(_read(os.path.join(static_dir, path)) for path in bundle['scripts'])
+    above_fold = page.split(FOLD_MARKER)[0]
+
+    outputs = {}
+    for critical, sources, words in (
+        (True, bundle['critical'], content_words(above_fold if bundle['deferred'] else page)),
+        (False, bundle['deferred'], content_words(page + scripts)),
+    ):
+        if not sources:
+            continue
+        target = build_path(name, critical)
+        outputs[target] = '\n'.join(
+            shake(
+                rebase_urls(_read(os.path.join(static_dir, source)), source, None if critical else target),
+                words,
+                font_faces=not critical,
+            )
+            for source in sources
+        ) + '\n'
+    return outputs
+
+def _critical_css(name):
+    if name in _critical_cache and not settings.DEBUG:
+        return _critical_cache[name]
+    path = finders.find(build_path(name, critical=True))
+    css = _read(path) if path else None
+    _critical_cache[name] = css
+    return css
+
+def stylesheet_tags(name):
+    """The <style> and <link> tags of a bundle, for the <head> of its page"""
+    bundle = BUNDLES[name]
+    critical = _critical_css(name)
+    if critical is None:
+        logger.debug(f"Bundle {name} is not built, linking the full stylesheets")
+        sources = list(dict.fromkeys(bundle['deferred'] + bundle['critical']))
+        return format_html_join('\n', '<link rel="stylesheet" href="{}">', ((static(path),) for path in sources))
+
+    tags = format_html('<style>{}</style>', mark_safe(critical))
+    if bundle['deferred']:
+        url = static(build_path(name))
+        tags += format_html(
+            '\n<link rel="preload" href="{0}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+            '\n<noscript><link rel="stylesheet" href="{0}"></noscript>',
+            url,
+        )
+    return tags
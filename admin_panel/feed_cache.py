@@ -0,0 +1,97 @@
+"""
+Caching of the public index feed.
+
+Two namespace versions (core/cache.py) version the cached feed:
+
+- feed version, bumped by the ingest path when a message is saved and by the
+  message processor when a batch was enriched (reposts get collapsed)
+- catalog version, bumped when a category, channel or session changes, these
+  names are shown in the category bar and on every message card, the bot
+  memoizes its category lists under the same namespace
+
+The full page of anonymous visitors is cached per filter parameters and both
+versions. The category bar fragment is cached per catalog version and every
+message card per message id, updated_at, repost count and catalog version,
+so a new message renders one card and reuses the others. Old entries are not
+deleted, a bump only stops them from being read and they expire. The async
+index view reads and stores the page with aget_page() and aset_page().
+"""
+import logging
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.cache import namespace_version, bump_namespace
+
+logger = logging.getLogger('feed_cache')
+
+FEED_NAMESPACE = 'feed'
+CATALOG_NAMESPACE = 'catalog'
+PAGE_PARAMETERS = ('category', 'session', 'count', 'duplicates')
+
+def feed_version():
+    return namespace_version(FEED_NAMESPACE)
+
+def catalog_version():
+    return namespace_version(CATALOG_NAMESPACE)
+
+def bump_feed_version():
+    """Called by the ingest path after a message was saved"""
+    bump_namespace(FEED_NAMESPACE)
+
+def bump_catalog_version(**kwargs):
+    """Receiver for changes of categories, channels and sessions"""
+    bump_namespace(CATALOG_NAMESPACE)
+
+def page_cache_key(request):
+    """Key of the cached index page, None when the page must not come from the cache"""
+    if request.method != 'GET' or request.user.is_authenticated:
+        return None
+    if any(name not in PAGE_PARAMETERS for name in request.GET):
+        return None
+    parameters = '&'.join(f"{name}={request.GET.get(name, '')}" for name in PAGE_PARAMETERS)
+    digest = hashlib.md5(parameters.encode('utf-8')).hexdigest()
+    return f'feed:page:{feed_version()}:{catalog_version()}:{digest}'
+
+def get_page(key):
+    if not key:
+        return None
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.error(f"Error reading the cached index page: {e}")
+        return None
+
+def set_page(key, content):
+    if not key:
+        return
+    try:
+        cache.set(key, content, settings.FEED_PAGE_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Error caching the index page: {e}")
+
+async def aget_page(key):
+    if not key:
+        return None
+    try:
+        return await cache.aget(key)
+    except Exception as e:
+        logger.error(f"Error reading the cached index page: {e}")
+        return None
+
+async def aset_page(key, content):
+    if not key:
+        return
+    try:
+        await cache.aset(key, content, settings.FEED_PAGE_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Error caching the index page: {e}")
+
+def connect_signals():
+    from django.db.models.signals import post_save, post_delete
+    from admin_panel.models import Category, Channel, TelegramSession
+
+    for model in (Category, Channel, TelegramSession):
+        post_save.connect(bump_catalog_version, sender=model, dispatch_uid=f'feed_catalog_save_{model.__name__}')
+        post_delete.connect(bump_catalog_version, sender=model, dispatch_uid=f'feed_catalog_delete_{model.__name__}')
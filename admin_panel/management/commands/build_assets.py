@@ -0,0 +1,23 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from admin_panel import assets
+
+class Command(BaseCommand):
+    help = 'Tree-shake the vendored stylesheets of the public pages into static/build, run before collectstatic'
+
+    def add_arguments(self, parser):
+        parser.add_argument('bundles', nargs='*', help='Bundles to build, all by default')
+
+    def handle(self, *args, **options):
+        static_dir = settings.STATICFILES_DIRS[0]
+        for name in options['bundles'] or assets.BUNDLES:
+            for path, css in assets.build_bundle(name, settings.BASE_DIR, static_dir).items():
+                target = os.path.join(static_dir, path)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, 'w', encoding='utf-8') as f:
+                    f.write(css)
+                self.stdout.write(f"{path}: {len(css.encode()) // 1024} KB")
+        self.stdout.write(self.style.SUCCESS('Assets built'))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0002_subscription'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='channel',
+            name='session_auto',
+            field=models.BooleanField(default=False, help_text='Session was assigned by the load balancer and may be moved'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0003_channel_session_auto'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='telegramsession',
+            name='flood_wait_until',
+            field=models.DateTimeField(blank=True, help_text="The parser doesn't use this session until this time (FloodWait)", null=True),
+        ),
+        migrations.AddField(
+            model_name='telegramsession',
+            name='join_flood_wait_until',
+            field=models.DateTimeField(blank=True, help_text="The parser doesn't join channels with this session until this time", null=True),
+        ),
+    ]
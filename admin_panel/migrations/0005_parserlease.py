@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0004_telegramsession_flood_wait'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParserLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('owner', models.CharField(help_text='host:pid of the process holding the lease', max_length=255)),
+                ('acquired_at', models.DateTimeField()),
+                ('heartbeat_at', models.DateTimeField()),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Parser lease',
+                'verbose_name_plural': 'Parser leases',
+                'ordering': ['name'],
+            },
+        ),
+    ]
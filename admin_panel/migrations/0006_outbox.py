@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0005_parserlease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxOffset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('consumer', models.CharField(max_length=100, unique=True)),
+                ('position', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Outbox offset',
+                'verbose_name_plural': 'Outbox offsets',
+            },
+        ),
+        migrations.CreateModel(
+            name='OutboxRecord',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('category_id', models.IntegerField(blank=True, null=True)),
+                ('payload', models.JSONField(help_text='message_info of the parsed message')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('message', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='outbox_records', to='admin_panel.message')),
+            ],
+            options={
+                'verbose_name': 'Outbox record',
+                'verbose_name_plural': 'Outbox records',
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0006_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='hashtags',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='language',
+            field=models.CharField(blank=True, db_index=True, max_length=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='links',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='mentions',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0007_message_enrichment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MessageEntity',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('hashtag', 'Hashtag'), ('mention', 'Mention'), ('url', 'URL')], max_length=10)),
+                ('value', models.CharField(help_text='Lowercase tag or username without # / @, or the URL', max_length=512)),
+                ('domain', models.CharField(blank=True, default='', help_text='Host of a URL without www.', max_length=255)),
+                ('message', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entities', to='admin_panel.message')),
+            ],
+            options={
+                'verbose_name': 'Message entity',
+                'verbose_name_plural': 'Message entities',
+                'indexes': [models.Index(fields=['kind', 'value', 'message'], name='message_entity_value_idx'), models.Index(fields=['domain', 'message'], name='message_entity_domain_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='messageentity',
+            constraint=models.UniqueConstraint(fields=('message', 'kind', 'value'), name='unique_message_entity'),
+        ),
+    ]
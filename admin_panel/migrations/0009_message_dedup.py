@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0008_message_entity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='duplicate_count',
+            field=models.PositiveIntegerField(default=0, help_text='Reposts linked to this message'),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, help_text='Earlier message with the same content, the feed shows only that one', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='admin_panel.message'),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='media_hash',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='minhash',
+            field=models.BinaryField(blank=True, help_text='MinHash signature of the word shingles of the text', null=True),
+        ),
+    ]
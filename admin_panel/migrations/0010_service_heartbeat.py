@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0009_message_dedup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceHeartbeat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('kind', models.CharField(choices=[('parser', 'Parser'), ('bot', 'Bot'), ('processor', 'Message processor')], max_length=20)),
+                ('state', models.CharField(default='running', max_length=20)),
+                ('host', models.CharField(blank=True, default='', max_length=255)),
+                ('pid', models.IntegerField(blank=True, null=True)),
+                ('started_at', models.DateTimeField()),
+                ('heartbeat_at', models.DateTimeField()),
+                ('interval', models.PositiveIntegerField(default=15, help_text='Seconds between heartbeats')),
+                ('cycle_seconds', models.FloatField(blank=True, help_text='Average duration of one unit of work since the previous heartbeat', null=True)),
+                ('channels_polled', models.PositiveIntegerField(default=0, help_text='Since the previous heartbeat')),
+                ('messages_ingested', models.PositiveBigIntegerField(default=0, help_text='Since the process started')),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('last_error_at', models.DateTimeField(blank=True, null=True)),
+                ('details', models.JSONField(blank=True, default=dict, help_text='Per-session state and other service specific data')),
+            ],
+            options={
+                'verbose_name': 'Service heartbeat',
+                'verbose_name_plural': 'Service heartbeats',
+                'ordering': ['kind', 'name'],
+            },
+        ),
+    ]
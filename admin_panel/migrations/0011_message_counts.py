@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0010_service_heartbeat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HourlyMessageCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(unique=True)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Hourly message count',
+                'verbose_name_plural': 'Hourly message counts',
+                'ordering': ['hour'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MessageCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('category', models.ForeignKey(blank=True, help_text='Category of the channel when the messages were ingested', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='message_counts', to='admin_panel.category')),
+                ('channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='message_counts', to='admin_panel.channel')),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='message_counts', to='admin_panel.telegramsession')),
+            ],
+            options={
+                'verbose_name': 'Message count',
+                'verbose_name_plural': 'Message counts',
+                'indexes': [models.Index(fields=['day', 'channel'], name='message_count_day_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:36
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0011_message_counts'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='message',
+            name='hashtags',
+        ),
+        migrations.RemoveField(
+            model_name='message',
+            name='links',
+        ),
+        migrations.RemoveField(
+            model_name='message',
+            name='mentions',
+        ),
+    ]
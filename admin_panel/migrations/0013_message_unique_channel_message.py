@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:48
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def delete_repeated_messages(apps, schema_editor):
+    """Keep the first copy of every post that was saved more than once"""
+    Message = apps.get_model('admin_panel', 'Message')
+    repeated = (
+        Message.objects.values('channel_id', 'telegram_message_id')
+        .annotate(copies=Count('id'), first_id=Min('id'))
+        .filter(copies__gt=1)
+    )
+    for row in repeated:
+        Message.objects.filter(
+            channel_id=row['channel_id'], telegram_message_id=row['telegram_message_id'],
+        ).exclude(id=row['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0012_message_entities_only'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_repeated_messages, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='message',
+            constraint=models.UniqueConstraint(fields=('channel', 'telegram_message_id'), name='unique_channel_message'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0013_message_unique_channel_message'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='serviceheartbeat',
+            name='kind',
+            field=models.CharField(choices=[('parser', 'Parser'), ('bot', 'Bot'), ('processor', 'Message processor'), ('delivery', 'Delivery')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-19 05:59
+
+from django.db import migrations, models
+import django.db.models.functions.comparison
+from django.db.models import Count, Min, Sum
+
+
+def merge_repeated_counts(apps, schema_editor):
+    """Fold the rows that concurrent processors created for the same counter into one"""
+    MessageCount = apps.get_model('admin_panel', 'MessageCount')
+    repeated = (
+        MessageCount.objects.values('day', 'channel_id', 'category_id', 'session_id')
+        .annotate(copies=Count('id'), first_id=Min('id'), total=Sum('count'))
+        .filter(copies__gt=1)
+        .order_by()
+    )
+    for row in repeated:
+        MessageCount.objects.filter(
+            day=row['day'], channel_id=row['channel_id'], category_id=row['category_id'], session_id=row['session_id'],
+        ).exclude(id=row['first_id']).delete()
+        MessageCount.objects.filter(id=row['first_id']).update(count=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_panel', '0014_delivery_heartbeat'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_repeated_counts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='messagecount',
+            constraint=models.UniqueConstraint(models.F('day'), models.F('channel'), django.db.models.functions.comparison.Coalesce('category', models.Value(0)), django.db.models.functions.comparison.Coalesce('session', models.Value(0)), name='unique_message_count'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
 import os
 from django.conf import settings
@@ -26,6 +27,7 @@ class Channel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     session = models.ForeignKey('TelegramSession', on_delete=models.SET_NULL, null=True, blank=True)
+    session_auto = models.BooleanField(default=False, help_text="Session was assigned by the load balancer and may be moved")
     
     class Meta:
         verbose_name = 'Channel'
@@ -53,6 +55,8 @@ class TelegramSession(models.Model):
     phone_code_hash = models.CharField(max_length=255, blank=True, null=True)
     needs_auth = models.BooleanField(default=True, help_text="Indicates if this session needs to be authorized")
     session_file = models.CharField(max_length=255, blank=True, null=True)
+    flood_wait_until = models.DateTimeField(blank=True, null=True, help_text="The parser doesn't use this session until this time (FloodWait)")
+    join_flood_wait_until = models.DateTimeField(blank=True, null=True, help_text="The parser doesn't join channels with this session until this time")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -96,6 +100,16 @@ class Message(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     session_used = models.ForeignKey(TelegramSession, on_delete=models.SET_NULL, null=True, blank=True, related_name='messages')
+    # filled in by the message processor after ingest, the hashtags, mentions
+    # and links are in MessageEntity
+    language = models.CharField(max_length=8, null=True, blank=True, db_index=True)
+    enriched_at = models.DateTimeField(null=True, blank=True)
+    # near-duplicate detection, see tg_bot/dedup.py
+    minhash = models.BinaryField(null=True, blank=True, help_text="MinHash signature of the word shingles of the text")
+    media_hash = models.CharField(max_length=40, blank=True, default='', db_index=True)
+    duplicate_of = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='duplicates',
+                                     help_text="Earlier message with the same content, the feed shows only that one")
+    duplicate_count = models.PositiveIntegerField(default=0, help_text="Reposts linked to this message")
     
     def __str__(self):
         return f"{self.telegram_message_id} - {self.text[:10]}"
@@ -120,6 +134,28 @@ class Message(models.Model):
         verbose_name = 'Message'
         verbose_name_plural = 'Messages'
         ordering = ['created_at']
+        constraints = [
+            # a post polled again after a restart or a shard move is never saved twice
+            models.UniqueConstraint(fields=['channel', 'telegram_message_id'], name='unique_channel_message'),
+        ]
+
+class Subscription(models.Model):
+    """Bot user subscription to the messages of a category"""
+    chat_id = models.BigIntegerField(db_index=True)
+    username = models.CharField(max_length=255, blank=True, null=True)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='subscriptions')
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Subscription'
+        verbose_name_plural = 'Subscriptions'
+        ordering = ['-created_at']
+        unique_together = ('chat_id', 'category')
+    
+    def __str__(self):
+        return f"{self.username or self.chat_id} -> {self.category_id}"
 
 class BotSettings(models.Model):
     """Model for bot settings"""
@@ -181,3 +217,155 @@ class TelegramChannel(models.Model):
     
     def __str__(self):
         return self.title or self.channel_id
+
+class ParserLease(models.Model):
+    """Ownership of a parser shard by one parser process, kept alive by heartbeats"""
+    name = models.CharField(max_length=100, unique=True)
+    owner = models.CharField(max_length=255, help_text="host:pid of the process holding the lease")
+    acquired_at = models.DateTimeField()
+    heartbeat_at = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)
+    
+    class Meta:
+        verbose_name = 'Parser lease'
+        verbose_name_plural = 'Parser leases'
+        ordering = ['name']
+    
+    def __str__(self):
+        return f"{self.name} ({self.owner})"
+
+class OutboxRecord(models.Model):
+    """Parsed message handed from the parser to the downstream stages, the id is the log offset"""
+    id = models.BigAutoField(primary_key=True)
+    message = models.ForeignKey(Message, on_delete=models.SET_NULL, null=True, blank=True, related_name='outbox_records')
+    category_id = models.IntegerField(null=True, blank=True)
+    payload = models.JSONField(help_text="message_info of the parsed message")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    
+    class Meta:
+        verbose_name = 'Outbox record'
+        verbose_name_plural = 'Outbox records'
+        ordering = ['id']
+    
+    def __str__(self):
+        return f"#{self.id} {self.payload.get('channel_name', '')} {self.payload.get('message_id', '')}"
+
+class OutboxOffset(models.Model):
+    """Last outbox record processed by a consumer"""
+    consumer = models.CharField(max_length=100, unique=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Outbox offset'
+        verbose_name_plural = 'Outbox offsets'
+    
+    def __str__(self):
+        return f"{self.consumer}: {self.position}"
+
+class MessageEntity(models.Model):
+    """Normalized hashtag, mention or URL of a message, the index behind tag and domain lookups"""
+    KIND_HASHTAG = 'hashtag'
+    KIND_MENTION = 'mention'
+    KIND_URL = 'url'
+    KIND_CHOICES = [
+        (KIND_HASHTAG, 'Hashtag'),
+        (KIND_MENTION, 'Mention'),
+        (KIND_URL, 'URL'),
+    ]
+    
+    id = models.BigAutoField(primary_key=True)
+    message = models.ForeignKey(Message, on_delete=models.CASCADE, related_name='entities')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    value = models.CharField(max_length=512, help_text="Lowercase tag or username without # / @, or the URL")
+    domain = models.CharField(max_length=255, blank=True, default='', help_text="Host of a URL without www.")
+    
+    class Meta:
+        verbose_name = 'Message entity'
+        verbose_name_plural = 'Message entities'
+        constraints = [
+            models.UniqueConstraint(fields=['message', 'kind', 'value'], name='unique_message_entity'),
+        ]
+        indexes = [
+            models.Index(fields=['kind', 'value', 'message'], name='message_entity_value_idx'),
+            models.Index(fields=['domain', 'message'], name='message_entity_domain_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind}: {self.value}"
+
+class ServiceHeartbeat(models.Model):
+    """Last status a running parser shard, bot, message processor or delivery reported about itself"""
+    KIND_PARSER = 'parser'
+    KIND_BOT = 'bot'
+    KIND_PROCESSOR = 'processor'
+    KIND_DELIVERY = 'delivery'
+    KIND_CHOICES = [
+        (KIND_PARSER, 'Parser'),
+        (KIND_BOT, 'Bot'),
+        (KIND_PROCESSOR, 'Message processor'),
+        (KIND_DELIVERY, 'Delivery'),
+    ]
+    
+    name = models.CharField(max_length=100, unique=True)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    state = models.CharField(max_length=20, default='running')
+    host = models.CharField(max_length=255, blank=True, default='')
+    pid = models.IntegerField(null=True, blank=True)
+    started_at = models.DateTimeField()
+    heartbeat_at = models.DateTimeField()
+    interval = models.PositiveIntegerField(default=15, help_text="Seconds between heartbeats")
+    cycle_seconds = models.FloatField(null=True, blank=True, help_text="Average duration of one unit of work since the previous heartbeat")
+    channels_polled = models.PositiveIntegerField(default=0, help_text="Since the previous heartbeat")
+    messages_ingested = models.PositiveBigIntegerField(default=0, help_text="Since the process started")
+    last_error = models.TextField(blank=True, default='')
+    last_error_at = models.DateTimeField(null=True, blank=True)
+    details = models.JSONField(default=dict, blank=True, help_text="Per-session state and other service specific data")
+    
+    class Meta:
+        verbose_name = 'Service heartbeat'
+        verbose_name_plural = 'Service heartbeats'
+        ordering = ['kind', 'name']
+    
+    def __str__(self):
+        return f"{self.name}: {self.state}"
+
+class MessageCount(models.Model):
+    """Messages ingested per day, channel and session, maintained by the message processor"""
+    day = models.DateField()
+    channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='message_counts')
+    category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True, related_name='message_counts',
+                                 help_text="Category of the channel when the messages were ingested")
+    session = models.ForeignKey(TelegramSession, on_delete=models.SET_NULL, null=True, blank=True, related_name='message_counts')
+    count = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = 'Message count'
+        verbose_name_plural = 'Message counts'
+        indexes = [
+            models.Index(fields=['day', 'channel'], name='message_count_day_idx'),
+        ]
+        constraints = [
+            # NULLs are distinct in a unique index, a missing category or session counts as 0
+            models.UniqueConstraint(
+                models.F('day'), models.F('channel'),
+                Coalesce('category', models.Value(0)), Coalesce('session', models.Value(0)),
+                name='unique_message_count',
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.channel_id}: {self.count}"
+
+class HourlyMessageCount(models.Model):
+    """Messages ingested per hour over all channels, the ingest rate"""
+    hour = models.DateTimeField(unique=True)
+    count = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = 'Hourly message count'
+        verbose_name_plural = 'Hourly message counts'
+        ordering = ['hour']
+    
+    def __str__(self):
+        return f"{self.hour:%Y-%m-%d %H:00}: {self.count}"
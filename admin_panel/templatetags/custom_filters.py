@@ -1,7 +1,14 @@
 from django import template
 
+from admin_panel import assets
+
 register = template.Library()
 
 @register.filter
 def filter_by_category(messages, category_id):
-    return [msg for msg in messages if msg.channel.category.id == category_id]
\ No newline at end of file
+    return [msg for msg in messages if msg.channel.category.id == category_id]
+
+@register.simple_tag
+def stylesheets(bundle):
+    """Inline critical CSS and deferred stylesheet of a bundle, see admin_panel/assets.py"""
+    return assets.stylesheet_tags(bundle)
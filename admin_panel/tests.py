@@ -1,3 +1,769 @@
 from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
 
-# Create your tests here.
+from .models import Category, Channel, Message, TelegramSession
+
+class ListingQueryCountTests(TestCase):
+    """Listings run a fixed number of queries, however many rows they show"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('staff', password='password', is_staff=True)
+        self.client.force_login(self.user)
+        self.rows = 0
+
+    def add_rows(self, count):
+        for _ in range(count):
+            self.rows += 1
+            session = TelegramSession.objects.create(phone=f'+38050000{self.rows:04d}')
+            category = Category.objects.create(name=f'Category {self.rows}', session=session)
+            channel = Channel.objects.create(
+                name=f'channel{self.rows}', url=f'https://t.me/channel{self.rows}',
+                category=category, session=session,
+            )
+            Message.objects.create(
+                text=f'Message {self.rows}', channel=channel, session_used=session,
+                telegram_message_id=self.rows, telegram_channel_id='1',
+                telegram_link=f'https://t.me/channel{self.rows}/{self.rows}',
+            )
+
+    def count_queries(self, call):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            call()
+        return len(queries)
+
+    def assertConstantQueries(self, call):
+        self.add_rows(1)
+        few = self.count_queries(call)
+        self.add_rows(5)
+        many = self.count_queries(call)
+        self.assertEqual(few, many, f"{few} queries for 1 row, {many} for 6 rows")
+
+    def get(self, url):
+        def call():
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+        return call
+
+    def test_categories_list(self):
+        self.assertConstantQueries(self.get('/admin_panel/categories/'))
+
+    def test_categories_standalone(self):
+        self.assertConstantQueries(self.get('/admin_panel/categories/standalone/'))
+
+    def test_channels_list(self):
+        self.assertConstantQueries(self.get('/admin_panel/channels/'))
+
+    def test_sessions_list(self):
+        self.assertConstantQueries(self.get('/admin_panel/sessions/'))
+
+    def test_index_feed(self):
+        from asgiref.sync import async_to_sync
+        from django.test import RequestFactory
+        from django.contrib.auth.models import AnonymousUser
+        from .views import index_view
+
+        def call():
+            request = RequestFactory().get('/', {'count': 10})
+            request.user = AnonymousUser()
+            self.assertEqual(async_to_sync(index_view)(request).status_code, 200)
+        self.assertConstantQueries(call)
+
+    def test_bot_category_list(self):
+        from tg_bot.handlers.common import _get_categories
+
+        def call():
+            categories = _get_categories.uncached()
+            for category in categories:
+                category.channels_count, category.session.phone
+        self.assertConstantQueries(call)
+
+    def test_bot_channel_list(self):
+        from tg_bot.handlers.common import _get_channels
+
+        def call():
+            for channel in _get_channels():
+                channel.category.name, channel.session.phone
+        self.assertConstantQueries(call)
+
+    def test_category_channel_counts(self):
+        from tg_bot.handlers.common import _get_categories
+
+        self.add_rows(2)
+        Channel.objects.create(name='extra', url='https://t.me/extra', category=Category.objects.first())
+        counts = {category.id: category.channels_count for category in _get_categories.uncached()}
+        self.assertEqual(sorted(counts.values()), [1, 2])
+
+class AssetBuildTests(TestCase):
+    """Tree-shaking keeps the rules the markup uses, critical CSS only those above the fold"""
+
+    def test_shake(self):
+        from .assets import content_words, shake
+
+        css = (
+            '.navbar{color:red}.card,.unused{margin:0}.unused:hover{color:blue}'
+            '@media (min-width:992px){.unused{padding:0}}'
+            '.spinner{animation:spin 1s}@keyframes spin{to{transform:rotate(1turn)}}@keyframes bounce{to{top:0}}'
+            '[data-bs-theme=dark]{color:#fff}.fa-robot:before{content:"\\f544"}'
+        )
+        words = content_words('<nav class="navbar"><i class="fa-robot"></i><div class="card spinner">')
+        self.assertEqual(shake(css, words).split('\n'), [
+            '.navbar{color:red}', '.card{margin:0}', '.spinner{animation:spin 1s}',
+            '.fa-robot:before{content:"\\f544 "}', '@keyframes spin{to{transform:rotate(1turn)}}',
+        ])
+
+    def test_index_fold(self):
+        from django.conf import settings
+        from .assets import build_bundle
+
+        outputs = build_bundle('index', settings.BASE_DIR, settings.STATICFILES_DIRS[0])
+        self.assertIn('.hero-section{', outputs['build/index.critical.css'])
+        self.assertNotIn('.message-card{', outputs['build/index.critical.css'])
+        self.assertIn('.message-card{', outputs['build/index.css'])
+        self.assertIn('.fa-robot:before{', outputs['build/index.css'])
+        self.assertIn('url("../vendor/fontawesome/webfonts/fa-solid-900.woff2")', outputs['build/index.css'])
+
+class SessionCandidateTests(TestCase):
+    """A session never falls back to the default session files of another account"""
+
+    def test_default_files_only_for_default_client(self):
+        from unittest import mock
+        from tg_bot.session_pool import SessionPool, DEFAULT_SESSION_FILES
+
+        pool = SessionPool()
+        with mock.patch('tg_bot.session_pool.session_file_to_string', side_effect=lambda name: f'string:{name}'):
+            session = TelegramSession.objects.create(phone='+380500000001')
+            self.assertEqual(pool.candidates(session), [])
+
+            session.session_file = 'sessions/own'
+            self.assertEqual(pool.candidates(session), [('string:sessions/own', 'file')])
+
+            self.assertEqual(
+                pool.candidates(None),
+                [(f'string:{name}', 'file') for name in DEFAULT_SESSION_FILES],
+            )
+
+class ShardAssignmentTests(TestCase):
+    """Unpinned channels only go to shards that own an active session"""
+
+    def test_unpinned_channels_follow_sessions(self):
+        from types import SimpleNamespace
+        from tg_bot.parser_shards import ShardAssignment
+
+        channels = [SimpleNamespace(id=channel_id, session_id=None, session_auto=False) for channel_id in range(1, 201)]
+        for shard_count, session_ids in ((2, [1, 2]), (4, [1, 2]), (4, [1, 2, 3, 4, 5, 6, 7]), (3, [5])):
+            shards = [ShardAssignment(index, shard_count, session_ids) for index in range(shard_count)]
+            with_sessions = {shard.shard_index for shard in shards if any(shard.owns_session(s) for s in session_ids)}
+            for channel in channels:
+                owners = [shard.shard_index for shard in shards if shard.owns_channel(channel)]
+                self.assertEqual(len(owners), 1)
+                self.assertIn(owners[0], with_sessions, f"{shard_count} shards, sessions {session_ids}")
+            # every session gets some of the channels
+            picked = {shards[0].channel_session(channel) for channel in channels}
+            self.assertEqual(picked, set(session_ids))
+
+    def test_pinned_and_no_sessions(self):
+        from types import SimpleNamespace
+        from tg_bot.parser_shards import ShardAssignment
+
+        shard = ShardAssignment(0, 4, [])
+        self.assertEqual(shard.channel_shard(SimpleNamespace(id=7, session_id=None, session_auto=False)), 0)
+        pinned = SimpleNamespace(id=7, session_id=3, session_auto=False)
+        self.assertEqual(shard.channel_shard(pinned), shard.session_shard(3))
+        auto = SimpleNamespace(id=7, session_id=3, session_auto=True)
+        shard.update_sessions([9])
+        self.assertEqual(shard.channel_shard(auto), shard.session_shard(9))
+
+class OutboxConsumerTests(TestCase):
+    """A batch stops at a missing record id until the gap times out"""
+
+    def test_batch_stops_at_gap(self):
+        from tg_bot.outbox import OutboxConsumer
+        from .models import OutboxRecord
+
+        for record_id in (1, 2, 4, 5):
+            OutboxRecord.objects.create(id=record_id, payload={})
+        consumer = OutboxConsumer('test', gap_timeout=60)
+        batch = consumer.read_batch()
+        self.assertEqual([record.id for record in batch], [1, 2])
+        consumer.commit(batch)
+        self.assertEqual(consumer.read_batch(), [])
+
+        # the slow transaction commits
+        OutboxRecord.objects.create(id=3, payload={})
+        self.assertEqual([record.id for record in consumer.read_batch()], [3, 4, 5])
+
+    def test_rolled_back_gap_is_skipped(self):
+        from tg_bot.outbox import OutboxConsumer
+        from .models import OutboxRecord
+
+        for record_id in (1, 3):
+            OutboxRecord.objects.create(id=record_id, payload={})
+        consumer = OutboxConsumer('test', gap_timeout=0)
+        self.assertEqual([record.id for record in consumer.read_batch()], [1, 3])
+
+class SubscriptionIndexTests(TestCase):
+    """Unsubscribing through a bulk update invalidates the delivery index"""
+
+    def test_unsubscribe_all_refreshes_index(self):
+        from tg_bot.delivery import SubscriptionIndex
+        from tg_bot.handlers.subscriptions import _unsubscribe_all
+        from .models import Subscription
+
+        category = Category.objects.create(name='News')
+        Subscription.objects.create(chat_id=42, category=category, is_active=True)
+        index = SubscriptionIndex(refresh_interval=0)
+        index.refresh()
+        self.assertEqual(index.subscribers(category.id), {42})
+
+        _unsubscribe_all(42)
+        self.assertTrue(index.refresh())
+        self.assertEqual(index.subscribers(category.id), frozenset())
+
+class ShardLeaseTests(TestCase):
+    """Leases expire by the database clock"""
+
+    def test_acquire_renew_release(self):
+        from tg_bot.parser_lease import ShardLease
+        from .models import ParserLease
+
+        first = ShardLease(1, ttl=60, owner='first')
+        second = ShardLease(1, ttl=60, owner='second')
+        self.assertEqual(first._acquire(), 0)
+        self.assertIsNone(second._acquire())
+        self.assertTrue(first._renew())
+        lease = ParserLease.objects.get()
+        self.assertGreater(lease.expires_at, lease.heartbeat_at)
+
+        first._release()
+        self.assertFalse(first._renew())
+        self.assertEqual(second._acquire(), 0)
+        self.assertFalse(first._renew())
+
+class DuplicateCollapseTests(TestCase):
+    """Reposts collapse into their canonical message only when it is shown too"""
+
+    def test_collapse_within_filtered_set(self):
+        from tg_bot.dedup import collapse_duplicates
+
+        news = Category.objects.create(name='News')
+        sport = Category.objects.create(name='Sport')
+        first = Channel.objects.create(name='first', url='https://t.me/first', category=news)
+        second = Channel.objects.create(name='second', url='https://t.me/second', category=sport)
+        fields = {'telegram_channel_id': '1', 'telegram_link': 'https://t.me/first/1'}
+        canonical = Message.objects.create(text='Post', channel=first, telegram_message_id='1', **fields)
+        repost = Message.objects.create(text='Post', channel=second, duplicate_of=canonical, telegram_message_id='1', **fields)
+        same_category = Message.objects.create(text='Post', channel=first, duplicate_of=canonical, telegram_message_id='2', **fields)
+
+        self.assertEqual(set(collapse_duplicates(Message.objects.all(), filtered=False)), {canonical})
+        self.assertEqual(set(collapse_duplicates(Message.objects.filter(channel__category=news))), {canonical})
+        self.assertEqual(set(collapse_duplicates(Message.objects.filter(channel__category=sport))), {repost})
+        self.assertNotIn(same_category, collapse_duplicates(Message.objects.all()))
+
+    def test_shared_image_needs_similar_text(self):
+        from tg_bot.dedup import LSHIndex, minhash
+
+        index = LSHIndex(min_similarity=0.6)
+        text = 'the city council approved the new budget for public transport and road repairs today'
+        index.add(1, minhash(text), 'logo', None)
+        other = minhash('a football club signed a new striker from the national team before the season starts')
+        self.assertIsNone(index.find(other, 'logo'))
+        self.assertEqual(index.find(minhash(text), 'logo'), 1)
+        self.assertEqual(index.find(None, 'logo'), 1)
+
+    def test_retried_batch_is_indexed_once(self):
+        from types import SimpleNamespace
+        from django.utils import timezone
+        from tg_bot.dedup import Deduplicator
+
+        deduplicator = Deduplicator()
+        message = SimpleNamespace(
+            id=1, text='the city council approved the new budget for public transport and road repairs today',
+            media='', created_at=timezone.now(), duplicate_of_id=None,
+        )
+        for _ in range(3):
+            self.assertEqual(deduplicator.assign([message]), {})
+        self.assertEqual(len(deduplicator.index), 1)
+        self.assertIsNone(message.duplicate_of_id)
+
+class ChannelImportTests(TestCase):
+    """Links are compared by channel, whatever form they were written in"""
+
+    def test_existing_and_repeated_links(self):
+        from tg_bot.channel_import import _prepare_rows, parse_import_text, STATUS_EXISTS, STATUS_DUPLICATE
+
+        category = Category.objects.create(name='News')
+        existing = Channel.objects.create(name='news', url='t.me/NewsChannel/', category=category)
+        rows = parse_import_text('@newschannel\nhttps://t.me/other_channel/\nt.me/Other_Channel\n')
+        to_import, results = _prepare_rows(rows, category.id)
+
+        self.assertEqual([row['url'] for row in to_import], ['https://t.me/other_channel'])
+        self.assertEqual(
+            sorted((result['line'], result['status'], result['channel_id']) for result in results),
+            [(1, STATUS_EXISTS, existing.id), (3, STATUS_DUPLICATE, None)],
+        )
+
+class PollSchedulerTests(TestCase):
+    """A channel stays scheduled while its poll is running"""
+
+    def test_unreported_poll_is_rescheduled(self):
+        from tg_bot.poll_scheduler import PollScheduler
+
+        scheduler = PollScheduler(default_interval=30, min_interval=10, max_interval=600)
+        scheduler.sync([1], now=1000)
+        self.assertEqual(scheduler.pop_due(now=1000), [1])
+        self.assertEqual(scheduler.pop_due(now=1010), [])
+        # the poll raised before record_poll or defer
+        self.assertEqual(scheduler.pop_due(now=1030), [1])
+
+        scheduler.record_poll(1, has_new_post=True, now=1030)
+        self.assertEqual(scheduler.pop_due(now=1045), [1])
+        # the new post brought the interval down to the minimum
+        self.assertEqual(scheduler.pop_due(now=1050), [])
+        self.assertEqual(scheduler.pop_due(now=1055), [1])
+
+    def test_sessions_are_paced_independently(self):
+        from tg_bot.poll_scheduler import SessionPacer
+
+        pacer = SessionPacer(delay=5)
+        self.assertEqual([pacer.reserve(1, now=100) for _ in range(3)], [0, 5, 10])
+        # another session doesn't wait for the first one
+        self.assertEqual(pacer.reserve(2, now=100), 0)
+        # the delay counts from the last reserved start
+        self.assertEqual(pacer.reserve(1, now=120), 0)
+        self.assertEqual(pacer.reserve(1, now=121), 4)
+
+class MessageSaveTests(TestCase):
+    """A post polled again after a restart is neither saved nor sent twice"""
+
+    def test_save_is_idempotent_and_resumes_from_db(self):
+        from tg_bot.telethon_worker import _save_message_to_db, _get_last_message_id
+        from .models import OutboxRecord
+
+        channel = Channel.objects.create(name='news', url='https://t.me/news', category=Category.objects.create(name='News'))
+        self.assertIsNone(_get_last_message_id(channel))
+
+        for message_id in (9, 10, 10):
+            _save_message_to_db({
+                'text': f'Post {message_id}', 'media': '', 'media_type': None, 'message_id': message_id,
+                'channel_id': 1, 'channel_name': 'news', 'link': f'https://t.me/c/1/{message_id}',
+                'date': '2026-01-01 00:00:00', 'entities': [],
+            })
+        self.assertEqual(Message.objects.count(), 2)
+        self.assertEqual(OutboxRecord.objects.count(), 2)
+        # compared as numbers, not as strings
+        self.assertEqual(_get_last_message_id(channel), 10)
+
+class PollChannelTests(TestCase):
+    """Every post since the last poll is saved, oldest first"""
+
+    def test_saves_every_new_post(self):
+        from asgiref.sync import async_to_sync
+        from tg_bot import telethon_worker
+        from tg_bot.management.commands.benchmark_parser import FakeClient
+        from .models import OutboxRecord
+
+        channel = Channel.objects.create(
+            id=7, name='bench7', url='https://t.me/bench7', category=Category.objects.create(name='News'),
+        )
+        client = FakeClient(latency=0, first_id=100)
+        telethon_worker.telethon_clients['default'] = {'client': client, 'user': None, 'session_id': None, 'session': None}
+        telethon_worker.last_processed_message_ids.clear()
+        self.addCleanup(telethon_worker.telethon_clients.clear)
+        self.addCleanup(telethon_worker.last_processed_message_ids.clear)
+
+        # the first poll starts from the latest post
+        async_to_sync(telethon_worker.poll_channel)(channel, None)
+        self.assertEqual(list(Message.objects.values_list('telegram_message_id', flat=True)), ['100'])
+
+        # three posts before the next poll, and a restart in between
+        client.next_ids[7] = 104
+        telethon_worker.last_processed_message_ids.clear()
+        post_times, has_new_post = async_to_sync(telethon_worker.poll_channel)(channel, None)
+        self.assertTrue(has_new_post)
+        self.assertEqual(
+            list(OutboxRecord.objects.order_by('id').values_list('payload__message_id', flat=True)),
+            [100, 101, 102, 103, 104],
+        )
+
+class DeliveryServiceTests(TestCase):
+    """Delivery moves its own outbox offset after every delivered message"""
+
+    def test_offset_follows_delivered_messages(self):
+        from asgiref.sync import async_to_sync
+        from tg_bot.delivery import DeliveryService
+        from tg_bot.outbox import OutboxConsumer
+        from .models import OutboxRecord, OutboxOffset
+
+        for record_id in (1, 2, 3):
+            OutboxRecord.objects.create(id=record_id, category_id=5, payload={'message_id': record_id})
+
+        class Engine:
+            delivered = []
+
+            async def deliver(self, item):
+                if item['message_info']['message_id'] == 3:
+                    raise RuntimeError('Telegram is down')
+                self.delivered.append(item['message_info']['message_id'])
+
+        service = DeliveryService(token='test')
+        consumer = OutboxConsumer('delivery')
+        with self.assertRaises(RuntimeError):
+            async_to_sync(service._deliver_batch)(consumer, Engine())
+        self.assertEqual(Engine.delivered, [1, 2])
+        self.assertEqual(OutboxOffset.objects.get(consumer='delivery').position, 2)
+        # the message processor has an offset of its own
+        self.assertFalse(OutboxOffset.objects.filter(consumer='message_processor').exists())
+
+    def test_new_consumer_starts_with_the_others(self):
+        from tg_bot.outbox import OutboxConsumer
+        from .models import OutboxOffset
+
+        OutboxOffset.objects.create(consumer='message_processor', position=40)
+        self.assertEqual(OutboxConsumer('delivery').position, 40)
+
+class FanoutEngineTests(TestCase):
+    """Fan-out keeps to the rate limit and uploads the media only once"""
+
+    def test_rate_limit_and_file_id_reuse(self):
+        import asyncio
+        import os
+        import tempfile
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from asgiref.sync import async_to_sync
+        from aiogram.types import FSInputFile
+        from tg_bot.delivery import FanoutEngine
+
+        real_sleep = asyncio.sleep
+
+        class Clock:
+            now = 0.0
+
+            def monotonic(self):
+                return self.now
+
+            async def sleep(self, seconds):
+                # at least a microsecond, a shorter sleep could leave the float unchanged
+                self.now += max(1e-6, seconds)
+                await real_sleep(0)
+
+        clock = Clock()
+
+        class Bot:
+            def __init__(self):
+                self.sent = []
+
+            async def send_photo(self, chat_id, photo, caption=None):
+                self.sent.append((clock.now, chat_id, photo))
+                return SimpleNamespace(photo=[SimpleNamespace(file_id='thumb'), SimpleNamespace(file_id='uploaded')])
+
+        class Index:
+            def refresh(self):
+                return False
+
+            def subscribers(self, category_id):
+                return frozenset(range(1, 26))
+
+        with tempfile.TemporaryDirectory() as media_dir:
+            path = os.path.join(media_dir, 'photo.jpg')
+            with open(path, 'wb') as f:
+                f.write(b'jpeg')
+
+            bot = Bot()
+            with patch('tg_bot.delivery.time', SimpleNamespace(monotonic=clock.monotonic)), \
+                    patch('tg_bot.delivery.asyncio.sleep', clock.sleep):
+                engine = FanoutEngine(bot, Index(), rate=10, batch_size=5, max_seconds=60)
+                async_to_sync(engine.deliver)({
+                    'category_id': 1,
+                    'message_info': {'message_id': 1, 'text': 'Post', 'media': path, 'media_type': 'photo'},
+                })
+
+        self.assertEqual(sorted(chat_id for _, chat_id, _ in bot.sent), list(range(1, 26)))
+        # a burst of 10, then 10 sends a second
+        times = [sent_at for sent_at, _, _ in bot.sent]
+        self.assertEqual(sum(1 for sent_at in times if sent_at == 0), 10)
+        for position, sent_at in enumerate(times):
+            self.assertGreaterEqual(sent_at + 1e-9, (position + 1 - 10) / 10)
+        self.assertAlmostEqual(times[-1], 1.5, places=3)
+        # the first send uploads the file, every next one reuses its file_id
+        self.assertIsInstance(bot.sent[0][2], FSInputFile)
+        self.assertEqual({photo for _, _, photo in bot.sent[1:]}, {'uploaded'})
+        self.assertEqual(engine.file_ids, {})
+
+class CircuitBreakerTests(TestCase):
+    """A failing session is skipped for a jittered backoff, then probed again"""
+
+    def test_open_half_open_closed(self):
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from tg_bot.client_health import CircuitBreaker
+
+        clock = SimpleNamespace(now=1000.0)
+        with patch('tg_bot.client_health.time', SimpleNamespace(time=lambda: clock.now)):
+            breaker = CircuitBreaker()
+            self.assertIsNone(breaker.record_failure())
+            self.assertIsNone(breaker.record_failure())
+            self.assertEqual(breaker.state, 'closed')
+
+            delay = breaker.record_failure()
+            self.assertEqual(breaker.state, 'open')
+            self.assertTrue(30 <= delay <= 45)
+
+            clock.now += delay
+            self.assertEqual(breaker.state, 'half-open')
+            # the probe fails: open again for longer
+            self.assertTrue(30 <= breaker.record_failure() <= 90)
+            self.assertEqual(breaker.state, 'open')
+
+            clock.now += 90
+            self.assertEqual(breaker.state, 'half-open')
+            breaker.record_success()
+            self.assertEqual(breaker.state, 'closed')
+            self.assertEqual(breaker.opened, 0)
+
+    def test_backoff_stays_in_range(self):
+        from unittest.mock import patch
+        from tg_bot.client_health import CircuitBreaker
+
+        for jitter in (lambda low, high: low, lambda low, high: high):
+            with patch('tg_bot.client_health.random.uniform', side_effect=jitter):
+                breaker = CircuitBreaker()
+                delays = [breaker.record_failure() for _ in range(20)][2:]
+            self.assertTrue(all(30 <= delay <= 1800 for delay in delays), delays)
+        self.assertEqual(delays[-1], 1800)
+
+class SessionCooldownTests(TestCase):
+    """A FloodWait pauses only its own session and is kept in the DB"""
+
+    def test_flood_wait_reroutes_and_persists(self):
+        import time
+        from types import SimpleNamespace
+        from asgiref.sync import async_to_sync
+        from tg_bot import telethon_worker
+        from tg_bot.session_cooldown import CooldownRegistry, cooldowns, start_cooldown, SCOPE_JOIN
+
+        flooded = TelegramSession.objects.create(phone='+380500000001')
+        healthy = TelegramSession.objects.create(phone='+380500000002')
+        for session in (flooded, healthy):
+            telethon_worker.telethon_clients[str(session.id)] = {'client': None, 'session_id': session.id}
+        self.addCleanup(telethon_worker.telethon_clients.clear)
+        self.addCleanup(cooldowns._until.clear)
+
+        public = SimpleNamespace(id=1, name='public', url='https://t.me/public', session_id=flooded.id)
+        private = SimpleNamespace(id=2, name='private', url='https://t.me/+invite', session_id=flooded.id)
+        self.assertEqual(telethon_worker.select_client(public)['session_id'], flooded.id)
+
+        async_to_sync(start_cooldown)(flooded.id, 300)
+        self.assertEqual(telethon_worker.select_client(public)['session_id'], healthy.id)
+        self.assertIsNone(telethon_worker.select_client(private))
+        flooded.refresh_from_db()
+        self.assertAlmostEqual(flooded.flood_wait_until.timestamp(), time.time() + 300, delta=5)
+        self.assertIsNone(flooded.join_flood_wait_until)
+
+        # a join flood only stops joins, the session keeps polling
+        async_to_sync(start_cooldown)(healthy.id, 60, SCOPE_JOIN)
+        healthy.refresh_from_db()
+        self.assertIsNone(healthy.flood_wait_until)
+        self.assertAlmostEqual(healthy.join_flood_wait_until.timestamp(), time.time() + 60, delta=5)
+        self.assertEqual(telethon_worker.select_client(public)['session_id'], healthy.id)
+
+        # a restarted parser picks both cooldowns up again
+        registry = CooldownRegistry()
+        self.assertEqual(registry.load(), 2)
+        self.assertTrue(registry.is_cooling(flooded.id))
+        self.assertFalse(registry.is_cooling(healthy.id))
+        self.assertTrue(registry.is_cooling(healthy.id, SCOPE_JOIN))
+
+class SessionBalancerTests(TestCase):
+    """Channels are spread by load / capacity, hand-picked sessions stay"""
+
+    def test_load_is_spread(self):
+        from collections import Counter
+        from tg_bot.session_balancer import plan_assignments
+
+        weights = {channel_id: 1.0 for channel_id in range(12)}
+        plan = plan_assignments(weights, {}, {1: 1.0, 2: 1.0, 3: 1.0})
+        self.assertEqual(Counter(plan.values()), {1: 4, 2: 4, 3: 4})
+
+        # a session slowed down by FloodWaits gets less, pinned load counts too
+        plan = plan_assignments(weights, {}, {1: 1.0, 2: 0.5}, {1: 3.0})
+        self.assertEqual(Counter(plan.values()), {1: 7, 2: 5})
+
+    def test_stickiness(self):
+        from tg_bot.session_balancer import plan_assignments
+
+        # 10% more load is not worth a move
+        self.assertEqual(plan_assignments({7: 1.0}, {7: 2}, {1: 1.0, 2: 1.0}, {2: 0.1}), {7: 2})
+        self.assertEqual(plan_assignments({7: 1.0}, {}, {1: 1.0, 2: 1.0}, {2: 0.1}), {7: 1})
+        # a bigger gain is
+        self.assertEqual(plan_assignments({7: 1.0}, {7: 2}, {1: 1.0, 2: 1.0}, {2: 0.5}), {7: 1})
+
+    def test_hand_picked_sessions_are_never_moved(self):
+        from tg_bot.session_balancer import rebalance
+
+        category = Category.objects.create(name='News')
+        busy = TelegramSession.objects.create(phone='+380500000001')
+        idle = TelegramSession.objects.create(phone='+380500000002')
+        pinned = [
+            Channel.objects.create(name=f'pinned{i}', url=f'https://t.me/pinned{i}', category=category, session=busy)
+            for i in range(3)
+        ]
+        free = [
+            Channel.objects.create(name=f'free{i}', url=f'https://t.me/free{i}', category=category)
+            for i in range(3)
+        ]
+
+        self.assertEqual(rebalance([busy.id, idle.id]), 3)
+        for channel in pinned:
+            channel.refresh_from_db()
+            self.assertEqual((channel.session_id, channel.session_auto), (busy.id, False))
+        # the pinned channels load the busy session, the rest go to the idle one
+        for channel in free:
+            channel.refresh_from_db()
+            self.assertEqual((channel.session_id, channel.session_auto), (idle.id, True))
+
+        # still not moved when their session is gone
+        self.assertEqual(rebalance([idle.id]), 0)
+        self.assertEqual(Channel.objects.filter(session=busy, session_auto=False).count(), 3)
+
+class EntityIndexTests(TestCase):
+    """Hashtags, mentions and links come from Telethon entities and are looked up by index"""
+
+    def test_entities_from_message(self):
+        from telethon.tl.types import (
+            Message as TelethonMessage, PeerChannel, MessageEntityHashtag, MessageEntityMention,
+            MessageEntityUrl, MessageEntityTextUrl, MessageEntityMentionName,
+        )
+        from tg_bot.entity_index import entities_from_message
+
+        parts = ['🔥 ', '#News', ' from ', '@Channel_X', ' at ', 'Example.com/a?b=1#top', ', ', 'read more', ' by ', 'Ivan']
+        kinds = [
+            None, MessageEntityHashtag, None, MessageEntityMention, None, MessageEntityUrl, None,
+            lambda offset, length: MessageEntityTextUrl(offset, length, url='https://WWW.Example.com/full'),
+            None, lambda offset, length: MessageEntityMentionName(offset, length, user_id=42),
+        ]
+        entities = []
+        offset = 0
+        for part, kind in zip(parts, kinds):
+            # entity offsets count UTF-16 code units, the emoji takes two
+            length = len(part.encode('utf-16-le')) // 2
+            if kind:
+                entities.append(kind(offset, length))
+            offset += length
+        message = TelethonMessage(id=1, peer_id=PeerChannel(1), date=None, message=''.join(parts), entities=entities)
+
+        self.assertEqual(entities_from_message(message), [
+            ['hashtag', 'news'],
+            ['mention', 'channel_x'],
+            ['url', 'https://example.com/a?b=1'],
+            # the hidden target of a text link, not its text
+            ['url', 'https://www.example.com/full'],
+            ['mention', 'id42'],
+        ])
+
+    def test_normalize_url(self):
+        from tg_bot.entity_index import normalize_url, url_domain
+
+        self.assertEqual(normalize_url('Example.COM/Path?Q=1'), 'https://example.com/Path?Q=1')
+        self.assertEqual(normalize_url('HTTP://Example.com/a#anchor'), 'http://example.com/a')
+        self.assertEqual(normalize_url('https://example.com/a).'), 'https://example.com/a')
+        self.assertEqual(url_domain('https://www.Example.com/a'), 'example.com')
+
+    def test_messages_linking_domain(self):
+        from tg_bot.entity_index import index_message, messages_linking_domain, messages_linking_url
+
+        channel = Channel.objects.create(name='news', url='https://t.me/news', category=Category.objects.create(name='News'))
+        fields = {'channel': channel, 'telegram_channel_id': '1', 'telegram_link': 'https://t.me/news/1'}
+        linking = Message.objects.create(text='See example.com', telegram_message_id='1', **fields)
+        subdomain = Message.objects.create(text='See https://blog.example.com/post', telegram_message_id='2', **fields)
+        Message.objects.create(text='No links', telegram_message_id='3', **fields)
+        index_message(linking, [['url', 'https://www.example.com/a'], ['url', 'https://www.example.com/a']])
+        index_message(subdomain)
+
+        self.assertEqual(list(messages_linking_domain('WWW.Example.com')), [linking])
+        self.assertEqual(list(messages_linking_domain('blog.example.com')), [subdomain])
+        self.assertEqual(list(messages_linking_url('www.example.com/a')), [linking])
+        self.assertEqual(linking.entities.count(), 1)
+
+class MessageStatsTests(TestCase):
+    """Counters keep one row per day, channel, category and session"""
+
+    def test_replayed_batch_and_rebuild(self):
+        from django.db import IntegrityError, transaction
+        from django.utils import timezone
+        from tg_bot import message_stats
+        from .models import OutboxRecord, MessageCount
+
+        category = Category.objects.create(name='News')
+        session = TelegramSession.objects.create(phone='+380500000001')
+        first = Channel.objects.create(name='first', url='https://t.me/first', category=category)
+        second = Channel.objects.create(name='second', url='https://t.me/second', category=category)
+        records = []
+        for number, (channel, used) in enumerate([(first, None), (first, None), (first, session), (second, None)], 1):
+            message = Message.objects.create(
+                text='Post', channel=channel, session_used=used, telegram_message_id=str(number),
+                telegram_channel_id='1', telegram_link=f'https://t.me/{channel.name}/{number}',
+            )
+            records.append(OutboxRecord.objects.create(message=message, category_id=category.id, payload={}))
+
+        def snapshot():
+            return message_stats.totals()['messages'], message_stats.by_channel(), message_stats.by_session()
+
+        self.assertEqual(message_stats.record_batch(records), 4)
+        counted = snapshot()
+        self.assertEqual(counted[0], 4)
+        self.assertEqual(MessageCount.objects.count(), 3)
+
+        # a batch retried after its offset failed to commit updates the same rows
+        message_stats.record_batch(records)
+        self.assertEqual(MessageCount.objects.count(), 3)
+        self.assertEqual(message_stats.totals()['messages'], 8)
+
+        self.assertEqual(message_stats.rebuild(), 4)
+        self.assertEqual(snapshot(), counted)
+
+        # no second row for the same counter, even without a session
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            MessageCount.objects.create(day=timezone.now().date(), channel=second, category=category, count=1)
+
+class FeedCacheTests(TestCase):
+    """A cached index page is not read again once the feed or the catalog changed"""
+
+    def test_page_key_follows_versions(self):
+        from django.contrib.auth.models import AnonymousUser
+        from django.test import RequestFactory
+        from .feed_cache import page_cache_key, bump_feed_version
+
+        def key(path='/?category=1'):
+            request = RequestFactory().get(path)
+            request.user = AnonymousUser()
+            return page_cache_key(request)
+
+        category = Category.objects.create(name='News')
+        channel = Channel.objects.create(name='news', url='https://t.me/news', category=category)
+        first = key()
+        self.assertEqual(key(), first)
+        self.assertNotEqual(key('/?category=2'), first)
+
+        bump_feed_version()
+        after_feed = key()
+        self.assertNotEqual(after_feed, first)
+
+        category.name = 'World news'
+        category.save()
+        after_category = key()
+        self.assertNotEqual(after_category, after_feed)
+
+        channel.save()
+        self.assertNotIn(key(), (first, after_feed, after_category))
+
+        # pages of logged-in users and unknown parameters are never cached
+        self.assertIsNone(key('/?page=2'))
+        request = RequestFactory().get('/')
+        request.user = User.objects.create_user('admin')
+        self.assertIsNone(page_cache_key(request))
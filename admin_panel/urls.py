@@ -6,13 +6,15 @@ from .views import (
     channels_list_view, channel_create_view, channel_detail_view, channel_update_view, channel_delete_view,
     messages_list_view, message_detail_view, message_delete_view,
     sessions_list_view, session_create_view, session_update_view, session_delete_view,
-    authorize_session_view, register_view, bot_settings_view, run_migrations_view, auth_help_view
+    authorize_session_view, register_view, bot_settings_view, run_migrations_view, auth_help_view,
+    stats_api_view
 )
 
 app_name = 'admin_panel'
 
 urlpatterns = [
     path('', admin_panel_view, name='admin_panel'),
+    path('stats/', stats_api_view, name='stats_api'),
     path('login/', login_view, name='login'),
     path('register/', register_view, name='register'),
     path('logout/', logout_view, name='logout'),
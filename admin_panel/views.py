@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login, authenticate, logout
@@ -6,7 +7,9 @@ from django.contrib import messages
 from django.contrib.auth.forms import AuthenticationForm
 from .models import Category, Message, Channel, TelegramSession, BotSettings
 from .forms import ChannelForm, CategoryForm, MessageForm, UserRegistrationForm
-from django.http import HttpResponse
+from . import feed_cache
+from .assets import stylesheet_tags
+from django.http import HttpResponse, JsonResponse
 import logging
 import traceback
 import os
@@ -14,6 +17,7 @@ from django.conf import settings
 import time
 from urllib.parse import quote_plus
 from django.db import connection, ProgrammingError, OperationalError
+from django.db.models import Count
 from django.core.exceptions import FieldError
 from django.db.utils import DatabaseError
 
@@ -46,21 +50,58 @@ def safe_db_query(func):
     
     return wrapper
 
-def index_view(request):
-    """Головна сторінка сайту"""
+def _latest_messages_raw(count):
+    """Останні повідомлення сирим SQL, коли ORM-запит не вдався"""
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT m.id, m.text, m.media, m.telegram_message_id, m.created_at
+            FROM admin_panel_message m
+            ORDER BY m.created_at DESC
+            LIMIT %s
+        """, [count])
+        
+        columns = ['id', 'text', 'media', 'telegram_message_id', 'created_at']
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+def _active_sessions_raw():
+    """Активні сесії сирим SQL, коли ORM-запит не вдався"""
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT id, phone, is_active
+            FROM admin_panel_telegramsession
+            WHERE is_active = TRUE
+            ORDER BY phone
+        """)
+        columns = ['id', 'phone', 'is_active']
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+def _render_index(request, context):
+    """Рендер стрічки, виконується в потоці: панель категорій і сесії завантажуються ліниво під час рендеру"""
+    context['catalog_version'] = feed_cache.catalog_version()
+    return render(request, 'admin_panel/index.html', context)
+
+async def index_view(request):
+    """Головна сторінка сайту, асинхронна: повідомлення читаються асинхронним ORM"""
+    from tg_bot.dedup import collapse_duplicates
     try:
         # Логуємо початок виконання
         logger.info("Початок виконання index_view")
         
+        # Анонімні відвідувачі отримують сторінку з кешу, доки стрічка не змінилась
+        page_key = await sync_to_async(feed_cache.page_cache_key)(request)
+        cached_page = await feed_cache.aget_page(page_key)
+        if cached_page is not None:
+            return HttpResponse(cached_page)
+        
         # Отримуємо параметри фільтрації
         category_id = request.GET.get('category')
         count = int(request.GET.get('count', 5))
         session_filter = request.GET.get('session')
+        show_duplicates = request.GET.get('duplicates') == '1'
         
-        # Завантажуємо категорії
+        # Завантажуємо категорії, запит виконується лише коли панель категорій не в кеші
         try:
-            categories = Category.objects.all()
-            logger.info(f"Завантажено {len(categories)} категорій")
+            categories = Category.objects.select_related('session')
         except Exception as e:
             categories = []
             logger.error(f"Помилка завантаження категорій: {str(e)}")
@@ -70,13 +111,15 @@ def index_view(request):
             # Use a safer approach with raw SQL to avoid field errors
             messages_query = []
             try:
-                messages_query = Message.objects.select_related('channel', 'session_used', 'channel__session').order_by('-created_at')
+                messages_query = Message.objects.select_related('channel__category', 'channel__session', 'session_used').order_by('-created_at')
+                filtered = False
                 
                 # Фільтруємо за категорією, якщо вона вказана
                 if category_id and category_id != 'None' and category_id != 'undefined':
                     try:
                         category_id = int(category_id)
                         messages_query = messages_query.filter(channel__category_id=category_id)
+                        filtered = True
                     except (ValueError, TypeError):
                         pass
                 
@@ -85,26 +128,22 @@ def index_view(request):
                     try:
                         session_id = int(session_filter)
                         messages_query = messages_query.filter(session_used_id=session_id)
+                        filtered = True
                     except (ValueError, TypeError):
                         pass
                 
+                # Репости згорнуті до першого повідомлення, якщо воно теж у відфільтрованій стрічці
+                if not show_duplicates:
+                    messages_query = collapse_duplicates(messages_query, filtered)
+                
                 # Обмежуємо кількість повідомлень
-                messages_list = messages_query[:count]
+                messages_list = [message async for message in messages_query[:count]]
             except Exception as e:
                 # If there's a field error, fall back to raw SQL
                 logger.error(f"Error with ORM query: {e}. Falling back to raw SQL.")
                 
                 # Simple queries without the problematic fields
-                with connection.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT m.id, m.text, m.media, m.telegram_message_id, m.created_at
-                        FROM admin_panel_message m
-                        ORDER BY m.created_at DESC
-                        LIMIT %s
-                    """, [count])
-                    
-                    columns = ['id', 'text', 'media', 'telegram_message_id', 'created_at']
-                    messages_list = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                messages_list = await sync_to_async(_latest_messages_raw)(count)
                     
             logger.info(f"Завантажено {len(messages_list)} повідомлень")
         except Exception as e:
@@ -119,17 +158,7 @@ def index_view(request):
             except Exception as field_e:
                 # If there's a field error, fall back to raw SQL
                 logger.error(f"Error loading sessions with ORM: {field_e}. Falling back to raw SQL.")
-                with connection.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT id, phone, is_active
-                        FROM admin_panel_telegramsession
-                        WHERE is_active = TRUE
-                        ORDER BY phone
-                    """)
-                    columns = ['id', 'phone', 'is_active']
-                    sessions = [dict(zip(columns, row)) for row in cursor.fetchall()]
-                    
-            logger.info(f"Завантажено {len(sessions)} сесій")
+                sessions = await sync_to_async(_active_sessions_raw)()
         except Exception as e:
             sessions = []
             logger.error(f"Помилка завантаження сесій: {str(e)}")
@@ -142,7 +171,9 @@ def index_view(request):
             'selected_category': category_id if category_id and category_id != 'None' and category_id != 'undefined' else '',
             'selected_session': session_filter if session_filter and session_filter != 'None' and session_filter != 'undefined' else '',
             'current_count': count,
+            'show_duplicates': show_duplicates,
             'MEDIA_URL': settings.MEDIA_URL,
+            'fragment_cache_timeout': settings.FEED_FRAGMENT_CACHE_TIMEOUT,
         }
         
         # Перевіряємо, чи існує шаблон
@@ -159,7 +190,9 @@ def index_view(request):
         
         # Рендеримо шаблон
         logger.info("Рендеримо шаблон index.html")
-        return render(request, 'admin_panel/index.html', context)
+        response = await sync_to_async(_render_index)(request, context)
+        await feed_cache.aset_page(page_key, response.content)
+        return response
         
     except Exception as e:
         logger.error(f"Критична помилка в index_view: {str(e)}\n{traceback.format_exc()}")
@@ -172,7 +205,7 @@ def index_view(request):
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
             <title>Telegram Parser</title>
-            <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
+            {stylesheet_tags('error')}
             <style>
                 body {{ padding: 20px; }}
                 .error {{ color: red; background: #ffeeee; padding: 10px; border-radius: 5px; margin: 20px 0; }}
@@ -197,8 +230,6 @@ def index_view(request):
                     </div>
                 </div>
             </div>
-            
-            <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
         </body>
         </html>
         """)
@@ -254,27 +285,57 @@ def logout_view(request):
     logout(request)
     return redirect('index')
 
+def _chart_bars(points, label_format):
+    """Bars of a CSS bar chart, height in percent of the largest value"""
+    peak = max((count for _, count in points), default=0) or 1
+    return [
+        {'label': moment.strftime(label_format), 'count': count, 'height': round(count * 100 / peak)}
+        for moment, count in points
+    ]
+
 @login_required
 def admin_panel_view(request):
+    from tg_bot import message_stats
+    from tg_bot.heartbeat import service_statuses
     channels_count = Channel.objects.count()
     categories_count = Category.objects.count()
     active_channels_count = Channel.objects.filter(is_active=True).count()
-    messages_count = Message.objects.count()
     sessions_count = TelegramSession.objects.count()
-    latest_messages = Message.objects.order_by('-created_at')
+    # counts come from the counter tables, not from COUNT(*) over the messages
+    stats = message_stats.summary()
+    latest_messages = Message.objects.select_related('channel__category').order_by('-created_at')[:100]
+    services = service_statuses()
     return render(
         request, 
         'admin_panel/admin_panel.html', 
         {'channels_count': channels_count, 
          'categories_count': categories_count, 
          'active_channels_count': active_channels_count, 
-         'messages_count': messages_count,
+         'messages_count': stats['totals']['messages'],
          'sessions_count': sessions_count,
-         'latest_messages': latest_messages})
+         'latest_messages': latest_messages,
+         'services': services,
+         'stats': stats,
+         'daily_chart': _chart_bars(stats['daily'], '%d.%m'),
+         'hourly_chart': _chart_bars(stats['hourly'], '%H:00')})
+
+@login_required
+def stats_api_view(request):
+    """Message counters as JSON: totals, per category / channel / session, per day and per hour"""
+    from tg_bot import message_stats
+    try:
+        days = min(max(int(request.GET.get('days', 30)), 1), 365)
+        hours = min(max(int(request.GET.get('hours', 48)), 1), 24 * 14)
+    except ValueError:
+        days, hours = 30, 48
+    stats = message_stats.summary(days, hours)
+    stats['daily'] = [{'day': day.isoformat(), 'count': count} for day, count in stats['daily']]
+    stats['hourly'] = [{'hour': hour.isoformat(), 'count': count} for hour, count in stats['hourly']]
+    return JsonResponse({'status': 'ok', **stats})
 
 @login_required
 def channels_list_view(request):
-    channels = Channel.objects.all()
+    channels = Channel.objects.select_related('category', 'session')
     return render(request, 'admin_panel/channels_list.html', {'channels': channels})
 
 @login_required
@@ -301,7 +362,7 @@ def channel_create_view(request):
 @login_required
 @safe_db_query
 def channel_detail_view(request, channel_id):
-    channel = Channel.objects.get(id=channel_id)
+    channel = Channel.objects.select_related('category', 'session').get(id=channel_id)
     messages = Message.objects.filter(channel=channel).order_by('-created_at')[:100]
     
     context = {
@@ -340,11 +401,15 @@ def channel_delete_view(request, channel_id):
     channel.delete()
     return redirect('channels_list')
 
+def _categories_with_counts():
+    """Categories with their session and channel count in one query"""
+    return Category.objects.select_related('session').annotate(channels_count=Count('channels'))
+
 @login_required
 def categories_list_view(request):
     """View for listing all categories"""
     try:
-        categories = Category.objects.all()
+        categories = _categories_with_counts()
         
         # Log successful template rendering
         logger = logging.getLogger('template_debug')
@@ -378,7 +443,7 @@ def categories_list_view(request):
         <html>
         <head>
             <title>Error - Categories List</title>
-            <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
+            {stylesheet_tags('error')}
         </head>
         <body>
             <div class="container mt-5">
@@ -444,7 +509,7 @@ def category_delete_view(request, category_id):
 
 @login_required
 def messages_list_view(request):
-    messages = Message.objects.all()
+    messages = Message.objects.select_related('channel')
     return render(request, 'admin_panel/messages_list.html', {'messages': messages})
 
 @login_required
@@ -605,7 +670,8 @@ def sessions_list_view(request):
     
     # Get all sessions
     try:
-        sessions = TelegramSession.objects.all().order_by('-is_active', 'id')
+        # channel counts in the same query, message counts from the stats counters
+        sessions = TelegramSession.objects.annotate(channels_count=Count('channel')).order_by('-is_active', 'id')
         
         # Add needs_auth attribute if it doesn't exist in the database
         for session in sessions:
@@ -623,10 +689,10 @@ def sessions_list_view(request):
                 # Skip if database fields are missing
                 pass
                 
-        # Count channels per session
+        from tg_bot import message_stats
+        messages_per_session = {row['session_id']: row['total'] for row in message_stats.by_session()}
         for session in sessions:
-            session.channels_count = session.channels.count() if hasattr(session, 'channels') else 0
-            session.messages_count = session.messages.count() if hasattr(session, 'messages') else 0
+            session.messages_count = messages_per_session.get(session.id, 0)
     
     except Exception as e:
         logger.error(f"Error loading sessions: {e}")
@@ -839,7 +905,7 @@ def run_migrations_view(request):
 @safe_db_query
 def channels_view(request):
     """Сторінка зі списком каналів"""
-    channels = Channel.objects.all().order_by('-id')
+    channels = Channel.objects.select_related('category', 'session').order_by('-id')
     
     context = {
         'channels': channels,
@@ -943,7 +1009,7 @@ def edit_session_view(request, session_id):
 @login_required
 def categories_standalone_view(request):
     """A simple standalone view for categories that doesn't use base.html"""
-    categories = Category.objects.all()
+    categories = _categories_with_counts()
     
     # Use a very simple template that doesn't extend base.html
     html_content = """
@@ -973,6 +1039,8 @@ def categories_standalone_view(request):
                             <tr>
                                 <th>ID</th>
                                 <th>Name</th>
+                                <th>Channels</th>
+                                <th>Session</th>
                                 <th>Created</th>
                                 <th>Updated</th>
                                 <th style="width: 150px;">Actions</th>
@@ -983,6 +1051,8 @@ def categories_standalone_view(request):
                             <tr>
                                 <td>{{ category.id }}</td>
                                 <td>{{ category.name }}</td>
+                                <td>{{ category.channels_count }}</td>
+                                <td>{{ category.session.phone|default:"-" }}</td>
                                 <td>{{ category.created_at|date:"d.m.Y H:i" }}</td>
                                 <td>{{ category.updated_at|date:"d.m.Y H:i" }}</td>
                                 <td>
@@ -0,0 +1,126 @@
+"""
+Cache helpers for the views and the bot.
+
+- namespaces: a namespace has a version counter in the cache and every key
+  built with versioned_key() carries it, bump_namespace() invalidates all of
+  them at once without deleting anything
+- get_or_compute(): read-through caching with stampede protection, a value
+  is refreshed by one caller holding a short lock while the others keep
+  getting the previous value, on a cold miss they wait a moment for it
+- memoize(): get_or_compute() as a decorator, the key is built from the
+  function and its arguments
+
+Errors of the cache backend are logged and the value is computed, a cache
+outage must not break a page or a bot command.
+"""
+import time
+import logging
+import hashlib
+import functools
+
+from django.core.cache import cache
+
+logger = logging.getLogger('cache')
+
+LOCK_TIMEOUT = 30  # seconds a refresh may hold the lock
+WAIT_INTERVAL = 0.05
+WAIT_TIMEOUT = 2  # seconds a cold miss waits for another caller's value
+
+def _version_key(namespace):
+    return f'ns:{namespace}:version'
+
+def namespace_version(namespace):
+    try:
+        version = cache.get(_version_key(namespace))
+        if version is None:
+            cache.add(_version_key(namespace), 1, timeout=None)
+            version = cache.get(_version_key(namespace), 1)
+        return version
+    except Exception as e:
+        logger.error(f"Error reading the version of {namespace}: {e}")
+        return 0
+
+def bump_namespace(namespace):
+    """Invalidate every key of the namespace"""
+    try:
+        return cache.incr(_version_key(namespace))
+    except ValueError:
+        # not set yet, any new value invalidates
+        cache.add(_version_key(namespace), 2, timeout=None)
+    except Exception as e:
+        logger.error(f"Error bumping the version of {namespace}: {e}")
+
+def versioned_key(namespace, *parts):
+    """Key under the current version of the namespace, long parts are hashed"""
+    suffix = ':'.join(str(part) for part in parts)
+    if len(suffix) > 100:
+        suffix = hashlib.md5(suffix.encode('utf-8')).hexdigest()
+    return f'{namespace}:{namespace_version(namespace)}:{suffix}'
+
+def _acquire(lock_key):
+    try:
+        return cache.add(lock_key, 1, LOCK_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Error taking {lock_key}: {e}")
+        return True
+
+def get_or_compute(key, compute, ttl):
+    """
+    Cached value of key, compute() when it is missing or stale. Values are
+    stored with their refresh time and kept twice as long, so a stale value
+    is served while one caller recomputes it
+    """
+    lock_key = f'{key}:lock'
+    try:
+        entry = cache.get(key)
+    except Exception as e:
+        logger.error(f"Error reading {key}: {e}")
+        return compute()
+
+    if entry is not None:
+        value, refresh_at = entry
+        if time.time() < refresh_at or not _acquire(lock_key):
+            return value
+    elif not _acquire(lock_key):
+        # someone else is computing it, wait a moment before doing it too
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[0]
+
+    try:
+        value = compute()
+        try:
+            cache.set(key, (value, time.time() + ttl), ttl * 2)
+        except Exception as e:
+            logger.error(f"Error storing {key}: {e}")
+        return value
+    finally:
+        try:
+            cache.delete(lock_key)
+        except Exception as e:
+            logger.error(f"Error releasing {lock_key}: {e}")
+
+def memoize(ttl, namespace=None):
+    """
+    Cache the result of a function for ttl seconds per arguments, arguments
+    must have a stable repr. With a namespace the results are dropped by
+    bump_namespace(namespace)
+    """
+    def decorator(func):
+        name = f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = hashlib.md5(repr((args, sorted(kwargs.items()))).encode('utf-8')).hexdigest()
+            if namespace:
+                key = versioned_key(namespace, name, arguments)
+            else:
+                key = f'memoize:{name}:{arguments}'
+            return get_or_compute(key, lambda: func(*args, **kwargs), ttl)
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
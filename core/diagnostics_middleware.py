@@ -0,0 +1,162 @@
+"""
+Opt-in request diagnostics.
+
+A request is traced only when it asks for it: with an `X-Diagnostics` header
+carrying DIAGNOSTICS_TOKEN, or from a staff user with the `diagnostics`
+cookie (set by opening any page with ?diagnostics=1, removed with
+?diagnostics=0). A traced request gets the render time of every template
+and of the whole view in `Server-Timing` response headers (shown by the
+browser dev tools) and in the `diagnostics` log. Response bodies are never
+read.
+
+Other requests pay three string lookups. Template.render is wrapped on the
+first traced request only, after that an untraced render costs one
+ContextVar lookup. Under ASGI the staff check, which may load the user, runs
+in a thread only for requests carrying the cookie or the toggle.
+"""
+import time
+import logging
+import contextvars
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.template.base import Template
+
+logger = logging.getLogger('diagnostics')
+
+COOKIE_NAME = 'diagnostics'
+HEADER = 'HTTP_X_DIAGNOSTICS'
+
+_timings = contextvars.ContextVar('template_timings', default=None)
+_render_patched = False
+
+def _patch_template_render():
+    global _render_patched
+    if _render_patched:
+        return
+    original_render = Template.render
+
+    def timed_render(template_self, context):
+        timings = _timings.get()
+        if timings is None:
+            return original_render(template_self, context)
+        started = time.perf_counter()
+        try:
+            return original_render(template_self, context)
+        finally:
+            timings.append((template_self.name or 'inline', time.perf_counter() - started))
+
+    Template.render = timed_render
+    _render_patched = True
+
+def _server_timing(name, seconds, description=None):
+    description = f';desc="{description}"' if description else ''
+    return f'{name}{description};dur={seconds * 1000:.1f}'
+
+class DiagnosticsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.token = getattr(settings, 'DIAGNOSTICS_TOKEN', '')
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def _may_trace(self, request):
+        """False for the requests that cannot be traced, without touching the user"""
+        return (
+            HEADER in request.META
+            or 'diagnostics=' in request.META.get('QUERY_STRING', '')
+            or COOKIE_NAME + '=' in request.META.get('HTTP_COOKIE', '')
+        )
+
+    def _toggle(self, request):
+        """'1' / '0' when a staff user switches the cookie with ?diagnostics=, else None"""
+        if 'diagnostics=' not in request.META.get('QUERY_STRING', ''):
+            return None
+        value = request.GET.get('diagnostics')
+        if value in ('0', '1') and getattr(request, 'user', None) and request.user.is_staff:
+            return value
+        return None
+
+    def _is_traced(self, request, toggle):
+        header = request.META.get(HEADER)
+        if header is not None:
+            return bool(self.token) and header == self.token
+        if toggle is not None:
+            return toggle == '1'
+        if COOKIE_NAME + '=' not in request.META.get('HTTP_COOKIE', ''):
+            return False
+        if request.COOKIES.get(COOKIE_NAME) != '1':
+            return False
+        return bool(getattr(request, 'user', None) and request.user.is_staff)
+
+    def _decide(self, request):
+        """(toggle, traced) of the request"""
+        if not self._may_trace(request):
+            return None, False
+        toggle = self._toggle(request)
+        return toggle, self._is_traced(request, toggle)
+
+    def _untraced(self, response, toggle):
+        if toggle == '0':
+            response.delete_cookie(COOKIE_NAME)
+        return response
+
+    def _traced(self, request, response, toggle, timings, total):
+        entries = [
+            _server_timing(f'tpl{index}', seconds, name)
+            for index, (name, seconds) in enumerate(timings)
+        ]
+        entries.append(_server_timing('total', total))
+        response['Server-Timing'] = ', '.join(entries)
+        if toggle == '1':
+            response.set_cookie(COOKIE_NAME, '1', httponly=True, samesite='Lax')
+
+        summary = ', '.join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in timings) or 'no templates'
+        logger.info(f"{request.method} {request.path} {response.status_code} in {total * 1000:.1f}ms: {summary}")
+        return response
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        toggle, traced = self._decide(request)
+        if not traced:
+            return self._untraced(self.get_response(request), toggle)
+
+        _patch_template_render()
+        timings = []
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+            # lazy TemplateResponses render here, inside the trace
+            if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+                response.render()
+        finally:
+            total = time.perf_counter() - started
+            _timings.reset(token)
+        return self._traced(request, response, toggle, timings, total)
+
+    async def __acall__(self, request):
+        toggle, traced = None, False
+        if self._may_trace(request):
+            toggle, traced = await sync_to_async(self._decide)(request)
+        if not traced:
+            return self._untraced(await self.get_response(request), toggle)
+
+        _patch_template_render()
+        timings = []
+        # templates rendered in sync_to_async threads see the same list through the copied context
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+            if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+                await sync_to_async(response.render)()
+        finally:
+            total = time.perf_counter() - started
+            _timings.reset(token)
+        return self._traced(request, response, toggle, timings, total)
@@ -0,0 +1,146 @@
+"""
+Cached service status for the health endpoints.
+
+A daemon thread refreshes a snapshot every HEALTH_REFRESH_INTERVAL seconds:
+database round trip, parser heartbeats (the shard leases), message processor
+and delivery lag behind the outbox and free disk space. The health endpoints
+only read the last snapshot, a probe never touches the database.
+
+- liveness: the process answers, always OK
+- readiness: the database answered and the snapshot is fresh, else 503
+"""
+import json
+import time
+import shutil
+import logging
+import threading
+from functools import partial
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger('health_status')
+
+STATUS_OK = 'ok'
+STATUS_DEGRADED = 'degraded'
+STATUS_ERROR = 'error'
+
+def _check_database():
+    from django.db import connection
+
+    started = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    return {
+        'status': STATUS_OK,
+        'engine': connection.vendor,
+        'latency_ms': round((time.perf_counter() - started) * 1000, 2),
+    }
+
+def _check_parser():
+    from admin_panel.models import ParserLease
+
+    now = timezone.now()
+    leases = list(ParserLease.objects.filter(expires_at__gte=now).values_list('heartbeat_at', flat=True))
+    if not leases:
+        return {'status': STATUS_DEGRADED, 'shards': 0, 'heartbeat_age': None}
+    age = (now - max(leases)).total_seconds()
+    return {
+        'status': STATUS_OK if age <= settings.HEALTH_PARSER_STALE_SECONDS else STATUS_DEGRADED,
+        'shards': len(leases),
+        'heartbeat_age': round(age, 1),
+    }
+
+def _check_consumer(consumer):
+    """Lag of an outbox consumer: the message processor or delivery"""
+    from django.db.models import Max
+    from admin_panel.models import OutboxRecord, OutboxOffset
+
+    offset = OutboxOffset.objects.filter(consumer=consumer).values_list('position', flat=True).first()
+    if offset is None:
+        return {'status': STATUS_DEGRADED, 'pending': None, 'lag_seconds': None}
+    last_id = OutboxRecord.objects.aggregate(last_id=Max('id'))['last_id'] or offset
+    oldest = (
+        OutboxRecord.objects.filter(id__gt=offset).order_by('id').values_list('created_at', flat=True).first()
+    )
+    lag = (timezone.now() - oldest).total_seconds() if oldest else 0
+    return {
+        'status': STATUS_OK if lag <= settings.HEALTH_MAX_PROCESSOR_LAG else STATUS_DEGRADED,
+        # ids are sequential, good enough for a probe and needs no COUNT
+        'pending': max(0, last_id - offset),
+        'lag_seconds': round(lag, 1),
+    }
+
+def _check_disk():
+    usage = shutil.disk_usage(settings.MEDIA_ROOT if settings.MEDIA_ROOT else settings.BASE_DIR)
+    free_mb = usage.free // (1024 * 1024)
+    return {
+        'status': STATUS_OK if free_mb >= settings.HEALTH_MIN_FREE_DISK_MB else STATUS_ERROR,
+        'free_mb': free_mb,
+        'used_percent': round(usage.used * 100 / usage.total, 1) if usage.total else None,
+    }
+
+CHECKS = {
+    'database': _check_database,
+    'parser': _check_parser,
+    'processor': partial(_check_consumer, 'message_processor'),
+    'delivery': partial(_check_consumer, 'delivery'),
+    'disk': _check_disk,
+}
+
+class HealthMonitor:
+    def __init__(self, interval=None):
+        self.interval = interval or settings.HEALTH_REFRESH_INTERVAL
+        self.snapshot = {'status': STATUS_DEGRADED, 'ready': False, 'checked_at': None, 'checks': {}}
+        self.snapshot_json = json.dumps(self.snapshot).encode('utf-8')
+        self.refreshed_at = 0
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        from django.db import close_old_connections
+
+        close_old_connections()
+        checks = {}
+        for name, check in CHECKS.items():
+            try:
+                checks[name] = check()
+            except Exception as e:
+                checks[name] = {'status': STATUS_ERROR, 'message': str(e)}
+
+        statuses = {check['status'] for check in checks.values()}
+        status = STATUS_ERROR if STATUS_ERROR in statuses else STATUS_DEGRADED if STATUS_DEGRADED in statuses else STATUS_OK
+        snapshot = {
+            'status': status,
+            'ready': checks['database']['status'] == STATUS_OK and checks['disk']['status'] != STATUS_ERROR,
+            'checked_at': timezone.now().isoformat(),
+            'checks': checks,
+        }
+        # readers take both attributes without a lock, replace them whole
+        self.snapshot_json = json.dumps(snapshot).encode('utf-8')
+        self.snapshot = snapshot
+        self.refreshed_at = time.monotonic()
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing health status: {e}")
+            time.sleep(self.interval)
+
+    def start(self):
+        """Start the refresh thread once per process"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='health-monitor', daemon=True)
+            self._thread.start()
+
+    def is_ready(self):
+        # a snapshot the thread stopped refreshing does not count
+        fresh = time.monotonic() - self.refreshed_at <= self.interval * 3
+        return fresh and self.snapshot['ready']
+
+monitor = HealthMonitor()
@@ -70,23 +70,39 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.health_middleware.HealthCheckMiddleware',  # Health probes, answered before any other middleware
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.static_middleware.AsyncWhiteNoiseMiddleware',  # WhiteNoise, async capable for the ASGI server
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'core.health_middleware.HealthCheckMiddleware',  # Health middleware
-    'core.template_middleware.TemplateDebugMiddleware',  # Template debug middleware
-    'core.template_debug_middleware.TemplateRenderDebugMiddleware',  # Template render debugging
+    'core.diagnostics_middleware.DiagnosticsMiddleware',  # Opt-in template render timings
 ]
 
+# Health snapshot refreshed in the background, see core/health_status.py
+HEALTH_REFRESH_INTERVAL = int(os.environ.get('HEALTH_REFRESH_INTERVAL', 5))  # seconds
+HEALTH_PARSER_STALE_SECONDS = int(os.environ.get('HEALTH_PARSER_STALE_SECONDS', 180))  # parser heartbeat older than this is degraded
+HEALTH_MAX_PROCESSOR_LAG = int(os.environ.get('HEALTH_MAX_PROCESSOR_LAG', 600))  # seconds the processor or delivery may be behind the outbox
+HEALTH_MIN_FREE_DISK_MB = int(os.environ.get('HEALTH_MIN_FREE_DISK_MB', 200))
+
+# Public index feed cache, see admin_panel/feed_cache.py
+FEED_PAGE_CACHE_TIMEOUT = int(os.environ.get('FEED_PAGE_CACHE_TIMEOUT', 60))  # seconds, whole page for anonymous visitors
+FEED_FRAGMENT_CACHE_TIMEOUT = int(os.environ.get('FEED_FRAGMENT_CACHE_TIMEOUT', 3600))  # seconds, category bar and message cards
+
+# Token for the X-Diagnostics request header, header tracing is off without it
+DIAGNOSTICS_TOKEN = os.environ.get('DIAGNOSTICS_TOKEN', '')
+
 # Ensure database connections are released in long-running apps
 # This prevents database connection exhaustion in Railway
 CONN_MAX_AGE = 60  # recommended for Railway's ephemeral builds
 
+# Set by run.py for the ASGI web server: async views run their queries in a
+# thread per request, persistent connections would pile up one per thread
+ASGI_SERVER = os.environ.get('DJANGO_ASGI') == '1'
+
 # Setup URL routing
 ROOT_URLCONF = 'core.urls'
 
@@ -115,6 +131,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'core.wsgi.application'
+ASGI_APPLICATION = 'core.asgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
@@ -125,7 +142,7 @@ if 'DATABASE_URL' in os.environ:
     DATABASES = {
         'default': dj_database_url.config(
             default=os.environ.get('DATABASE_URL'),
-            conn_max_age=600, ssl_require=False  # 10 minutes timeout without requiring SSL
+            conn_max_age=0 if ASGI_SERVER else 600, ssl_require=False  # 10 minutes timeout without requiring SSL
         )
     }
     print("Using DATABASE_URL connection string")
@@ -139,7 +156,7 @@ elif os.environ.get('RAILWAY_ENVIRONMENT') or os.environ.get('RAILWAY_SERVICE_NA
             'PASSWORD': os.environ.get('PGPASSWORD', ''),
             'HOST': os.environ.get('PGHOST', 'localhost'), # Changed from postgres.railway.internal
             'PORT': os.environ.get('PGPORT', '5432'),
-            'CONN_MAX_AGE': 60,  # Recommended for Railway's ephemeral builds
+            'CONN_MAX_AGE': 0 if ASGI_SERVER else 60,  # Recommended for Railway's ephemeral builds
             'OPTIONS': {
                 'connect_timeout': 10,
                 'options': '-c statement_timeout=5000',  # 5s timeout for statements to avoid hanging queries
@@ -158,6 +175,43 @@ else:
     }
     print(f"Using SQLite database at {db_path}")
 
+# Cache
+# Shared by the gunicorn workers, the parser and the bot, see core/cache.py for the helpers.
+# Redis when REDIS_URL is set, fakeredis under `manage.py test` (requirements-test.txt),
+# otherwise a file cache on the local disk that all processes of the host share.
+REDIS_URL = os.environ.get('REDIS_URL', '')
+CACHE_DIR = os.environ.get('CACHE_DIR', os.path.join(BASE_DIR, '.cache'))
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
+if TESTING:
+    import fakeredis
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://localhost:6379/0',
+            'OPTIONS': {'connection_class': fakeredis.FakeConnection},
+        }
+    }
+elif REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'tgparser',
+            'TIMEOUT': 300,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_DIR,
+            'KEY_PREFIX': 'tgparser',
+            'TIMEOUT': 300,
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -193,8 +247,7 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = [
-    os.path.join(BASE_DIR, 'static'),
-    BASE_DIR,  # Serve the main directory as static files
+    os.path.join(BASE_DIR, 'static'),  # Only real assets, never BASE_DIR: STATIC_ROOT lives inside it
 ]
 
 # Media files
@@ -232,8 +285,13 @@ if not DEBUG and RAILWAY_PUBLIC_DOMAIN:
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-# Whitenoise static file handling
+# Whitenoise static file handling: collectstatic runs once when the image is
+# built, fingerprints every file and writes .gz and .br (Brotli) copies next to
+# it. Fingerprinted names are served with an immutable, 10 year Cache-Control
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+if TESTING:
+    # The suite runs without collectstatic, there is no manifest to look {% static %} names up in
+    STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
 
 # Bot settings
 BOT_TOKEN = os.environ.get('BOT_TOKEN', '')
@@ -279,14 +337,9 @@ LOGGING = {
             'handlers': ['console'],
             'level': 'INFO',
         },
-        'template_debug': {
+        'diagnostics': {
             'handlers': ['console', 'file'],
-            'level': 'DEBUG',
-            'propagate': False,
-        },
-        'template_middleware': {
-            'handlers': ['console', 'file'],
-            'level': 'DEBUG',
+            'level': 'INFO',
             'propagate': False,
         },
     },
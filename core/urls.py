@@ -48,7 +48,8 @@ except ImportError:
         return HttpResponse("Media not found", status=404)
     
     def railway_index_view(request):
-        return index_view(request)
+        from asgiref.sync import async_to_sync
+        return async_to_sync(index_view)(request)
     
     def serve_root_index(request):
         """Serve index.html directly from root directory"""
@@ -58,68 +59,23 @@ except ImportError:
         return railway_index_view(request)
 
 from django.views.generic import TemplateView
-import subprocess
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    print("Warning: psutil not available - process monitoring limited")
-import time
 
 logger = logging.getLogger('media_handler')
 
-# Health check endpoint
+# Health check endpoints, normally answered by HealthCheckMiddleware before routing
 @csrf_exempt
 @require_GET
 def health_check(request):
-    """Enhanced health check endpoint that returns detailed status"""
-    import json
-    import sys
-    import django
-    
-    try:
-        # Log the health check request
-        logger.info(f"Health check endpoint called from {request.META.get('REMOTE_ADDR')}")
-        
-        # Collect health information
-        health_data = {
-            'status': 'ok',
-            'timestamp': str(django.utils.timezone.now()),
-            'python_version': sys.version,
-            'django_version': django.__version__,
-            'request_path': request.path,
-        }
-        
-        # Check database connection
-        try:
-            from django.db import connection
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                db_result = cursor.fetchone()[0]
-                health_data['database'] = {
-                    'status': 'connected' if db_result == 1 else 'error',
-                    'engine': connection.vendor
-                }
-        except Exception as e:
-            health_data['database'] = {
-                'status': 'error',
-                'message': str(e)
-            }
-        
-        # Format based on Accept header
-        accept = request.META.get('HTTP_ACCEPT', '')
-        if 'application/json' in accept:
-            return HttpResponse(json.dumps(health_data), content_type='application/json')
-        elif request.path.endswith('.json'):
-            return HttpResponse(json.dumps(health_data), content_type='application/json')
-        else:
-            # Plain text for simplicity and compatibility
-            return HttpResponse("OK", content_type="text/plain")
-    except Exception as e:
-        # Even if everything fails, still return 200 OK for the health check
-        logger.error(f"Error in health check: {e}")
-        return HttpResponse("OK", content_type="text/plain")
+    """Liveness from the cached health snapshot"""
+    from core.health_middleware import liveness_response
+    return liveness_response(request)
+
+@csrf_exempt
+@require_GET
+def readiness_check(request):
+    """Readiness from the cached health snapshot, 503 while not ready"""
+    from core.health_middleware import readiness_response
+    return readiness_response(request)
 
 def health_check_view(request):
     """Простий обробник для перевірки здоров'я для Railway"""
@@ -134,91 +90,35 @@ def simple_index_view(request):
 
 @csrf_exempt
 def bot_status_api(request):
-    """API для перевірки статусу бота"""
+    """API для перевірки статусу бота, парсера та обробника з їхніх heartbeat"""
     try:
-        # Перевіряємо, чи бот запущений через перевірку процесів
-        if PSUTIL_AVAILABLE:
-            # Шукаємо процеси python, які виконують run_bot.py
-            bot_processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if proc.info['name'].lower() in ['python', 'python.exe', 'python3', 'python3.exe']:
-                        cmdline = ' '.join(proc.info['cmdline'] or []).lower()
-                        if 'run_bot.py' in cmdline:
-                            bot_processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
-            
-            # Повертаємо статус
-            if bot_processes:
-                return JsonResponse({
-                    'status': 'running',
-                    'message': 'Bot is running',
-                    'processes': len(bot_processes),
-                    'process_info': bot_processes[0] if bot_processes else None
-                })
-            else:
-                return JsonResponse({
-                    'status': 'stopped',
-                    'message': 'Bot is not running'
-                })
-        else:
-            # Якщо немає psutil, використовуємо альтернативний метод
-            try:
-                # Альтернативний метод через таблицю процесів у Django
-                import subprocess
-                bot_running = False
-                
-                try:
-                    if os.name == 'posix':  # Linux/Unix
-                        result = subprocess.run(['ps', '-ef'], capture_output=True, text=True)
-                        bot_running = 'run_bot.py' in result.stdout
-                    else:  # Windows
-                        result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq python.exe'], capture_output=True, text=True)
-                        bot_running = 'run_bot.py' in result.stdout
-                except Exception:
-                    # Якщо ps не доступний, перевіряємо наявність PID файлів
-                    bot_pid_file = 'bot.pid'
-                    if os.path.exists(bot_pid_file):
-                        bot_running = True
-                
-                if bot_running:
-                    return JsonResponse({
-                        'status': 'running',
-                        'message': 'Bot is running'
-                    })
-                else:
-                    return JsonResponse({
-                        'status': 'stopped',
-                        'message': 'Bot is not running'
-                    })
-            except Exception as e:
-                # Якщо все інше не працює, перевіримо файли статусу чи директорії
-                try:
-                    # Спробуємо перевірити, чи існує директорія з логами бота
-                    log_dir = os.path.join('logs', 'bot')
-                    if os.path.exists(log_dir) and os.path.isdir(log_dir):
-                        # Перевіряємо, чи є нові логи
-                        logs = [f for f in os.listdir(log_dir) if f.endswith('.log')]
-                        if logs:
-                            newest_log = max(logs, key=lambda x: os.path.getmtime(os.path.join(log_dir, x)))
-                            log_time = os.path.getmtime(os.path.join(log_dir, newest_log))
-                            if (time.time() - log_time) < 60*5:  # останні 5 хвилин
-                                return JsonResponse({
-                                    'status': 'likely_running',
-                                    'message': 'Bot appears to be running based on recent logs'
-                                })
-                    
-                    # Якщо немає ознак роботи, повернемо невідомий статус
-                    return JsonResponse({
-                        'status': 'unknown',
-                        'message': f'Cannot determine bot status: {str(e)}'
-                    })
-                except Exception as e2:
-                    return JsonResponse({
-                        'status': 'error',
-                        'message': f'Error checking bot status: {str(e2)}'
-                    }, status=500)
+        from tg_bot.heartbeat import service_statuses
+        services = service_statuses()
+        bot = next((service for service in services if service.kind == 'bot'), None)
+        bot_status = bot.status if bot else 'unknown'
+        return JsonResponse({
+            'status': bot_status,
+            'message': f'Bot is {bot_status}' if bot else 'Bot has not reported a heartbeat yet',
+            'services': [
+                {
+                    'name': service.name,
+                    'kind': service.kind,
+                    'status': service.status,
+                    'host': service.host,
+                    'pid': service.pid,
+                    'started_at': service.started_at.isoformat(),
+                    'heartbeat_at': service.heartbeat_at.isoformat(),
+                    'heartbeat_age': service.heartbeat_age,
+                    'cycle_seconds': service.cycle_seconds,
+                    'channels_polled': service.channels_polled,
+                    'messages_ingested': service.messages_ingested,
+                    'last_error': service.last_error,
+                    'last_error_at': service.last_error_at.isoformat() if service.last_error_at else None,
+                    'details': service.details,
+                }
+                for service in services
+            ],
+        })
     except Exception as e:
         return JsonResponse({
             'status': 'error',
@@ -233,6 +133,7 @@ urlpatterns = [
     
     # Main page - now using our direct serve_root_index function
     path('', direct_index_view, name='index'),
+    path('feed/', index_view, name='feed'),  # Async message feed
     
     # Auth routes
     path('login/', login_view, name='login'),
@@ -246,6 +147,8 @@ urlpatterns = [
     path('healthz.html', health_check, name='healthz_html'),
     path('ping/', health_check, name='ping'),
     re_path(r'^_health/?$', health_check),  # Railway health check format
+    path('livez/', health_check, name='livez'),
+    path('readyz/', readiness_check, name='readyz'),
     
     # Static and media serving (for development)
     path('media/<path:path>', serve_media, name='serve_media'),
@@ -1,10 +1,12 @@
 import os
+import asyncio
 import logging
 import shutil
 import mimetypes
+from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
-from django.http import FileResponse, HttpResponse
-from django.views.decorators.http import require_GET
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, HttpResponse, HttpResponseNotAllowed, StreamingHttpResponse
 
 logger = logging.getLogger('media_handler')
 
@@ -31,26 +33,36 @@ def serve_root_index(request):
         logger.error(f"Error serving root index.html: {e}")
         return railway_index_view(request)
 
-@require_GET
-def serve_media(request, path):
+MEDIA_CHUNK_SIZE = 64 * 1024
+
+async def _read_chunks(file_path):
+    """The file in chunks, every read runs in a thread so a large video does not block the event loop"""
+    media_file = await asyncio.to_thread(open, file_path, 'rb')
+    try:
+        while True:
+            chunk = await asyncio.to_thread(media_file.read, MEDIA_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        media_file.close()
+
+def _file_response(request, file_path, content_type):
     """
-    Custom media file handler that creates placeholders for missing files
+    Under ASGI the file is streamed by an async iterator, Django would read a
+    FileResponse into memory there. The WSGI server gets a plain FileResponse
     """
-    # Determine file path
-    if path.startswith('messages/'):
-        file_path = os.path.join(settings.MEDIA_ROOT, path)
+    if isinstance(request, ASGIRequest):
+        response = StreamingHttpResponse(_read_chunks(file_path))
+        response['Content-Length'] = str(os.path.getsize(file_path))
     else:
-        file_path = os.path.join(settings.MEDIA_ROOT, 'messages', path)
-    
-    # Check if file exists
-    if os.path.exists(file_path):
-        # Return existing file
-        content_type, encoding = mimetypes.guess_type(file_path)
         response = FileResponse(open(file_path, 'rb'))
-        if content_type:
-            response['Content-Type'] = content_type
-        return response
-    
+    if content_type:
+        response['Content-Type'] = content_type
+    return response
+
+def _create_placeholder(path, file_path):
+    """Copy a placeholder to file_path, returns its content type, None when it failed"""
     logger.warning(f"Media file not found: {file_path}")
     
     # Create necessary directories
@@ -114,13 +126,36 @@ def serve_media(request, path):
             except Exception as e:
                 logger.warning(f"Could not set permissions for {file_path}: {e}")
             
-            # Return the file with appropriate content type
-            response = FileResponse(open(file_path, 'rb'))
-            if content_type:
-                response['Content-Type'] = content_type
-            return response
+            return content_type
     except Exception as e:
         logger.error(f"Error creating placeholder for {path}: {e}")
+    return None
+
+async def serve_media(request, path):
+    """
+    Custom media file handler that creates placeholders for missing files
+    """
+    # require_GET does not wrap async views in this Django version
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    
+    # Determine file path
+    if path.startswith('messages/'):
+        file_path = os.path.join(settings.MEDIA_ROOT, path)
+    else:
+        file_path = os.path.join(settings.MEDIA_ROOT, 'messages', path)
+    
+    # Check if file exists
+    if await asyncio.to_thread(os.path.exists, file_path):
+        # Return existing file
+        content_type, encoding = mimetypes.guess_type(file_path)
+        return _file_response(request, file_path, content_type)
+    
+    # Placeholder files are created in a thread, they touch the disk and PIL
+    content_type = await sync_to_async(_create_placeholder)(path, file_path)
+    if content_type is not None:
+        # Return the file with appropriate content type
+        return _file_response(request, file_path, content_type)
     
     # If all else fails, return 404
     return HttpResponse(f"Media file not found: {path}", status=404)
@@ -131,7 +166,7 @@ def railway_index_view(request):
     try:
         # First try the normal index view from admin_panel
         from admin_panel.views import index_view
-        return index_view(request)
+        return async_to_sync(index_view)(request)
     except Exception as e:
         import logging
         logger = logging.getLogger('railway')
@@ -162,21 +197,22 @@ def railway_index_view(request):
             
             # Ultimate fallback - render a styled HTML page
             from django.http import HttpResponse
-            html = '''
+            from admin_panel.assets import stylesheet_tags
+            html = f'''
             <!DOCTYPE html>
             <html>
             <head>
                 <title>Telegram Channel Parser</title>
                 <meta charset="UTF-8">
                 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
+                {stylesheet_tags('error')}
                 <style>
-                    body { padding: 20px; background-color: #f8f9fc; font-family: 'Nunito', sans-serif; }
-                    .container { max-width: 1200px; margin: 0 auto; }
-                    .card { border-radius: 8px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin-top: 20px; }
-                    .card-header { background-color: #4e73df; color: white; font-weight: bold; }
-                    .btn-primary { background-color: #4e73df; border-color: #4e73df; }
-                    .btn-primary:hover { background-color: #2e59d9; border-color: #2653d4; }
+                    body {{ padding: 20px; background-color: #f8f9fc; font-family: 'Nunito', sans-serif; }}
+                    .container {{ max-width: 1200px; margin: 0 auto; }}
+                    .card {{ border-radius: 8px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin-top: 20px; }}
+                    .card-header {{ background-color: #4e73df; color: white; font-weight: bold; }}
+                    .btn-primary {{ background-color: #4e73df; border-color: #4e73df; }}
+                    .btn-primary:hover {{ background-color: #2e59d9; border-color: #2653d4; }}
                 </style>
             </head>
             <body>
@@ -199,7 +235,6 @@ def railway_index_view(request):
                         </div>
                     </div>
                 </div>
-                <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
             </body>
             </html>
             '''
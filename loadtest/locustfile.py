@@ -0,0 +1,80 @@
+"""
+Load test of the async views: the feed, the message search API and media.
+
+Run the same test against both servers and compare the requests per second
+and the latency percentiles locust reports.
+
+    # sync, how the app was served before
+    gunicorn core.wsgi:application --workers 2 --threads 2 --bind 127.0.0.1:8000
+
+    # async, how run.py serves it now
+    DJANGO_ASGI=1 gunicorn core.asgi:application --worker-class uvicorn.workers.UvicornWorker \
+        --workers 2 --bind 127.0.0.1:8000
+
+    pip install locust
+    locust -f loadtest/locustfile.py --host http://127.0.0.1:8000 \
+        --headless --users 200 --spawn-rate 50 --run-time 1m
+
+Environment:
+    LOADTEST_MEDIA   media paths to request, comma separated, under /media/
+    LOADTEST_VIDEO   a large media file under /media/, watched by VideoViewer
+    LOADTEST_VIDEO_RATE  download rate of a viewer, bytes per second
+    LOADTEST_VIEWERS number of viewers, 10 by default
+    LOADTEST_QUERIES search terms, comma separated
+
+The sync server handles four requests at a time (2 workers x 2 threads), a
+request waiting on the database or on a slow client holds a thread.
+VideoViewer downloads a video at LOADTEST_VIDEO_RATE bytes per second like a
+phone on a slow connection, a handful of them occupy every sync thread and
+the feed users queue behind them. The async workers keep serving the feed
+meanwhile, compare the /feed/ percentiles with and without viewers.
+"""
+import os
+import time
+import random
+
+from locust import HttpUser, task, between
+
+MEDIA = [path for path in os.environ.get('LOADTEST_MEDIA', '').split(',') if path]
+VIDEO = os.environ.get('LOADTEST_VIDEO', '')
+VIDEO_RATE = int(os.environ.get('LOADTEST_VIDEO_RATE', 512 * 1024))
+VIDEO_CHUNK = 64 * 1024
+QUERIES = [query for query in os.environ.get('LOADTEST_QUERIES', 'новини,україна,http').split(',') if query]
+FEED_COUNTS = (5, 10, 20, 50)
+
+class FeedUser(HttpUser):
+    wait_time = between(0.5, 2)
+
+    @task(5)
+    def feed(self):
+        self.client.get('/feed/', params={'count': random.choice(FEED_COUNTS)}, name='/feed/')
+
+    @task(2)
+    def feed_with_reposts(self):
+        self.client.get('/feed/', params={'count': random.choice(FEED_COUNTS), 'duplicates': 1}, name='/feed/?duplicates')
+
+    @task(3)
+    def search(self):
+        self.client.get(
+            '/bot/messages/search/',
+            params={'q': random.choice(QUERIES), 'limit': 50},
+            name='/bot/messages/search/',
+        )
+
+    @task(2)
+    def media(self):
+        if not MEDIA:
+            return
+        self.client.get(f'/media/{random.choice(MEDIA)}', name='/media/')
+
+class VideoViewer(HttpUser):
+    """Watches a video over a slow connection, only with LOADTEST_VIDEO set"""
+    weight = 1 if VIDEO else 0
+    fixed_count = int(os.environ.get('LOADTEST_VIEWERS', 10)) if VIDEO else 0
+    wait_time = between(1, 3)
+
+    @task
+    def watch(self):
+        with self.client.get(f'/media/{VIDEO}', name='/media/ video', stream=True, catch_response=True) as response:
+            for _ in response.iter_content(VIDEO_CHUNK):
+                time.sleep(VIDEO_CHUNK / VIDEO_RATE)
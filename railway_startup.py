@@ -54,20 +54,6 @@ def run_command(command, check=True, shell=False, env=None):
 
 def run_fix_scripts():
     """Run scripts to fix deployments issues"""
-    # Run fix_static_files.py to fix nested staticfiles
-    if os.path.exists("fix_static_files.py"):
-        logger.info("Running fix_static_files.py...")
-        run_command([sys.executable, "fix_static_files.py"], check=False)
-    else:
-        logger.warning("fix_static_files.py not found. Create this file to fix static files issues.")
-    
-    # Run fix_whitenoise.py to fix storage issues
-    if os.path.exists("fix_whitenoise.py"):
-        logger.info("Running fix_whitenoise.py...")
-        run_command([sys.executable, "fix_whitenoise.py"], check=False)
-    else:
-        logger.warning("fix_whitenoise.py not found. Create this file to fix whitenoise storage issues.")
-    
     # Run fix_migration_conflict.py if it exists
     if os.path.exists("fix_migration_conflict.py"):
         logger.info("Running fix_migration_conflict.py...")
@@ -102,9 +88,13 @@ def run_migrations():
         # Don't exit, try to continue with the deployment
 
 def collect_static_files():
-    """Collect static files"""
+    """Collect static files, unless the image was built with them"""
+    if os.path.exists(os.path.join("staticfiles", "staticfiles.json")):
+        logger.info("Static files were collected at build time, skipping collectstatic")
+        return
     try:
         logger.info("Collecting static files...")
+        run_command(["python", "manage.py", "build_assets"])
         run_command(["python", "manage.py", "collectstatic", "--noinput", "--clear"])
         logger.info("Static files collected successfully")
     except Exception as e:
@@ -181,7 +171,8 @@ def main():
     logger.info(f"Starting Django server on port {port}...")
     
     # Use exec to replace the current process with the Django server
-    os.execvp("gunicorn", ["gunicorn", f"--bind=0.0.0.0:{port}", "core.wsgi:application"])
+    os.environ["DJANGO_ASGI"] = "1"
+    os.execvp("gunicorn", ["gunicorn", f"--bind=0.0.0.0:{port}", "--worker-class=uvicorn.workers.UvicornWorker", "core.asgi:application"])
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
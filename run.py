@@ -164,10 +164,6 @@ def fix_migration_conflict():
         logger.info("Applying migrations normally")
         run_command("python manage.py migrate", "Applying migrations", critical=False)
         
-        # Collect static
-        logger.info("Collecting static files")
-        run_command("python manage.py collectstatic --noinput", "Collecting static")
-        
         logger.info("Migration conflicts resolved successfully")
         return True
         
@@ -237,12 +233,13 @@ def run_django():
         # If running on Railway, use the PORT environment variable
         if os.environ.get('RAILWAY_ENVIRONMENT'):
             port = os.environ.get('PORT', '8000')
-            # Use Gunicorn on Railway
-            cmd = f"gunicorn core.wsgi:application --preload --workers 2 --threads 2 --bind 0.0.0.0:{port}"
+            # Use Gunicorn with uvicorn workers on Railway, the feed, the message API and media are async views
+            cmd = f"gunicorn core.asgi:application --preload --worker-class uvicorn.workers.UvicornWorker --workers 2 --bind 0.0.0.0:{port}"
             logger.info(f"Starting Django with Gunicorn: {cmd}")
             django_process = subprocess.Popen(
                 cmd,
                 shell=True,
+                env={**os.environ, 'DJANGO_ASGI': '1'},
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 universal_newlines=True
@@ -351,7 +348,7 @@ async def run_bot():
             # Try to register handlers from tg_bot
             try:
                 from tg_bot.middlewares import ChannelsDataMiddleware
-                from tg_bot.handlers import common_router, admin_router, session_router
+                from tg_bot.handlers import common_router, admin_router, session_router, subscriptions_router
                 
                 # Add middleware
                 dp.message.middleware(ChannelsDataMiddleware())
@@ -359,6 +356,7 @@ async def run_bot():
                 
                 # Register routers
                 dp.include_router(session_router)
+                dp.include_router(subscriptions_router)
                 dp.include_router(admin_router)
                 dp.include_router(common_router)
                 logger.info("Bot handlers registered successfully")
@@ -496,9 +494,15 @@ def run_telethon_parser(message_queue):
                 with open(filename, 'w') as f:
                     f.write('{}')
                     
-        # Start the parser
-        from tg_bot.telethon_worker import telethon_worker_process
-        telethon_worker_process(message_queue)
+        # Start the parser, sharded over several processes if configured
+        from tg_bot.config import PARSER_WORKERS
+        if PARSER_WORKERS > 1:
+            from tg_bot.parser_launcher import run_sharded_parser
+            logger.info(f"Starting {PARSER_WORKERS} parser worker processes")
+            run_sharded_parser(message_queue, PARSER_WORKERS)
+        else:
+            from tg_bot.telethon_worker import telethon_worker_process
+            telethon_worker_process(message_queue)
     
     except ImportError as ie:
         logger.error(f"Import error in Telethon parser: {ie}")
@@ -544,72 +548,122 @@ def message_processor(message_queue):
         logger.error(traceback.format_exc())
         return
     
+    # Fan-out delivery to the bot subscribers reads the outbox on its own offset,
+    # in its own thread, it never holds up the processing of new messages
+    delivery = None
+    try:
+        from tg_bot.delivery import DeliveryService
+        delivery = DeliveryService()
+        delivery.start()
+    except Exception as e:
+        logger.error(f"Error starting delivery service: {e}")
+        logger.error(traceback.format_exc())
+    
+    # Parsed messages come from the outbox table, message_queue is not used
+    try:
+        from tg_bot import outbox
+        from tg_bot.enrichment import enrich_batch
+        from tg_bot.dedup import Deduplicator
+        from tg_bot.heartbeat import Heartbeat
+        from admin_panel.feed_cache import bump_feed_version
+        from tg_bot import message_stats
+        from django.db import transaction
+        from tg_bot.config import OUTBOX_BATCH_SIZE, PROCESSOR_LAG_REPORT_INTERVAL, PROCESSOR_LAG_WARNING
+        consumer = outbox.OutboxConsumer('message_processor')
+        logger.info(f"Reading the outbox from record {consumer.position}")
+    except Exception as e:
+        logger.error(f"Error opening the outbox: {e}")
+        logger.error(traceback.format_exc())
+        return
+    
+    deduplicator = None
+    try:
+        deduplicator = Deduplicator()
+        deduplicator.load()
+    except Exception as e:
+        logger.error(f"Error loading the dedup index: {e}")
+        logger.error(traceback.format_exc())
+        deduplicator = None
+    
     restart_delay = 5  # seconds between retries
+    prune_interval = 3600  # seconds
+    last_prune = 0
+    last_lag_report = 0
+    processed = 0
+    heartbeat = Heartbeat('message_processor', 'processor')
+    last_heartbeat = 0
     
     while True:
         try:
-            # Get message from queue (if queue is empty, wait)
-            try:
-                message = message_queue.get(block=True, timeout=1)
-                logger.debug(f"Received message from queue: {message.get('message_info', {}).get('message_id')}")
-                
-                # Process the message
-                try:
-                    # Get message info
-                    message_info = message.get('message_info', {})
-                    channel_info = message.get('channel_info', {})
-                    
-                    # Log basic info
-                    logger.info(f"Processing message: {message_info.get('message_id')} from {channel_info.get('title')}")
-                    
-                    # Here you would typically save to database
-                    # This is just a placeholder for the actual message processing logic
-                    try:
-                        from admin_panel.models import Message, Channel
-                        
-                        # Find or create channel
-                        channel, created = Channel.objects.get_or_create(
-                            channel_id=channel_info.get('id'),
-                            defaults={
-                                'title': channel_info.get('title'),
-                                'username': channel_info.get('username')
-                            }
-                        )
-                        
-                        # Create message
-                        Message.objects.create(
-                            message_id=message_info.get('message_id'),
-                            text=message_info.get('text', ''),
-                            channel=channel,
-                            date=message_info.get('date'),
-                        )
-                        logger.info(f"Saved message {message_info.get('message_id')} to database")
-                    except Exception as db_error:
-                        logger.error(f"Error saving message to database: {db_error}")
-                        
-                except Exception as process_error:
-                    logger.error(f"Error processing message: {process_error}")
-                    logger.error(traceback.format_exc())
-                
-            except queue.Empty:
-                # Queue is empty, just continue waiting
+            if time.time() - last_lag_report > PROCESSOR_LAG_REPORT_INTERVAL:
+                pending, lag_seconds = consumer.lag()
+                report = logger.warning if lag_seconds > PROCESSOR_LAG_WARNING else logger.info
+                report(f"Message processor: {processed} processed since last report, {pending} pending, {lag_seconds:.0f}s behind")
+                last_lag_report = time.time()
+                processed = 0
+                heartbeat.details = {'pending': pending, 'lag_seconds': round(lag_seconds, 1)}
+            last_heartbeat = heartbeat.beat_if_due(last_heartbeat)
+            
+            records = consumer.read_batch(OUTBOX_BATCH_SIZE)
+            if not records:
+                if time.time() - last_prune > prune_interval:
+                    outbox.prune()
+                    last_prune = time.time()
+                time.sleep(1)
                 continue
+            
+            batch_started = time.time()
+            
+            # language and duplicates, one bulk write per batch; on an error the
+            # offset stays and the batch is read again after the restart delay
+            try:
+                enriched = enrich_batch(records, deduplicator)
+                # reposts found in the batch disappear from the cached feed
+                bump_feed_version()
+                logger.debug(f"Enriched {enriched} message(s) of a batch of {len(records)}")
+            except Exception as enrich_error:
+                logger.error(f"Error enriching messages, the batch will be retried: {enrich_error}")
+                raise
+            
+            for record in records:
+                message_info = record.payload
+                logger.info(f"Processing message: {message_info.get('message_id')} from {message_info.get('channel_name')}")
+            
+            # the batch is done, a restart continues after it; the stats count it
+            # in the same transaction, so every batch is counted once, and when
+            # counting fails the offset stays and the batch is retried
+            with transaction.atomic():
+                message_stats.record_batch(records)
+                consumer.commit(records)
+            processed += len(records)
+            heartbeat.record_cycle(time.time() - batch_started)
+            heartbeat.record_messages(len(records))
+            restart_delay = 5
                 
         except KeyboardInterrupt:
             logger.info("Message processor interrupted by user")
+            if delivery:
+                delivery.stop()
+            heartbeat.stop()
             break
         except Exception as e:
             logger.error(f"Critical error in message processor: {e}")
             logger.error(traceback.format_exc())
+            heartbeat.record_error(e)
             # Sleep before restarting the loop to avoid tight error loops
             time.sleep(restart_delay)
             # Increase delay for next restart (with a maximum)
             restart_delay = min(restart_delay * 2, 60)
 
 def collect_static_files():
-    """Collect static files for Django."""
+    """Collect static files for Django, unless the image was built with them"""
+    manifest = Path(__file__).resolve().parent / 'staticfiles' / 'staticfiles.json'
+    if manifest.exists():
+        logger.info("Static files were collected at build time, skipping collectstatic")
+        return True
     logger.info("Collecting static files...")
     try:
+        run_command("python manage.py build_assets", "Building assets")
         run_command("python manage.py collectstatic --noinput", "Collecting static files")
         return True
     except Exception as e:
@@ -721,7 +775,8 @@ def run_services():
                 target=run_telethon_parser,
                 args=(message_queue,)
             )
-            telethon_process.daemon = True
+            # a sharded parser starts its own worker processes, daemons can't have children
+            telethon_process.daemon = int(os.environ.get('PARSER_WORKERS', 1)) <= 1
             telethon_process.start()
             logger.info(f"Telethon parser process started (PID: {telethon_process.pid})")
             
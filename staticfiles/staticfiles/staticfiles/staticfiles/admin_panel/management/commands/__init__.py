@@ -1 +0,0 @@
-# This file is intentionally left empty to mark this directory as a Python package. 
\ No newline at end of file
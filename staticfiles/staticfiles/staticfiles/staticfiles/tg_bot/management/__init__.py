@@ -1,3 +0,0 @@
-"""
-Management commands for the bot.
-""" 
\ No newline at end of file
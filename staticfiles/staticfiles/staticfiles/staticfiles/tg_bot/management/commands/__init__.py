@@ -1,3 +0,0 @@
-"""
-Commands for managing the bot.
-""" 
\ No newline at end of file
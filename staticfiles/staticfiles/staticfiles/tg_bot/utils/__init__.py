@@ -1 +0,0 @@
-# tg_bot/utils package 
\ No newline at end of file
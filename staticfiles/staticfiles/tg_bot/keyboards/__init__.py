@@ -1,9 +0,0 @@
-from .main_menu import main_menu_keyboard
-from .session_menu import session_menu_keyboard, get_sessions_list_keyboard, get_session_actions_keyboard
-
-__all__ = [
-    'main_menu_keyboard',
-    'session_menu_keyboard',
-    'get_sessions_list_keyboard',
-    'get_session_actions_keyboard'
-]
@@ -1,3 +0,0 @@
-from .channels_data import ChannelsDataMiddleware
-
-__all__ = ["ChannelsDataMiddleware"] 
\ No newline at end of file
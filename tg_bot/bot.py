@@ -53,7 +53,7 @@ try:
     from aiogram.fsm.storage.memory import MemoryStorage
     from aiogram.filters import Command
     from tg_bot.middlewares import ChannelsDataMiddleware
-    from tg_bot.handlers import common_router, admin_router, session_router
+    from tg_bot.handlers import common_router, admin_router, session_router, subscriptions_router
 
     # Get bot token and initialize
     TOKEN_BOT = get_bot_token()
@@ -70,6 +70,7 @@ try:
     
     # Register routers
     dp.include_router(session_router)
+    dp.include_router(subscriptions_router)
     dp.include_router(admin_router)
     dp.include_router(common_router)
     
@@ -121,6 +122,25 @@ async def main():
         except Exception as e:
             logger.error(f"Error deleting webhook: {e}")
         
+        # status heartbeat for the dashboard, counts the handled updates
+        from tg_bot.heartbeat import Heartbeat
+        heartbeat = Heartbeat('bot', 'bot')
+        heartbeat.details = {'username': bot_info.username}
+
+        async def count_updates(handler, event, data):
+            started = asyncio.get_running_loop().time()
+            try:
+                return await handler(event, data)
+            except Exception as e:
+                heartbeat.record_error(e)
+                raise
+            finally:
+                heartbeat.record_cycle(asyncio.get_running_loop().time() - started)
+                heartbeat.record_messages()
+
+        dp.update.outer_middleware(count_updates)
+        heartbeat_task = asyncio.create_task(heartbeat.run())
+        
         # start polling
         logger.info("Starting to receive updates...")
         try:
@@ -128,6 +148,10 @@ async def main():
         except Exception as e:
             logger.error(f"Error during bot operation: {e}")
             logger.error(traceback.format_exc())
+            heartbeat.record_error(e)
+        finally:
+            heartbeat_task.cancel()
+            await heartbeat.astop()
     except Exception as e:
         logger.error(f"Critical error in main: {e}")
         logger.error(traceback.format_exc())
@@ -0,0 +1,247 @@
+"""
+Bulk import of channels from a CSV / newline separated list of links.
+
+Each row is `link[,name[,category]]`. Links are parsed with
+parse_username_from_text and compared by channel_key(), so @name, t.me/name
+and https://t.me/name/ are the same channel in the file and in the DB.
+Public usernames are resolved concurrently through
+a Telethon client under a rate limit, and the new channels are inserted with
+a single bulk_create. Every input row gets a result for the report.
+"""
+import io
+import csv
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from telethon import errors
+
+from tg_bot.utils.messages_utils import parse_username_from_text
+from tg_bot.delivery import RateLimiter
+
+logger = logging.getLogger('channel_import')
+
+IMPORT_CONCURRENCY = 5  # parallel get_entity calls
+IMPORT_RATE_LIMIT = 3  # get_entity calls per second
+IMPORT_MAX_FLOOD_WAIT = 60  # longer flood waits stop the resolving, channels are still created
+
+STATUS_CREATED = 'created'
+STATUS_EXISTS = 'exists'
+STATUS_DUPLICATE = 'duplicate'
+STATUS_INVALID = 'invalid'
+STATUS_ERROR = 'error'
+
+def normalize_link(identifier):
+    """Build the https://t.me/ link the parser expects from a parsed identifier"""
+    return f"https://t.me/{identifier}"
+
+def _identifier_key(identifier):
+    # usernames are case-insensitive, invite codes are not
+    return identifier if identifier.startswith('joinchat/') else identifier.lower()
+
+def channel_key(link):
+    """The identifier links of one channel share, whatever form they were written in"""
+    identifier = parse_username_from_text(link)
+    if not identifier:
+        return (link or '').strip().rstrip('/').lower()
+    return _identifier_key(identifier)
+
+def parse_import_text(text):
+    """
+    Parse the import file into rows.
+
+    Returns:
+        list of dicts with line, link, identifier, name and category keys
+    """
+    rows = []
+    reader = csv.reader(io.StringIO(text))
+    for line_number, cells in enumerate(reader, 1):
+        cells = [cell.strip() for cell in cells]
+        if not cells or not cells[0] or cells[0].startswith('#'):
+            continue
+        # skip the header row
+        if line_number == 1 and cells[0].lower() in ('link', 'url', 'channel'):
+            continue
+
+        raw_link = cells[0]
+        rows.append({
+            'line': line_number,
+            'link': raw_link,
+            'identifier': parse_username_from_text(raw_link),
+            'name': cells[1] if len(cells) > 1 and cells[1] else None,
+            'category': cells[2] if len(cells) > 2 and cells[2] else None,
+        })
+    return rows
+
+def _make_result(row, status, detail='', channel_id=None):
+    return {
+        'line': row['line'],
+        'link': row['link'],
+        'status': status,
+        'detail': detail,
+        'channel_id': channel_id,
+    }
+
+def _prepare_rows(rows, default_category_id):
+    """
+    Validate rows against the DB: categories, existing links and duplicates.
+    Returns rows to import and results for rejected rows.
+    """
+    from admin_panel.models import Category, Channel
+
+    categories = list(Category.objects.all().only('id', 'name'))
+    categories_by_id = {str(category.id): category.id for category in categories}
+    categories_by_name = {category.name.lower(): category.id for category in categories}
+
+    results = []
+    pending = []
+    seen = set()
+    for row in rows:
+        if not row['identifier']:
+            results.append(_make_result(row, STATUS_INVALID, 'Not a Telegram link'))
+            continue
+
+        category_id = default_category_id
+        if row['category']:
+            category_id = categories_by_id.get(row['category']) or categories_by_name.get(row['category'].lower())
+        if not category_id:
+            results.append(_make_result(row, STATUS_INVALID, f"Unknown category '{row['category'] or ''}'"))
+            continue
+
+        row['url'] = normalize_link(row['identifier'])
+        row['key'] = _identifier_key(row['identifier'])
+        row['category_id'] = category_id
+        if row['key'] in seen:
+            results.append(_make_result(row, STATUS_DUPLICATE, 'Repeated in the file'))
+            continue
+        seen.add(row['key'])
+        pending.append(row)
+
+    # the stored urls were typed in by hand in any form, so they are compared by key
+    existing = {}
+    if pending:
+        for channel_id, url in Channel.objects.order_by('id').values_list('id', 'url'):
+            existing.setdefault(channel_key(url), channel_id)
+
+    to_import = []
+    for row in pending:
+        if row['key'] in existing:
+            results.append(_make_result(row, STATUS_EXISTS, 'Channel already added', existing[row['key']]))
+        else:
+            to_import.append(row)
+    return to_import, results
+
+def _bulk_create_channels(rows, session_id):
+    from admin_panel.models import Channel
+
+    channels = [
+        Channel(
+            name=row['name'] or row['identifier'],
+            url=row['url'],
+            category_id=row['category_id'],
+            session_id=session_id,
+            is_active=True,
+        )
+        for row in rows
+    ]
+    created = Channel.objects.bulk_create(channels, batch_size=500)
+    logger.info(f"Imported {len(created)} channels")
+    return created
+
+prepare_rows = sync_to_async(_prepare_rows)
+bulk_create_channels = sync_to_async(_bulk_create_channels)
+
+async def resolve_rows(client, rows, concurrency=IMPORT_CONCURRENCY, rate=IMPORT_RATE_LIMIT):
+    """
+    Resolve public usernames concurrently, filling in the channel title as the name.
+    Invite and private links can't be resolved without joining and are kept as is.
+    Returns the rows that turned out to be invalid, with their error message.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate)
+    invalid = []
+    state = {'flood_until': 0}
+
+    async def resolve(row):
+        identifier = row['identifier']
+        if '/' in identifier:
+            row['detail'] = 'Private link, not resolved'
+            return
+        async with semaphore:
+            if state['flood_until']:
+                row['detail'] = 'Not resolved (flood wait)'
+                return
+            for attempt in range(2):
+                await limiter.acquire()
+                try:
+                    entity = await client.get_entity(identifier)
+                    if not row['name']:
+                        row['name'] = getattr(entity, 'title', None) or getattr(entity, 'username', None)
+                    return
+                except errors.FloodWaitError as e:
+                    if e.seconds > IMPORT_MAX_FLOOD_WAIT or attempt:
+                        logger.warning(f"Flood wait of {e.seconds}s while resolving channels, resolving stopped")
+                        state['flood_until'] = e.seconds
+                        row['detail'] = 'Not resolved (flood wait)'
+                        return
+                    limiter.pause(e.seconds)
+                except (errors.UsernameNotOccupiedError, errors.UsernameInvalidError, ValueError) as e:
+                    invalid.append((row, f"Channel not found: {e}"))
+                    return
+                except Exception as e:
+                    logger.error(f"Error resolving {identifier}: {e}")
+                    row['detail'] = f"Not resolved: {e}"
+                    return
+
+    await asyncio.gather(*(resolve(row) for row in rows))
+    return invalid
+
+async def import_channels(text, default_category_id=None, session_id=None, client=None,
+                          concurrency=IMPORT_CONCURRENCY, rate=IMPORT_RATE_LIMIT):
+    """
+    Import channels from the text of a CSV / links file.
+
+    Args:
+        text: file content
+        default_category_id: category for rows that don't specify one
+        session_id: TelegramSession to link the new channels to (optional)
+        client: connected Telethon client used to resolve the links (optional)
+
+    Returns:
+        list of per-row result dicts ordered by line
+    """
+    rows = parse_import_text(text)
+    to_import, results = await prepare_rows(rows, default_category_id)
+
+    if client and to_import:
+        invalid = await resolve_rows(client, to_import, concurrency, rate)
+        invalid_lines = {row['line'] for row, _ in invalid}
+        results.extend(_make_result(row, STATUS_INVALID, detail) for row, detail in invalid)
+        to_import = [row for row in to_import if row['line'] not in invalid_lines]
+
+    if to_import:
+        try:
+            created = await bulk_create_channels(to_import, session_id)
+            for row, channel in zip(to_import, created):
+                results.append(_make_result(row, STATUS_CREATED, row.get('detail', ''), channel.pk))
+        except Exception as e:
+            logger.error(f"Error saving imported channels: {e}")
+            results.extend(_make_result(row, STATUS_ERROR, str(e)) for row in to_import)
+
+    return sorted(results, key=lambda result: result['line'])
+
+def summarize_results(results):
+    """Count the results by status"""
+    summary = {}
+    for result in results:
+        summary[result['status']] = summary.get(result['status'], 0) + 1
+    return summary
+
+def results_to_csv(results):
+    """Render the per-link results as CSV text"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['line', 'link', 'status', 'channel_id', 'detail'])
+    for result in results:
+        writer.writerow([result['line'], result['link'], result['status'], result['channel_id'] or '', result['detail']])
+    return output.getvalue()
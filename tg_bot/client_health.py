@@ -0,0 +1,81 @@
+"""
+Circuit breakers for the parser clients.
+
+The health supervisor pings every client and reconnects dropped ones. A
+session that keeps failing gets its breaker opened: select_client skips it
+(public channels are rerouted, private ones fail fast) until the open period
+ends. After that one probe decides whether it closes again or reopens for
+longer. The open periods use exponential backoff with jitter, so sessions that
+failed together don't all reconnect at the same moment.
+"""
+import time
+import random
+import logging
+
+logger = logging.getLogger('client_health')
+
+BREAKER_THRESHOLD = 3  # consecutive failures that open the breaker
+BACKOFF_BASE = 30  # seconds of the first open period
+BACKOFF_MAX = 1800  # longest open period
+
+class CircuitBreaker:
+    def __init__(self):
+        self.failures = 0
+        self.opened = 0
+        self.open_until = 0
+
+    @property
+    def state(self):
+        if self.failures < BREAKER_THRESHOLD:
+            return 'closed'
+        return 'open' if time.time() < self.open_until else 'half-open'
+
+    def record_success(self):
+        self.failures = 0
+        self.opened = 0
+        self.open_until = 0
+
+    def record_failure(self):
+        """Count a failure, returns the open period in seconds if the breaker opened"""
+        self.failures += 1
+        if self.failures < BREAKER_THRESHOLD:
+            return None
+        self.opened += 1
+        # ±50% jitter, kept within BACKOFF_BASE..BACKOFF_MAX
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.opened - 1))
+        delay = random.uniform(max(BACKOFF_BASE, delay * 0.5), min(BACKOFF_MAX, delay * 1.5))
+        self.open_until = time.time() + delay
+        return delay
+
+class BreakerRegistry:
+    """Breakers by session id, None is the default client"""
+    def __init__(self):
+        self._breakers = {}
+
+    def get(self, session_id):
+        if session_id not in self._breakers:
+            self._breakers[session_id] = CircuitBreaker()
+        return self._breakers[session_id]
+
+    def is_open(self, session_id):
+        breaker = self._breakers.get(session_id)
+        return bool(breaker) and breaker.state == 'open'
+
+    def record_success(self, session_id):
+        breaker = self._breakers.get(session_id)
+        if breaker and breaker.failures:
+            logger.info(f"Session {session_id or 'default'} is healthy again")
+            breaker.record_success()
+
+    def record_failure(self, session_id, reason=''):
+        delay = self.get(session_id).record_failure()
+        if delay:
+            logger.warning(f"Circuit opened for session {session_id or 'default'} for {int(delay)}s: {reason}")
+        else:
+            logger.warning(f"Session {session_id or 'default'} failed a health check: {reason}")
+        return delay
+
+    def forget(self, session_id):
+        self._breakers.pop(session_id, None)
+
+breakers = BreakerRegistry()
@@ -61,3 +61,37 @@ ADMIN_PASSWORD = 'Remoreid19976'  # Пароль админа для входа
 BASE_DIR = os.path.dirname(__file__) # Добавили
 DATA_FOLDER = os.path.join(BASE_DIR, 'data') # Добавили
 MESSAGES_FOLDER = os.path.join(DATA_FOLDER, 'messages') # Добавили
+
+# Розсилка повідомлень підписникам
+DELIVERY_RATE_LIMIT = float(os.environ.get('DELIVERY_RATE_LIMIT', 25))  # messages per second for the whole bot
+DELIVERY_BATCH_SIZE = int(os.environ.get('DELIVERY_BATCH_SIZE', 25))  # concurrent sends per batch
+DELIVERY_MAX_SECONDS = int(os.environ.get('DELIVERY_MAX_SECONDS', 900))  # upper bound for one post fan-out
+DELIVERY_INDEX_REFRESH = int(os.environ.get('DELIVERY_INDEX_REFRESH', 30))  # seconds between subscription index checks
+DELIVERY_OUTBOX_BATCH_SIZE = int(os.environ.get('DELIVERY_OUTBOX_BATCH_SIZE', 20))  # outbox records read by delivery at once
+
+# Розподіл каналів між сесіями
+BALANCER_INTERVAL = int(os.environ.get('BALANCER_INTERVAL', 600))  # seconds between rebalances
+BALANCER_WINDOW_HOURS = int(os.environ.get('BALANCER_WINDOW_HOURS', 24))  # history used to estimate channel load
+
+# Адаптивне опитування каналів
+POLL_MIN_INTERVAL = int(os.environ.get('POLL_MIN_INTERVAL', 15))  # seconds, busy channels and right after a new post
+POLL_MAX_INTERVAL = int(os.environ.get('POLL_MAX_INTERVAL', 1800))  # seconds, dormant channels
+POLL_CHANNEL_DELAY = float(os.environ.get('POLL_CHANNEL_DELAY', 5))  # seconds between two polls of one session
+CLIENT_INIT_DEADLINE = int(os.environ.get('CLIENT_INIT_DEADLINE', 120))  # seconds for all sessions to connect at start
+SESSION_FLUSH_INTERVAL = int(os.environ.get('SESSION_FLUSH_INTERVAL', 300))  # seconds between session string write-backs
+SESSION_RELOAD_INTERVAL = int(os.environ.get('SESSION_RELOAD_INTERVAL', 15))  # seconds between checks for session changes
+HEALTH_CHECK_INTERVAL = int(os.environ.get('HEALTH_CHECK_INTERVAL', 60))  # seconds between client health checks
+PARSER_WORKERS = int(os.environ.get('PARSER_WORKERS', 1))  # parser processes, sessions and channels are sharded between them
+PARSER_SHARDS = int(os.environ.get('PARSER_SHARDS', PARSER_WORKERS))  # shards shared by the parser processes of all nodes
+PARSER_LEASE_TTL = int(os.environ.get('PARSER_LEASE_TTL', 60))  # seconds before a dead parser's shard is taken over
+
+# Outbox між парсером і обробником повідомлень
+OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE', 100))  # records read by a consumer at once
+OUTBOX_RETENTION_HOURS = int(os.environ.get('OUTBOX_RETENTION_HOURS', 72))  # processed records are kept this long
+OUTBOX_GAP_TIMEOUT = int(os.environ.get('OUTBOX_GAP_TIMEOUT', 60))  # seconds a missing record id is waited for
+PROCESSOR_LAG_REPORT_INTERVAL = int(os.environ.get('PROCESSOR_LAG_REPORT_INTERVAL', 60))  # seconds between outbox lag reports
+PROCESSOR_LAG_WARNING = int(os.environ.get('PROCESSOR_LAG_WARNING', 300))  # seconds of lag logged as a warning
+DEDUP_WINDOW_HOURS = int(os.environ.get('DEDUP_WINDOW_HOURS', 72))  # reposts older than this are not matched
+DEDUP_MIN_SIMILARITY = float(os.environ.get('DEDUP_MIN_SIMILARITY', 0.6))  # shingle overlap (Jaccard) of a duplicate
+HEARTBEAT_INTERVAL = int(os.environ.get('HEARTBEAT_INTERVAL', 15))  # seconds between status heartbeats of the services
+CATALOG_CACHE_TTL = int(os.environ.get('CATALOG_CACHE_TTL', 300))  # seconds the bot caches category and channel lists
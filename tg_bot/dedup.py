@@ -0,0 +1,226 @@
+"""
+Near-duplicate detection of posts reposted across channels.
+
+Every message gets a MinHash signature of the word shingles of its text and a
+SHA-1 of its media file. Two texts are duplicates when the share of equal
+signature slots (an estimate of the Jaccard similarity of their shingles) is
+at least DEDUP_MIN_SIMILARITY. The signature is cut into LSH bands, so only
+messages that agree on a whole band are compared at all. The same media file
+makes a duplicate on its own only when one of the posts has too little text
+to compare, channels put the same header or logo on unrelated posts.
+
+The index lives in the message processor's memory and holds the canonical
+messages of the last DEDUP_WINDOW_HOURS, it is loaded from the DB at start.
+A duplicate is linked to its canonical message with Message.duplicate_of and
+counted in the canonical's duplicate_count. collapse_duplicates() hides the
+reposts whose canonical message is shown in the same feed.
+"""
+import os
+import re
+import random
+import hashlib
+import logging
+from array import array
+from collections import deque
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from tg_bot.config import DEDUP_WINDOW_HOURS, DEDUP_MIN_SIMILARITY
+
+logger = logging.getLogger('dedup')
+
+NUM_PERM = 64  # signature slots
+BANDS = 16  # LSH bands of NUM_PERM // BANDS slots, catch pairs from ~0.5 similarity
+SHINGLE_SIZE = 2  # words per shingle
+MIN_WORDS = 8  # shorter texts are matched by media only
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+LINK_RE = re.compile(r'(?:https?://|www\.)\S+|@\w+', re.IGNORECASE)
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+_rng = random.Random(1)  # fixed seed, signatures stored in the DB must stay comparable
+PERMUTATIONS = [(_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+DEDUP_FIELDS = ['minhash', 'media_hash', 'duplicate_of']
+
+def _shingle_hash(shingle):
+    return int.from_bytes(hashlib.md5(shingle.encode('utf-8')).digest()[:4], 'big')
+
+def shingles(text):
+    # links and mentions differ between reposts of the same post
+    words = WORD_RE.findall(LINK_RE.sub(' ', text or '').lower())
+    if len(words) < MIN_WORDS:
+        return set()
+    return {' '.join(words[index:index + SHINGLE_SIZE]) for index in range(len(words) - SHINGLE_SIZE + 1)}
+
+def minhash(text):
+    """MinHash signature of the text as NUM_PERM 32-bit values, None for texts too short to compare"""
+    hashes = [_shingle_hash(shingle) for shingle in shingles(text)]
+    if not hashes:
+        return None
+    return array('I', (
+        min((a * value + b) % MERSENNE_PRIME & MAX_HASH for value in hashes)
+        for a, b in PERMUTATIONS
+    ))
+
+def to_bytes(signature):
+    return signature.tobytes() if signature is not None else None
+
+def from_bytes(data):
+    if not data:
+        return None
+    signature = array('I')
+    signature.frombytes(bytes(data))
+    return signature
+
+def similarity(first, second):
+    """Estimated Jaccard similarity of the shingles behind two signatures"""
+    return sum(1 for left, right in zip(first, second) if left == right) / NUM_PERM
+
+def media_hash(message):
+    """SHA-1 of the downloaded media file of a Message, '' without a file"""
+    name = str(message.media or '')
+    if not name:
+        return ''
+    for path in (os.path.join(settings.MEDIA_ROOT, name), os.path.join(settings.BASE_DIR, name)):
+        if os.path.isfile(path):
+            digest = hashlib.sha1()
+            with open(path, 'rb') as media_file:
+                for chunk in iter(lambda: media_file.read(1 << 16), b''):
+                    digest.update(chunk)
+            return digest.hexdigest()
+    return ''
+
+class LSHIndex:
+    """Band buckets of the signatures and media hashes of canonical messages in the window"""
+    def __init__(self, min_similarity=DEDUP_MIN_SIMILARITY, window_hours=DEDUP_WINDOW_HOURS):
+        self.min_similarity = min_similarity
+        self.window = timedelta(hours=window_hours)
+        self.rows = NUM_PERM // BANDS
+        self.buckets = [{} for _ in range(BANDS)]
+        self.signatures = {}  # message id -> signature
+        self.media = {}  # media hash -> message ids, oldest first
+        self.media_of = {}  # message id -> media hash
+        self.added = deque()  # (created_at, message id) in insertion order, for eviction
+
+    def _band_keys(self, signature):
+        return [tuple(signature[band * self.rows:(band + 1) * self.rows]) for band in range(BANDS)]
+
+    def __len__(self):
+        return len(self.added)
+
+    def add(self, message_id, signature, media, created_at):
+        if signature is not None:
+            self.signatures[message_id] = signature
+            for band, key in enumerate(self._band_keys(signature)):
+                self.buckets[band].setdefault(key, set()).add(message_id)
+        if media:
+            self.media.setdefault(media, []).append(message_id)
+            self.media_of[message_id] = media
+        self.added.append((created_at, message_id))
+
+    def remove(self, message_id):
+        signature = self.signatures.pop(message_id, None)
+        if signature is not None:
+            for band, key in enumerate(self._band_keys(signature)):
+                bucket = self.buckets[band].get(key)
+                if bucket:
+                    bucket.discard(message_id)
+                    if not bucket:
+                        del self.buckets[band][key]
+        media = self.media_of.pop(message_id, None)
+        if media and message_id in self.media.get(media, ()):
+            self.media[media].remove(message_id)
+            if not self.media[media]:
+                del self.media[media]
+
+    def evict(self, now=None):
+        """Drop messages that left the window"""
+        cutoff = (now or timezone.now()) - self.window
+        while self.added and self.added[0][0] < cutoff:
+            _, message_id = self.added.popleft()
+            self.remove(message_id)
+
+    def find(self, signature, media=''):
+        """Id of the canonical message with the same media or a similar text, or None"""
+        for candidate in self.media.get(media, ()) if media else ():
+            other = self.signatures.get(candidate)
+            # a shared image is not enough when both posts have text to compare
+            if signature is None or other is None or similarity(signature, other) >= self.min_similarity:
+                return candidate
+        if signature is None:
+            return None
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self.buckets[band].get(key, ()))
+        best = None  # (-similarity, message id), the most similar and then the oldest wins
+        for candidate in candidates:
+            score = similarity(signature, self.signatures[candidate])
+            if score >= self.min_similarity and (best is None or (-score, candidate) < best):
+                best = (-score, candidate)
+        return best[1] if best else None
+
+def collapse_duplicates(messages, filtered=True):
+    """
+    Hide the reposts whose canonical message is in the queryset as well. A
+    repost whose canonical message was filtered out (another category or
+    session) stays, it stands for the post there. Without filters every
+    canonical message is in the set, the indexed duplicate_of IS NULL does it.
+    """
+    if not filtered:
+        return messages.filter(duplicate_of__isnull=True)
+    return messages.exclude(duplicate_of__in=messages.order_by().values('id'))
+
+class Deduplicator:
+    """Dedup stage of the message processor, keeps the LSH index of the window"""
+    def __init__(self, min_similarity=DEDUP_MIN_SIMILARITY, window_hours=DEDUP_WINDOW_HOURS):
+        self.index = LSHIndex(min_similarity, window_hours)
+
+    def load(self):
+        """Fill the index with the canonical messages of the window from the DB"""
+        from admin_panel.models import Message
+
+        since = timezone.now() - self.index.window
+        messages = (
+            Message.objects.filter(created_at__gte=since, duplicate_of__isnull=True)
+            .order_by('created_at', 'id')
+            .only('id', 'text', 'minhash', 'media_hash', 'created_at')
+        )
+        for message in messages.iterator(chunk_size=2000):
+            # messages saved before the dedup stage have no signature yet
+            signature = from_bytes(message.minhash) if message.minhash else minhash(message.text)
+            self.index.add(message.id, signature, message.media_hash, message.created_at)
+        logger.info(f"Dedup index loaded with {len(self.index)} message(s) of the last {self.index.window}")
+
+    def assign(self, messages):
+        """
+        Set minhash, media_hash and duplicate_of on the messages of a batch,
+        does not save them. Returns {canonical id: number of new duplicates}
+        """
+        self.index.evict()
+        new_duplicates = {}
+        for message in sorted(messages, key=lambda message: message.id):
+            signature = minhash(message.text)
+            message.minhash = to_bytes(signature)
+            message.media_hash = media_hash(message)
+            canonical_id = self.index.find(signature, message.media_hash)
+            if canonical_id and canonical_id != message.id:
+                # a redelivered outbox record must not count the same repost twice
+                if message.duplicate_of_id != canonical_id:
+                    new_duplicates[canonical_id] = new_duplicates.get(canonical_id, 0) + 1
+                message.duplicate_of_id = canonical_id
+            else:
+                message.duplicate_of_id = None
+                # a retried batch brings its canonical messages again, the index has them
+                if message.id not in self.index.signatures and message.id not in self.index.media_of:
+                    self.index.add(message.id, signature, message.media_hash, message.created_at)
+        return new_duplicates
+
+    def count_duplicates(self, new_duplicates):
+        from admin_panel.models import Message
+
+        for canonical_id, count in new_duplicates.items():
+            Message.objects.filter(id=canonical_id).update(duplicate_count=F('duplicate_count') + count)
@@ -0,0 +1,361 @@
+"""
+Fan-out delivery of parsed messages to the bot users subscribed to a category.
+
+The parser writes every new message to the outbox together with its
+category_id. DeliveryService reads the outbox with its own consumer offset,
+keeps an in-memory index of subscribers and sends the post to all of them
+through a single rate-limited aiogram Bot.
+"""
+import os
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from aiogram import Bot
+from aiogram.types import FSInputFile
+from aiogram.exceptions import TelegramRetryAfter, TelegramForbiddenError, TelegramBadRequest
+
+from tg_bot.config import (
+    TOKEN_BOT, DELIVERY_RATE_LIMIT, DELIVERY_BATCH_SIZE, DELIVERY_OUTBOX_BATCH_SIZE,
+    DELIVERY_MAX_SECONDS, DELIVERY_INDEX_REFRESH
+)
+
+logger = logging.getLogger('delivery')
+
+# Telegram limits for a single message
+MAX_TEXT_LENGTH = 4096
+MAX_CAPTION_LENGTH = 1024
+MAX_SEND_ATTEMPTS = 3
+
+class SubscriptionIndex:
+    """
+    In-memory category_id -> chat ids index.
+    The index is rebuilt only when the subscriptions table has changed.
+    """
+    def __init__(self, refresh_interval=DELIVERY_INDEX_REFRESH):
+        self.refresh_interval = refresh_interval
+        self._index = {}
+        self._version = None
+        self._checked_at = 0
+
+    def refresh(self, force=False):
+        """Reload the index from the DB if the subscriptions have changed"""
+        from admin_panel.models import Subscription
+
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.refresh_interval:
+            return False
+        self._checked_at = now
+
+        state = Subscription.objects.aggregate(
+            count=Count('id'), active=Count('id', filter=Q(is_active=True)), last_update=Max('updated_at'),
+        )
+        version = (state['count'], state['active'], state['last_update'])
+        if not force and version == self._version:
+            return False
+
+        index = defaultdict(set)
+        rows = Subscription.objects.filter(is_active=True).values_list('category_id', 'chat_id')
+        for category_id, chat_id in rows.iterator():
+            index[category_id].add(chat_id)
+
+        self._index = {category_id: frozenset(chat_ids) for category_id, chat_ids in index.items()}
+        self._version = version
+        logger.info(f"Subscription index loaded: {sum(len(c) for c in self._index.values())} subscriptions in {len(self._index)} categories")
+        return True
+
+    def subscribers(self, category_id):
+        return self._index.get(category_id, frozenset())
+
+    def discard(self, chat_id):
+        """Drop a chat from every category (e.g. the user has blocked the bot)"""
+        self._index = {
+            category_id: chat_ids - {chat_id}
+            for category_id, chat_ids in self._index.items()
+        }
+
+class RateLimiter:
+    """Token bucket shared by all sends of one bot token"""
+    def __init__(self, rate=DELIVERY_RATE_LIMIT, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds):
+        """Stop all sends for `seconds` (Telegram asked us to retry later)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+def _truncate(text, limit):
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1] + "…"
+
+def build_post(message_info):
+    """
+    Build the text and the media of a post from the queued message_info.
+    A message carries at most one media file, so a post has at most one.
+    """
+    channel_name = message_info.get('channel_name') or ''
+    text = message_info.get('text') or ''
+    link = message_info.get('link') or ''
+    body = "\n\n".join(part for part in (f"📢 {channel_name}" if channel_name else '', text, link) if part)
+
+    media = []
+    media_path = message_info.get('media')
+    media_type = message_info.get('media_type')
+    if media_path and media_type in ('photo', 'image', 'video', 'gif', 'document'):
+        full_path = media_path if os.path.isabs(media_path) else os.path.join(settings.BASE_DIR, media_path)
+        if os.path.exists(full_path):
+            media.append({'path': full_path, 'type': media_type})
+        else:
+            logger.warning(f"Media file for delivery not found: {full_path}")
+
+    return {'text': body, 'media': media}
+
+def _extract_file_id(sent, media_type):
+    """Get the Telegram file_id of the media in a sent message"""
+    if sent is None:
+        return None
+    if media_type in ('photo', 'image') and sent.photo:
+        return sent.photo[-1].file_id
+    if media_type == 'video' and sent.video:
+        return sent.video.file_id
+    if media_type == 'gif' and sent.animation:
+        return sent.animation.file_id
+    if sent.document:
+        return sent.document.file_id
+    return None
+
+class FanoutEngine:
+    """
+    Sends one post to all subscribers of its category in rate-limited batches.
+    The media is uploaded once, every next send reuses its Telegram file_id.
+    """
+    def __init__(self, bot, index, rate=DELIVERY_RATE_LIMIT, batch_size=DELIVERY_BATCH_SIZE,
+                 max_seconds=DELIVERY_MAX_SECONDS):
+        self.bot = bot
+        self.index = index
+        self.limiter = RateLimiter(rate)
+        self.batch_size = batch_size
+        self.max_seconds = max_seconds
+        self.file_ids = {}
+
+    def _input_file(self, item):
+        return self.file_ids.get(item['path']) or FSInputFile(item['path'])
+
+    def _remember_file_ids(self, media, sent):
+        if media:
+            file_id = _extract_file_id(sent, media[0]['type'])
+            if file_id:
+                self.file_ids[media[0]['path']] = file_id
+
+    async def _send_post(self, chat_id, post):
+        text = post['text']
+        media = post['media']
+
+        if not media:
+            return await self.bot.send_message(chat_id, _truncate(text, MAX_TEXT_LENGTH),
+                                               disable_web_page_preview=True)
+
+        caption = _truncate(text, MAX_CAPTION_LENGTH)
+        item = media[0]
+        file = self._input_file(item)
+        if item['type'] in ('photo', 'image'):
+            return await self.bot.send_photo(chat_id, file, caption=caption)
+        if item['type'] == 'video':
+            return await self.bot.send_video(chat_id, file, caption=caption)
+        if item['type'] == 'gif':
+            return await self.bot.send_animation(chat_id, file, caption=caption)
+        return await self.bot.send_document(chat_id, file, caption=caption)
+
+    async def _send(self, chat_id, post):
+        """Send a post to one chat, returns True on success"""
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            await self.limiter.acquire()
+            try:
+                sent = await self._send_post(chat_id, post)
+                self._remember_file_ids(post['media'], sent)
+                return True
+            except TelegramRetryAfter as e:
+                logger.warning(f"Flood control on delivery, pausing for {e.retry_after}s")
+                self.limiter.pause(e.retry_after)
+            except TelegramForbiddenError:
+                logger.info(f"Chat {chat_id} has blocked the bot, disabling its subscriptions")
+                self.index.discard(chat_id)
+                await deactivate_chat_subscriptions(chat_id)
+                return False
+            except TelegramBadRequest as e:
+                logger.error(f"Bad request while delivering to chat {chat_id}: {e}")
+                return False
+            except Exception as e:
+                logger.error(f"Error delivering to chat {chat_id} (attempt {attempt}/{MAX_SEND_ATTEMPTS}): {e}")
+                await asyncio.sleep(attempt)
+        return False
+
+    async def deliver(self, item):
+        """Fan out one queued message to the subscribers of its category"""
+        category_id = item.get('category_id')
+        message_info = item.get('message_info') or {}
+        if not category_id:
+            return
+
+        await sync_to_async(self.index.refresh)()
+        chat_ids = list(self.index.subscribers(category_id))
+        if not chat_ids:
+            logger.debug(f"No subscribers for category {category_id}")
+            return
+
+        post = build_post(message_info)
+        started = time.monotonic()
+        sent = failed = 0
+
+        # the first send uploads the media, the rest reuse its file_id
+        position = 0
+        while position < len(chat_ids) and post['media'] and not all(m['path'] in self.file_ids for m in post['media']):
+            if time.monotonic() - started > self.max_seconds:
+                break
+            if await self._send(chat_ids[position], post):
+                sent += 1
+            else:
+                failed += 1
+            position += 1
+
+        for start in range(position, len(chat_ids), self.batch_size):
+            if time.monotonic() - started > self.max_seconds:
+                skipped = len(chat_ids) - start
+                logger.error(f"Delivery of message {message_info.get('message_id')} exceeded {self.max_seconds}s, skipped {skipped} chats")
+                failed += skipped
+                break
+            batch = chat_ids[start:start + self.batch_size]
+            results = await asyncio.gather(*(self._send(chat_id, post) for chat_id in batch))
+            sent += sum(1 for result in results if result)
+            failed += sum(1 for result in results if not result)
+
+        for item_media in post['media']:
+            self.file_ids.pop(item_media['path'], None)
+
+        elapsed = time.monotonic() - started
+        logger.info(f"Delivered message {message_info.get('message_id')} from '{message_info.get('channel_name')}' "
+                    f"to {sent}/{len(chat_ids)} subscribers in {elapsed:.1f}s ({failed} failed)")
+
+@sync_to_async
+def deactivate_chat_subscriptions(chat_id):
+    from admin_panel.models import Subscription
+    # update() skips auto_now, the subscription index notices changes by updated_at
+    return Subscription.objects.filter(chat_id=chat_id, is_active=True).update(is_active=False, updated_at=timezone.now())
+
+class DeliveryService:
+    """
+    Reads the outbox with its own consumer offset and fans every record out,
+    on its own event loop in a background thread. The offset moves after each
+    delivered message, so a restart resends at most the message in progress.
+    Delivery and the message processor lag and fail independently: a slow
+    fan-out doesn't hold up ingestion and a failing one only retries itself.
+    """
+    consumer_name = 'delivery'
+
+    def __init__(self, token=None, batch_size=DELIVERY_OUTBOX_BATCH_SIZE):
+        self.token = token or os.environ.get('BOT_TOKEN') or TOKEN_BOT
+        self.batch_size = batch_size
+        self.loop = None
+        self.thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='delivery', daemon=True)
+        self.thread.start()
+        logger.info("Delivery service started")
+
+    def stop(self):
+        self._stop.set()
+        if self.thread:
+            self.thread.join(timeout=10)
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._worker())
+        except Exception as e:
+            logger.error(f"Delivery service crashed: {e}")
+            logger.error(traceback.format_exc())
+        finally:
+            self.loop.close()
+
+    async def _sleep(self, seconds):
+        """Sleep, cut short by stop()"""
+        await sync_to_async(self._stop.wait, thread_sensitive=False)(seconds)
+
+    async def _deliver_batch(self, consumer, engine):
+        records = await sync_to_async(consumer.read_batch)(self.batch_size)
+        for record in records:
+            if self._stop.is_set():
+                break
+            await engine.deliver({'message_info': record.payload, 'category_id': record.category_id})
+            await sync_to_async(consumer.commit)([record])
+        return len(records)
+
+    async def _worker(self):
+        from tg_bot.outbox import OutboxConsumer
+        from tg_bot.heartbeat import Heartbeat
+
+        bot = Bot(token=self.token)
+        engine = FanoutEngine(bot, SubscriptionIndex())
+        heartbeat = Heartbeat(self.consumer_name, 'delivery')
+        heartbeat_task = asyncio.create_task(heartbeat.run())
+        consumer = None
+        restart_delay = 5  # seconds, doubled after every failure up to a minute
+        try:
+            while not self._stop.is_set():
+                try:
+                    if consumer is None:
+                        consumer = await sync_to_async(OutboxConsumer)(self.consumer_name)
+                        logger.info(f"Delivering the outbox from record {consumer.position}")
+                    started = time.monotonic()
+                    delivered = await self._deliver_batch(consumer, engine)
+                    if not delivered:
+                        await self._sleep(1)
+                        continue
+                    heartbeat.record_cycle(time.monotonic() - started)
+                    heartbeat.record_messages(delivered)
+                    restart_delay = 5
+                except Exception as e:
+                    # the offset stays, the undelivered records are read again
+                    logger.error(f"Error delivering the outbox: {e}")
+                    logger.error(traceback.format_exc())
+                    heartbeat.record_error(e)
+                    await self._sleep(restart_delay)
+                    restart_delay = min(restart_delay * 2, 60)
+        finally:
+            heartbeat_task.cancel()
+            try:
+                await heartbeat.astop()
+            except Exception as e:
+                logger.error(f"Error writing the last delivery heartbeat: {e}")
+            await bot.session.close()
@@ -0,0 +1,103 @@
+"""
+Post-ingest enrichment of saved messages.
+
+The message processor passes every outbox batch through enrich_batch: the
+language is detected, then all messages of the batch are written with one
+bulk_update. The hashtags, mentions and links are not stored here, the
+parser writes them to the MessageEntity index (tg_bot/entity_index.py) when
+it saves the message; the extract_* helpers are its fallback for messages
+without Telegram entities.
+Language detection is a small heuristic over the alphabet and common words
+for the languages the channels are in (uk, ru, en), no extra dependency.
+Reposts are linked to their canonical message by the dedup stage in the
+same pass.
+"""
+import re
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from tg_bot.dedup import DEDUP_FIELDS
+
+logger = logging.getLogger('enrichment')
+
+LINK_RE = re.compile(r'(?:https?://|www\.|(?<![\w.])t\.me/)[^\s<>"\'«»]+', re.IGNORECASE)
+HASHTAG_RE = re.compile(r'(?<![\w#])#(\w{1,64})')
+MENTION_RE = re.compile(r'(?<![\w.@/])@([A-Za-z]\w{3,31})')
+TRAILING_PUNCTUATION = '.,;:!?)]}…'
+
+WORD_RE = re.compile(r'[^\W\d_]+')
+UK_LETTERS = set('іїєґ')
+RU_LETTERS = set('ыэёъ')
+UK_WORDS = {'і', 'й', 'та', 'що', 'це', 'як', 'від', 'для', 'про', 'але', 'або', 'вже', 'був', 'буде', 'його', 'які', 'цей', 'ще'}
+RU_WORDS = {'и', 'что', 'это', 'как', 'от', 'для', 'про', 'но', 'или', 'уже', 'был', 'будет', 'его', 'которые', 'этот', 'еще', 'не', 'на'}
+MIN_LETTERS = 12  # shorter texts get no language
+
+ENRICHED_FIELDS = ['language', 'enriched_at']
+
+def _unique(values):
+    return list(dict.fromkeys(values))
+
+def extract_links(text):
+    return _unique(match.rstrip(TRAILING_PUNCTUATION) for match in LINK_RE.findall(text or ''))
+
+def extract_hashtags(text):
+    return _unique(tag.lower() for tag in HASHTAG_RE.findall(text or ''))
+
+def extract_mentions(text):
+    return _unique(username.lower() for username in MENTION_RE.findall(text or ''))
+
+def detect_language(text):
+    """'uk', 'ru', 'en' or None when the text is too short or in another script"""
+    words = [word.lower() for word in WORD_RE.findall(LINK_RE.sub(' ', text or ''))]
+    letters = ''.join(words)
+    if len(letters) < MIN_LETTERS:
+        return None
+
+    cyrillic = sum(1 for char in letters if 'Ѐ' <= char <= 'ӿ')
+    latin = sum(1 for char in letters if 'a' <= char <= 'z')
+    if cyrillic < latin:
+        return 'en' if latin > len(letters) / 2 else None
+
+    uk_score = sum(1 for char in letters if char in UK_LETTERS) * 2 + sum(1 for word in words if word in UK_WORDS)
+    ru_score = sum(1 for char in letters if char in RU_LETTERS) * 2 + sum(1 for word in words if word in RU_WORDS)
+    if uk_score == ru_score:
+        return None
+    return 'uk' if uk_score > ru_score else 'ru'
+
+def enrich(message):
+    """Set the enrichment fields on a Message, does not save it"""
+    message.language = detect_language(message.text)
+    message.enriched_at = timezone.now()
+    return message
+
+def enrich_batch(records, deduplicator=None):
+    """
+    Enrich the messages of a batch of outbox records with one query to load
+    them and one bulk_update to store the results, returns the number enriched.
+    With a deduplicator the duplicate links are written by the same update.
+    Errors are raised, the processor keeps its offset and retries the batch
+    """
+    from admin_panel.models import Message
+
+    message_ids = [record.message_id for record in records if record.message_id]
+    if not message_ids:
+        return 0
+
+    messages = Message.objects.filter(id__in=message_ids).only('id', 'text', 'media', 'created_at', 'duplicate_of')
+    enriched = [enrich(message) for message in messages]
+
+    fields = ENRICHED_FIELDS
+    new_duplicates = {}
+    if deduplicator:
+        new_duplicates = deduplicator.assign(enriched)
+        fields = ENRICHED_FIELDS + DEDUP_FIELDS
+
+    # the duplicate counts are written with the links they count, a retried
+    # batch finds neither and counts its reposts again
+    with transaction.atomic():
+        Message.objects.bulk_update(enriched, fields, batch_size=500)
+        if new_duplicates:
+            deduplicator.count_duplicates(new_duplicates)
+    return len(enriched)
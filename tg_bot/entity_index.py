@@ -0,0 +1,142 @@
+"""
+Index of the hashtags, mentions and URLs of messages.
+
+The parser takes them from Telethon's message.entities (with the text of
+each entity, so offsets in UTF-16 are handled by Telethon), including the
+hidden targets of text links, and passes them in message_info['entities']
+as [kind, value] pairs. _save_message_to_db writes them to MessageEntity
+with one bulk_create in the message's transaction. Lookups go through the
+(kind, value, message) and (domain, message) indexes and never scan the
+message text.
+"""
+import logging
+from urllib.parse import urlsplit, urlunsplit
+
+from telethon.tl.types import (
+    MessageEntityHashtag, MessageEntityMention, MessageEntityMentionName,
+    MessageEntityUrl, MessageEntityTextUrl,
+)
+
+from tg_bot.enrichment import extract_hashtags, extract_mentions, extract_links, TRAILING_PUNCTUATION
+
+logger = logging.getLogger('entity_index')
+
+HASHTAG = 'hashtag'
+MENTION = 'mention'
+URL = 'url'
+
+MAX_VALUE_LENGTH = 512
+
+def normalize_hashtag(tag):
+    return tag.lstrip('#').lower()
+
+def normalize_mention(username):
+    return username.lstrip('@').lower()
+
+def normalize_domain(domain):
+    domain = (domain or '').strip().lower().rstrip('.')
+    return domain[4:] if domain.startswith('www.') else domain
+
+def normalize_url(url):
+    """Scheme added when missing, host lowercased, fragment dropped"""
+    url = url.strip().rstrip(TRAILING_PUNCTUATION)
+    if '://' not in url:
+        url = f"https://{url}"
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+def url_domain(url):
+    try:
+        return normalize_domain(urlsplit(url).hostname)
+    except ValueError:
+        return ''
+
+def entities_from_message(message):
+    """[kind, value] pairs of a Telethon message, JSON friendly for the outbox"""
+    entities = []
+    for entity, text in message.get_entities_text():
+        if isinstance(entity, MessageEntityHashtag):
+            entities.append([HASHTAG, normalize_hashtag(text)])
+        elif isinstance(entity, MessageEntityMention):
+            entities.append([MENTION, normalize_mention(text)])
+        elif isinstance(entity, MessageEntityUrl):
+            entities.append([URL, normalize_url(text)])
+        elif isinstance(entity, MessageEntityTextUrl):
+            entities.append([URL, normalize_url(entity.url)])
+        elif isinstance(entity, MessageEntityMentionName):
+            # a user mentioned by name has no username, only the id is known
+            entities.append([MENTION, f"id{entity.user_id}"])
+    return entities
+
+def entities_from_text(text):
+    """Fallback for messages that came without Telethon entities"""
+    return (
+        [[HASHTAG, tag] for tag in extract_hashtags(text)]
+        + [[MENTION, username] for username in extract_mentions(text)]
+        + [[URL, normalize_url(link)] for link in extract_links(text)]
+    )
+
+def build_index(message, entities):
+    """Unsaved MessageEntity rows of the message, duplicates removed"""
+    from admin_panel.models import MessageEntity
+
+    rows = {}
+    for kind, value in entities:
+        value = (value or '')[:MAX_VALUE_LENGTH]
+        if not value or (kind, value) in rows:
+            continue
+        rows[(kind, value)] = MessageEntity(
+            message=message,
+            kind=kind,
+            value=value,
+            domain=url_domain(value) if kind == URL else '',
+        )
+    return list(rows.values())
+
+def index_message(message, entities=None):
+    """Write the index rows of a saved message, call inside its transaction"""
+    from admin_panel.models import MessageEntity
+
+    if entities is None:
+        entities = entities_from_text(message.text)
+    rows = build_index(message, entities)
+    if rows:
+        MessageEntity.objects.bulk_create(rows, ignore_conflicts=True)
+    return len(rows)
+
+def _messages_with(**lookup):
+    from admin_panel.models import Message, MessageEntity
+
+    message_ids = MessageEntity.objects.filter(**lookup).values('message_id')
+    return Message.objects.filter(id__in=message_ids)
+
+def messages_with_hashtag(tag):
+    """Messages with the hashtag, with or without #"""
+    return _messages_with(kind=HASHTAG, value=normalize_hashtag(tag))
+
+def messages_with_mention(username):
+    """Messages that mention the username, with or without @"""
+    return _messages_with(kind=MENTION, value=normalize_mention(username))
+
+def messages_linking_url(url):
+    return _messages_with(kind=URL, value=normalize_url(url))
+
+def messages_linking_domain(domain):
+    """Messages with a link to the domain (www. is ignored, subdomains are not included)"""
+    return _messages_with(domain=normalize_domain(domain))
+
+def top_values(kind, limit=20, recent=50000):
+    """Most frequent values among the last `recent` index rows, for filters and reports"""
+    from django.db.models import Count, Max
+    from admin_panel.models import MessageEntity
+
+    last_id = MessageEntity.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+    field = 'domain' if kind == 'domain' else 'value'
+    rows = MessageEntity.objects.filter(id__gt=last_id - recent)
+    rows = rows.exclude(domain='') if kind == 'domain' else rows.filter(kind=kind)
+    return list(
+        rows.values_list(field, flat=True).annotate(count=Count('id')).order_by('-count')[:limit]
+    )
@@ -1,5 +1,6 @@
 from .common import router as common_router
 from .admin import router as admin_router
 from .session_handlers import router as session_router
+from .subscriptions import router as subscriptions_router
 
-__all__ = ['common_router', 'admin_router', 'session_router']
\ No newline at end of file
+__all__ = ['common_router', 'admin_router', 'session_router', 'subscriptions_router']
\ No newline at end of file
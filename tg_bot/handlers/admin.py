@@ -75,6 +75,11 @@ class EditChannelStates(StatesGroup):
 class RemoveChannelState(StatesGroup):
     waiting_for_input = State()
 
+# FSM for the bulk import of channels
+class ImportChannelsStates(StatesGroup):
+    waiting_for_category = State()
+    waiting_for_file = State()
+
 # FSM for adding a category
 class AddCategoryStates(StatesGroup):
     waiting_for_category_name = State()
@@ -505,6 +510,7 @@ async def update_channel_with_data(message: types.Message, state: FSMContext, ch
                     channel.session = None
                 elif session_id:
                     channel.session = TelegramSession.objects.get(id=session_id)
+                channel.session_auto = False
                     
             channel.save()
             
@@ -1275,6 +1281,116 @@ async def process_remove_channel_input(message: types.Message, state: FSMContext
     
     await state.clear()
 
+@router.callback_query(F.data == "import_channels", F.from_user.id == ADMIN_ID)
+async def import_channels_start(call: types.CallbackQuery, state: FSMContext):
+    """
+    start the bulk import of channels
+    """
+    categories = await get_categories()
+    
+    if not categories:
+        await call.message.answer("No categories found. Please add a category first.")
+        await call.answer()
+        return
+    
+    # Create mapping of display indices to actual category IDs
+    category_mapping = {}
+    categories_text = "Select the category for the imported channels (number: Category Name):\n"
+    
+    for idx, category in enumerate(categories, 1):
+        category_mapping[idx] = category.id
+        categories_text += f"{idx}: {category.name}\n"
+    
+    await state.update_data(category_mapping=category_mapping)
+    await call.message.answer(categories_text)
+    await state.set_state(ImportChannelsStates.waiting_for_category)
+    await call.answer()
+
+@router.message(ImportChannelsStates.waiting_for_category, F.text, F.from_user.id == ADMIN_ID)
+async def process_import_category(message: types.Message, state: FSMContext):
+    """
+    get the default category for the import
+    """
+    user_data = await state.get_data()
+    category_mapping = user_data.get('category_mapping', {})
+    
+    try:
+        display_index = int(message.text)
+    except ValueError:
+        await message.answer("The category number must be a number. Try again.")
+        return
+    
+    if display_index not in category_mapping:
+        await message.answer("Invalid category number. Please enter a number from the list.")
+        return
+    
+    await state.update_data(category_id=category_mapping[display_index])
+    await message.answer(
+        "Send a .csv or .txt file with one channel per line in the format "
+        "'link[,name[,category]]', or paste the links as a message."
+    )
+    await state.set_state(ImportChannelsStates.waiting_for_file)
+
+@router.message(ImportChannelsStates.waiting_for_file, F.document | F.text, F.from_user.id == ADMIN_ID)
+async def process_import_file(message: types.Message, state: FSMContext, bot: Bot):
+    """
+    import the channels from the uploaded file and report the results
+    """
+    from tg_bot.channel_import import import_channels, summarize_results, results_to_csv
+    
+    user_data = await state.get_data()
+    category_id = user_data.get('category_id')
+    
+    if message.document:
+        if message.document.file_size and message.document.file_size > 1024 * 1024:
+            await message.answer("The file is too large (maximum 1 MB).")
+            return
+        try:
+            file_data = await bot.download(message.document)
+            text = file_data.read().decode('utf-8-sig')
+        except Exception as e:
+            logger.error(f"Error downloading the import file: {e}")
+            await message.answer("❌ Could not read the file. Send a UTF-8 .csv or .txt file.")
+            return
+    else:
+        text = message.text
+    
+    await message.answer("⏳ Importing channels, this may take a few minutes...")
+    
+    # the import is over whatever happens, the user must not stay in the import state
+    try:
+        client = None
+        try:
+            from tg_bot.telethon_worker import initialize_client
+            client, me = await initialize_client()
+        except Exception as e:
+            logger.error(f"Error initializing the client for the import: {e}")
+        
+        try:
+            results = await import_channels(text, default_category_id=category_id, client=client)
+        except Exception as e:
+            logger.error(f"Error importing channels: {e}")
+            await message.answer(f"❌ Import failed: {e}")
+            return
+        finally:
+            if client:
+                await client.disconnect()
+        
+        summary = summarize_results(results)
+        summary_text = "\n".join(f"• {status}: {count}" for status, count in summary.items())
+        resolve_note = "" if client else "\n\n⚠️ No Telegram session available, links were not resolved."
+        
+        await message.answer(f"✅ Import finished ({len(results)} links):\n{summary_text or '• nothing to import'}{resolve_note}")
+        if results:
+            await message.answer_document(
+                types.BufferedInputFile(results_to_csv(results).encode('utf-8'), filename="import_report.csv"),
+                caption="Per-link results"
+            )
+        
+        logger.info(f"Bulk import finished: {summary}")
+    finally:
+        await state.clear()
+
 @router.callback_query(F.data == "add_category", F.from_user.id == ADMIN_ID)
 async def add_category_start(call: types.CallbackQuery, state: FSMContext):
     """
@@ -1650,6 +1766,7 @@ async def link_session_to_channel(callback: types.CallbackQuery, state: FSMConte
         channel = Channel.objects.get(id=channel_id)
         session = TelegramSession.objects.get(id=session_id)
         channel.session = session
+        channel.session_auto = False
         channel.save()
         return {
             'channel_name': channel.name,
@@ -1677,6 +1794,7 @@ async def unlink_session_from_channel(callback: types.CallbackQuery, state: FSMC
     def remove_channel_session(channel_id):
         channel = Channel.objects.get(id=channel_id)
         channel.session = None
+        channel.session_auto = False
         channel.save()
         return channel.name
     
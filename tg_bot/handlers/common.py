@@ -6,6 +6,7 @@ from tg_bot.keyboards.main_menu import main_menu_keyboard
 from tg_bot.config import ADMIN_ID, WEB_SERVER_HOST, WEB_SERVER_PORT
 from admin_panel.models import Channel, Category
 from asgiref.sync import sync_to_async
+from django.db.models import Count
 try:
     import qrcode
     from qrcode.image.pil import PilImage
@@ -15,9 +16,20 @@ except ImportError:
     import logging
     logging.warning("qrcode module not installed. QR code generation will be disabled.")
 from io import BytesIO
+from core.cache import memoize
+from admin_panel.feed_cache import CATALOG_NAMESPACE
+from tg_bot.config import CATALOG_CACHE_TTL
 
 router = Router()
 
+@memoize(CATALOG_CACHE_TTL, namespace=CATALOG_NAMESPACE)
+def _get_categories():
+    """Categories with their session and channel count, one query"""
+    return list(Category.objects.select_related('session').annotate(channels_count=Count('channels')))
+
+def _get_channels():
+    return list(Channel.objects.select_related('category', 'session'))
+
 @router.message(Command("start"))
 async def cmd_start(message: Message):
     await message.answer(
@@ -34,7 +46,7 @@ async def list_channels(message: Message):
     @sync_to_async
     def get_channels():
         try:
-            return list(Channel.objects.all().select_related('category'))
+            return _get_channels()
         except Exception as e:
             print(f"Error fetching channels: {e}")
             return []
@@ -77,7 +89,7 @@ async def list_categories(message: Message):
     @sync_to_async
     def get_categories():
         try:
-            return list(Category.objects.all())
+            return _get_categories()
         except Exception as e:
             print(f"Error fetching categories: {e}")
             return []
@@ -103,17 +115,7 @@ async def list_categories(message: Message):
     
     categories_text = "📍 List of categories:\n\n"
     for category in categories:
-        # get the number of channels in the category
-        @sync_to_async
-        def count_channels(category_id):
-            try:
-                return Channel.objects.filter(category_id=category_id).count()
-            except Exception as e:
-                print(f"Error counting channels: {e}")
-                return 0
-        
-        channel_count = await count_channels(category.id)
-        categories_text += f"• {category.name} ({channel_count} channels)\n"
+        categories_text += f"• {category.name} ({category.channels_count} channels)\n"
     
     await message.answer(
         categories_text,
@@ -7,15 +7,20 @@ import qrcode
 from io import BytesIO
 from tg_bot.keyboards.channels_menu import get_channels_keyboard, get_categories_keyboard
 from asgiref.sync import async_to_sync, sync_to_async
+from core.cache import memoize
+from admin_panel.feed_cache import CATALOG_NAMESPACE
+from tg_bot.config import CATALOG_CACHE_TTL
 router = Router()
 
+@memoize(CATALOG_CACHE_TTL, namespace=CATALOG_NAMESPACE)
 def _get_categories():
     from admin_panel.models import Category
-    return list(Category.objects.all())
+    return list(Category.objects.select_related('session'))
 
+@memoize(CATALOG_CACHE_TTL, namespace=CATALOG_NAMESPACE)
 def _get_channels():
     from admin_panel.models import Channel
-    return list(Channel.objects.all())
+    return list(Channel.objects.select_related('category', 'session'))
 
 # create async functions
 get_categories = sync_to_async(_get_categories)
@@ -0,0 +1,94 @@
+from aiogram import Router, F, types
+from aiogram.filters import Command
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+import logging
+
+from admin_panel.models import Category, Subscription
+
+logger = logging.getLogger('subscriptions')
+
+router = Router()
+
+def _get_subscription_state(chat_id):
+    """Active categories and the ids the chat is subscribed to"""
+    categories = list(Category.objects.filter(is_active=True).order_by('id'))
+    subscribed = set(
+        Subscription.objects.filter(chat_id=chat_id, is_active=True).values_list('category_id', flat=True)
+    )
+    return categories, subscribed
+
+def _toggle_subscription(chat_id, username, category_id):
+    """Subscribe or unsubscribe the chat, returns the new state"""
+    subscription, created = Subscription.objects.get_or_create(
+        chat_id=chat_id,
+        category_id=category_id,
+        defaults={'username': username, 'is_active': True}
+    )
+    if not created:
+        subscription.is_active = not subscription.is_active
+        subscription.username = username
+        subscription.save(update_fields=['is_active', 'username', 'updated_at'])
+    logger.info(f"Chat {chat_id} {'subscribed to' if subscription.is_active else 'unsubscribed from'} category {category_id}")
+    return subscription.is_active
+
+def _unsubscribe_all(chat_id):
+    # update() skips auto_now, the delivery index notices changes by updated_at
+    return Subscription.objects.filter(chat_id=chat_id, is_active=True).update(is_active=False, updated_at=timezone.now())
+
+get_subscription_state = sync_to_async(_get_subscription_state)
+toggle_subscription = sync_to_async(_toggle_subscription)
+unsubscribe_all = sync_to_async(_unsubscribe_all)
+
+def get_subscriptions_keyboard(categories, subscribed):
+    """
+    create a keyboard with categories, marking those the chat is subscribed to
+    """
+    keyboard = []
+    for category in categories:
+        mark = "🔔" if category.id in subscribed else "🔕"
+        keyboard.append([
+            InlineKeyboardButton(text=f"{mark} {category.name}", callback_data=f"subscription_toggle_{category.id}")
+        ])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+@router.message(Command("subscribe"))
+@router.message(F.text == "🔔 Subscriptions")
+async def show_subscriptions(message: types.Message):
+    """Shows the categories the user can subscribe to"""
+    categories, subscribed = await get_subscription_state(message.chat.id)
+
+    if not categories:
+        await message.answer("There are no categories to subscribe to yet.")
+        return
+
+    await message.answer(
+        "Select the categories to receive new posts from (🔔 - subscribed):",
+        reply_markup=get_subscriptions_keyboard(categories, subscribed)
+    )
+
+@router.callback_query(F.data.startswith("subscription_toggle_"))
+async def subscription_toggle_handler(call: types.CallbackQuery):
+    """Subscribe to / unsubscribe from the selected category"""
+    try:
+        category_id = int(call.data.split("_")[2])
+    except (IndexError, ValueError):
+        await call.answer("Unknown category")
+        return
+
+    chat_id = call.message.chat.id
+    is_active = await toggle_subscription(chat_id, call.from_user.username, category_id)
+    categories, subscribed = await get_subscription_state(chat_id)
+
+    await call.message.edit_reply_markup(reply_markup=get_subscriptions_keyboard(categories, subscribed))
+    await call.answer("Subscribed!" if is_active else "Unsubscribed")
+
+@router.message(Command("unsubscribe"))
+async def unsubscribe_all_handler(message: types.Message):
+    """Removes all subscriptions of the chat"""
+    count = await unsubscribe_all(message.chat.id)
+    if count:
+        await message.answer(f"You have been unsubscribed from {count} categories.")
+    else:
+        await message.answer("You have no active subscriptions.")
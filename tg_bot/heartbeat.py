@@ -0,0 +1,136 @@
+"""
+Status heartbeats of the running services.
+
+Every parser shard, the bot, the message processor and delivery keep a Heartbeat,
+count their work on it in memory and write it to their ServiceHeartbeat row
+every HEARTBEAT_INTERVAL seconds with one UPDATE. The status API and the
+dashboard read these few rows instead of scanning the processes of the host.
+A row whose heartbeat is older than a few intervals belongs to a service that
+stopped without saying so.
+"""
+import os
+import time
+import socket
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from tg_bot.config import HEARTBEAT_INTERVAL
+
+logger = logging.getLogger('heartbeat')
+
+STATE_RUNNING = 'running'
+STATE_STANDBY = 'standby'
+STATE_STOPPED = 'stopped'
+
+MISSED_HEARTBEATS = 3  # a service that missed this many heartbeats is considered down
+
+class Heartbeat:
+    def __init__(self, name, kind, interval=HEARTBEAT_INTERVAL):
+        self.name = name
+        self.kind = kind
+        self.interval = interval
+        self.state = STATE_RUNNING
+        self.started_at = timezone.now()
+        self.messages_ingested = 0
+        self.last_error = ''
+        self.last_error_at = None
+        self.details = {}
+        self._cycles = 0
+        self._cycle_time = 0.0
+        self._channels_polled = 0
+
+    def record_cycle(self, seconds, channels_polled=0):
+        """One unit of work: a channel poll of the parser, a batch of the processor"""
+        self._cycles += 1
+        self._cycle_time += seconds
+        self._channels_polled += channels_polled
+
+    def record_messages(self, count=1):
+        self.messages_ingested += count
+
+    def record_error(self, error):
+        self.last_error = str(error)[:1000] or type(error).__name__
+        self.last_error_at = timezone.now()
+
+    def _write(self):
+        from admin_panel.models import ServiceHeartbeat
+
+        now = timezone.now()
+        values = {
+            'kind': self.kind,
+            'state': self.state,
+            'host': socket.gethostname(),
+            'pid': os.getpid(),
+            'started_at': self.started_at,
+            'heartbeat_at': now,
+            'interval': self.interval,
+            'cycle_seconds': round(self._cycle_time / self._cycles, 3) if self._cycles else None,
+            'channels_polled': self._channels_polled,
+            'messages_ingested': self.messages_ingested,
+            'last_error': self.last_error,
+            'last_error_at': self.last_error_at,
+            'details': self.details,
+        }
+        if not ServiceHeartbeat.objects.filter(name=self.name).update(**values):
+            ServiceHeartbeat.objects.update_or_create(name=self.name, defaults=values)
+        self._cycles = 0
+        self._cycle_time = 0.0
+        self._channels_polled = 0
+
+    def beat(self):
+        """Write the heartbeat now, errors are logged and not raised"""
+        try:
+            self._write()
+        except Exception as e:
+            logger.error(f"Error writing heartbeat of {self.name}: {e}")
+
+    def beat_if_due(self, last_beat):
+        """For synchronous loops: beat when the interval passed, returns the time of the last beat"""
+        if time.monotonic() - last_beat < self.interval:
+            return last_beat
+        self.beat()
+        return time.monotonic()
+
+    async def abeat(self):
+        await sync_to_async(self.beat)()
+
+    async def run(self, details=None):
+        """Beat every interval until cancelled, details() is called before every beat"""
+        while True:
+            if details:
+                try:
+                    self.details = details()
+                except Exception as e:
+                    logger.error(f"Error collecting heartbeat details of {self.name}: {e}")
+            await self.abeat()
+            await asyncio.sleep(self.interval)
+
+    def stop(self):
+        self.state = STATE_STOPPED
+        self.beat()
+
+    async def astop(self):
+        await sync_to_async(self.stop)()
+
+def service_status(heartbeat, now=None):
+    """'running', 'standby', 'stopped' or 'down' for a ServiceHeartbeat row"""
+    now = now or timezone.now()
+    if heartbeat.state == STATE_STOPPED:
+        return STATE_STOPPED
+    if (now - heartbeat.heartbeat_at).total_seconds() > heartbeat.interval * MISSED_HEARTBEATS:
+        return 'down'
+    return heartbeat.state
+
+def service_statuses():
+    """All ServiceHeartbeat rows with their status attached, one query over a handful of rows"""
+    from admin_panel.models import ServiceHeartbeat
+
+    now = timezone.now()
+    services = list(ServiceHeartbeat.objects.all())
+    for service in services:
+        service.status = service_status(service, now)
+        service.heartbeat_age = round((now - service.heartbeat_at).total_seconds(), 1)
+    return services
@@ -82,6 +82,7 @@ def get_channels_keyboard(channels, category_id=None):
     # add buttons for adding and removing channels
     keyboard.append([InlineKeyboardButton(text="➕ Add channel", callback_data="add_channel")])
     keyboard.append([InlineKeyboardButton(text="➖ Remove channel", callback_data="remove_channel")])
+    keyboard.append([InlineKeyboardButton(text="📥 Import channels", callback_data="import_channels")])
 
     if category_id:
         # "Back" button to return to the list of categories
@@ -8,6 +8,9 @@ main_menu_keyboard = ReplyKeyboardMarkup(
         [
             KeyboardButton(text="📍 Categories menu"),
         ],
+        [
+            KeyboardButton(text="🔔 Subscriptions")
+        ],
         [
             KeyboardButton(text="🌐 Go to the site")
         ],
@@ -0,0 +1,213 @@
+"""
+Benchmark of the sharded parser on its real code path.
+
+Every worker process runs the parser's own poll_channel() over the channels
+of its shard: select_client, the join and get_messages calls,
+save_message_to_data and save_message_to_db with the entity index and the
+outbox record. Only Telegram is replaced, by a client that answers from
+memory after --latency seconds. The runs write to a throwaway test database
+(the one `manage.py test` uses), never to the configured one.
+
+On SQLite the worker processes take turns on one database file and can't
+scale, run it with DATABASE_URL pointing to PostgreSQL to see how the parser
+scales over CPU cores.
+"""
+import os
+import time
+import asyncio
+import logging
+import tempfile
+import multiprocessing
+from datetime import datetime, timezone
+from django.core.management.base import BaseCommand
+from telethon.tl import types
+
+from tg_bot.parser_shards import ShardAssignment
+
+class FakeClient:
+    """
+    Stands in for TelegramClient without network access. Every get_messages
+    returns the last 10 posts of the channel with one new post since the
+    previous call, so every poll saves a message.
+    """
+    parse_mode = None
+
+    def __init__(self, latency, first_id):
+        self.latency = latency
+        self.next_ids = {}
+        self.first_id = first_id
+
+    async def _answer(self):
+        await asyncio.sleep(self.latency)
+
+    async def __call__(self, request):
+        await self._answer()
+
+    async def get_dialogs(self):
+        await self._answer()
+        return []
+
+    async def get_entity(self, identifier):
+        await self._answer()
+        username = str(identifier).rstrip('/').rsplit('/', 1)[-1]
+        return types.Channel(
+            id=int(username.removeprefix('bench')), title=username, photo=types.ChatPhotoEmpty(),
+            date=datetime.now(timezone.utc), access_hash=0,
+        )
+
+    async def get_messages(self, channel, limit):
+        await self._answer()
+        latest = self.next_ids.get(channel.id, self.first_id)
+        self.next_ids[channel.id] = latest + 1
+        now = datetime.now(timezone.utc)
+        messages = []
+        for message_id in range(latest, latest - limit, -1):
+            text = f"Post {message_id} of {channel.title} #news @channel https://example.com/{message_id}"
+            message = types.Message(
+                id=message_id, peer_id=types.PeerChannel(channel.id), date=now, message=text,
+                entities=[
+                    types.MessageEntityHashtag(text.index('#'), 5),
+                    types.MessageEntityMention(text.index('@'), 8),
+                    types.MessageEntityUrl(text.index('https'), len(text) - text.index('https')),
+                ],
+            )
+            message._client = self
+            messages.append(message)
+        return messages
+
+def _run_shard(args):
+    """Poll every channel of one shard `rounds` times with the parser's poll_channel, returns the successful polls"""
+    shard_index, shard_count, session_ids, rounds, latency, first_id = args
+    from django.db import connections
+    from tg_bot import telethon_worker
+
+    logging.disable(logging.INFO)
+    telethon_worker.shard = ShardAssignment(shard_index, shard_count, session_ids)
+
+    async def poll():
+        channels = await telethon_worker.get_channels()
+        for session in await telethon_worker.get_telegram_sessions():
+            telethon_worker.telethon_clients[str(session.id)] = {
+                'client': FakeClient(latency, first_id),
+                'user': None,
+                'session_id': session.id,
+                'session': session,
+            }
+        polled = 0
+        for _ in range(rounds):
+            for channel in channels:
+                if await telethon_worker.poll_channel(channel, None) is not None:
+                    polled += 1
+        return polled
+
+    try:
+        return asyncio.run(poll())
+    finally:
+        connections.close_all()
+
+class Command(BaseCommand):
+    help = 'Benchmark the sharded parser on its real poll and save path with a fake Telegram client, in a test database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help='Largest number of worker processes to try',
+        )
+        parser.add_argument(
+            '--channels',
+            type=int,
+            default=200,
+            help='Number of fake channels',
+        )
+        parser.add_argument(
+            '--sessions',
+            type=int,
+            default=8,
+            help='Number of fake sessions the channels are spread over',
+        )
+        parser.add_argument(
+            '--rounds',
+            type=int,
+            default=5,
+            help='Polls of every channel',
+        )
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.0,
+            help='Seconds the fake client takes to answer a request',
+        )
+
+    def _create_test_database(self):
+        from django.db import connection
+
+        if connection.vendor == 'sqlite':
+            # the default SQLite test database lives in memory, the workers need a file
+            connection.settings_dict.setdefault('TEST', {})['NAME'] = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+        return connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+
+    def _create_channels(self, channel_count, session_count):
+        from admin_panel.models import Category, Channel, TelegramSession
+
+        category = Category.objects.create(name='Benchmark')
+        TelegramSession.objects.bulk_create(
+            TelegramSession(phone=f'+10000000{index:04d}', is_active=True) for index in range(session_count)
+        )
+        session_ids = [session.id for session in TelegramSession.objects.order_by('id')]
+        shard = ShardAssignment(0, 1, session_ids)
+        channels = [Channel(id=channel_id) for channel_id in range(1, channel_count + 1)]
+        Channel.objects.bulk_create(
+            Channel(
+                id=channel.id, name=f'bench{channel.id}', url=f'https://t.me/bench{channel.id}',
+                category=category, session_id=shard.channel_session(channel), session_auto=True,
+            )
+            for channel in channels
+        )
+        return session_ids
+
+    def handle(self, *args, **options):
+        from django.db import connection, connections
+        from admin_panel.models import Message, OutboxRecord
+
+        max_workers = max(1, options['max_workers'])
+        worker_counts = sorted({1, max_workers} | {count for count in (2, 4, 8, 16, 32) if count < max_workers})
+
+        old_name = self._create_test_database()
+        try:
+            session_ids = self._create_channels(options['channels'], max(1, options['sessions']))
+            self.stdout.write(
+                f"{options['channels']} channels over {len(session_ids)} sessions x {options['rounds']} rounds, "
+                f"latency {options['latency']}s, {connection.vendor}, {multiprocessing.cpu_count()} CPU(s)"
+            )
+            self.stdout.write(f"{'workers':>8} {'seconds':>9} {'saved/s':>10} {'speedup':>8} {'efficiency':>11} {'polls':>7} {'saved':>7}")
+
+            baseline = None
+            context = multiprocessing.get_context('fork')  # the workers inherit the test database settings
+            for run, workers in enumerate(worker_counts):
+                Message.objects.all().delete()
+                OutboxRecord.objects.all().delete()
+                connections.close_all()
+
+                # new message ids on every run, the parser skips the ones it saw
+                first_id = (run + 1) * 1_000_000
+                jobs = [
+                    (shard_index, workers, session_ids, options['rounds'], options['latency'], first_id)
+                    for shard_index in range(workers)
+                ]
+                started = time.perf_counter()
+                with context.Pool(workers) as pool:
+                    polls = sum(pool.map(_run_shard, jobs))
+                elapsed = time.perf_counter() - started
+
+                saved = Message.objects.count()
+                baseline = baseline or elapsed
+                speedup = baseline / elapsed
+                self.stdout.write(
+                    f"{workers:>8} {elapsed:>9.2f} {saved / elapsed:>10.0f} {speedup:>8.2f} "
+                    f"{speedup / workers:>10.0%} {polls:>7} {saved:>7}"
+                )
+        finally:
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
@@ -0,0 +1,104 @@
+import sys
+import asyncio
+import logging
+from django.core.management.base import BaseCommand, CommandError
+from admin_panel.models import Category
+
+logger = logging.getLogger('django')
+
+class Command(BaseCommand):
+    help = 'Bulk import channels from a CSV / newline separated list of links (link[,name[,category]])'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='File with the links, "-" to read from stdin',
+        )
+        parser.add_argument(
+            '--category',
+            help='Default category (ID or name) for rows without a category',
+        )
+        parser.add_argument(
+            '--session-id',
+            type=int,
+            help='Telegram session to link the channels to and to resolve the links with',
+        )
+        parser.add_argument(
+            '--no-resolve',
+            action='store_true',
+            help='Do not resolve the links through Telegram',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=5,
+            help='Number of links resolved in parallel',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=3,
+            help='Maximum resolve requests per second',
+        )
+        parser.add_argument(
+            '--report',
+            help='Write the per-link results to this CSV file',
+        )
+
+    def handle(self, *args, **options):
+        from tg_bot.channel_import import import_channels, summarize_results, results_to_csv
+
+        if options['path'] == '-':
+            text = sys.stdin.read()
+        else:
+            try:
+                with open(options['path'], encoding='utf-8-sig') as f:
+                    text = f.read()
+            except OSError as e:
+                raise CommandError(f"Cannot read {options['path']}: {e}")
+
+        category_id = None
+        if options['category']:
+            category = Category.objects.filter(name=options['category']).first()
+            if not category and options['category'].isdigit():
+                category = Category.objects.filter(id=int(options['category'])).first()
+            if not category:
+                raise CommandError(f"Category '{options['category']}' not found")
+            category_id = category.id
+
+        async def run():
+            client = None
+            if not options['no_resolve']:
+                from tg_bot.telethon_worker import initialize_client
+                client, me = await initialize_client(session_id=options['session_id'])
+                if not client:
+                    self.stdout.write(self.style.WARNING('No Telegram client available, links will not be resolved'))
+            try:
+                return await import_channels(
+                    text,
+                    default_category_id=category_id,
+                    session_id=options['session_id'],
+                    client=client,
+                    concurrency=options['concurrency'],
+                    rate=options['rate'],
+                )
+            finally:
+                if client:
+                    await client.disconnect()
+
+        results = asyncio.run(run())
+
+        for result in results:
+            line = f"{result['line']}: {result['link']} - {result['status']}"
+            if result['detail']:
+                line += f" ({result['detail']})"
+            style = self.style.SUCCESS if result['status'] == 'created' else self.style.WARNING
+            self.stdout.write(style(line))
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8', newline='') as f:
+                f.write(results_to_csv(results))
+            self.stdout.write(f"Report saved to {options['report']}")
+
+        summary = ', '.join(f"{status}: {count}" for status, count in summarize_results(results).items())
+        self.stdout.write(self.style.SUCCESS(f"Import finished. {summary or 'nothing to import'}"))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from admin_panel.models import Message, MessageEntity
+from tg_bot.entity_index import entities_from_text, build_index
+
+class Command(BaseCommand):
+    help = 'Fill the hashtag / mention / URL index for messages saved without it, from the message text'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Messages indexed per bulk insert',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Also reindex messages that already have index rows',
+        )
+
+    def handle(self, *args, **options):
+        messages = Message.objects.order_by('id').only('id', 'text')
+        if not options['all']:
+            messages = messages.filter(entities__isnull=True)
+
+        last_id = 0
+        total_messages = 0
+        total_rows = 0
+        while True:
+            batch = list(messages.filter(id__gt=last_id)[:options['batch_size']])
+            if not batch:
+                break
+            rows = []
+            for message in batch:
+                rows.extend(build_index(message, entities_from_text(message.text)))
+            with transaction.atomic():
+                MessageEntity.objects.bulk_create(rows, ignore_conflicts=True)
+            last_id = batch[-1].id
+            total_messages += len(batch)
+            total_rows += len(rows)
+            self.stdout.write(f"Indexed {total_messages} messages...")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {total_rows} index rows for {total_messages} messages"))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from tg_bot import message_stats
+
+class Command(BaseCommand):
+    help = 'Recompute the per-day and per-hour message counters from the saved messages, by message date'
+
+    def handle(self, *args, **options):
+        total = message_stats.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Done: counters rebuilt for {total} messages"))
@@ -1,5 +1,4 @@
 import multiprocessing
-import queue
 from django.core.management.base import BaseCommand
 import logging
 
@@ -9,6 +8,14 @@ logger = logging.getLogger('django')
 class Command(BaseCommand):
     help = 'Start the Telethon parser'
     
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of parser processes, sessions and channels are sharded between them',
+        )
+    
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Starting the Telethon parser...'))
         
@@ -16,26 +23,27 @@ class Command(BaseCommand):
         message_queue = multiprocessing.Queue()
         
         # start the parser in a separate process
-        from tg_bot.telethon_worker import telethon_worker_process
-        telethon_process = multiprocessing.Process(
-            target=telethon_worker_process,
-            args=(message_queue,)
-        )
+        if options['workers'] > 1:
+            from tg_bot.parser_launcher import run_sharded_parser
+            telethon_process = multiprocessing.Process(
+                target=run_sharded_parser,
+                args=(message_queue, options['workers'])
+            )
+        else:
+            from tg_bot.telethon_worker import telethon_worker_process
+            telethon_process = multiprocessing.Process(
+                target=telethon_worker_process,
+                args=(message_queue,)
+            )
         telethon_process.start()
         
-        # processing messages from the queue (will work in the main thread)
+        # parsed messages go to the outbox table, the main thread only waits for the parser
         try:
             self.stdout.write(self.style.SUCCESS(f'Parser started (PID: {telethon_process.pid})'))
             self.stdout.write('Press Ctrl+C to stop...')
             
             while telethon_process.is_alive():
-                try:
-                    # get a message from the queue (with a timeout to check the process status)
-                    message = message_queue.get(block=True, timeout=1)
-                    logger.info(f"Received a message with ID: {message.get('message_info', {}).get('message_id')}")
-                except queue.Empty:
-                    # the queue is empty, continue waiting
-                    continue
+                telethon_process.join(timeout=1)
         except KeyboardInterrupt:
             self.stdout.write(self.style.WARNING('Received a termination signal, stopping the parser...'))
         finally:
@@ -0,0 +1,165 @@
+"""
+Message statistics from incrementally maintained counters.
+
+The message processor adds every outbox batch to two small tables in the
+transaction that commits its offset, so a batch is counted exactly once: when
+counting fails the offset is not committed and the batch is retried.
+
+- MessageCount: messages per day, channel, category and session
+- HourlyMessageCount: messages per hour, the ingest rate
+
+Counts are by ingest time (when the message entered the outbox) and are
+ingest counts: deleting a message does not decrement them, so the dashboard
+labels them "ingested". Deleting a channel (or its category) drops its
+daily counters with it. The dashboard and the stats API read only these
+tables, never COUNT(*) over the messages. `manage.py rebuild_message_stats` recomputes them from the
+messages by their date.
+"""
+import logging
+from datetime import timedelta
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum, Count
+from django.db.models.functions import TruncDate, TruncHour
+from django.utils import timezone
+
+logger = logging.getLogger('message_stats')
+
+def _hour(moment):
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+def _increment(model, count, **lookup):
+    if model.objects.filter(**lookup).update(count=F('count') + count):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(count=count, **lookup)
+    except IntegrityError:
+        # another processor created the row in the meantime
+        model.objects.filter(**lookup).update(count=F('count') + count)
+
+def record_batch(records):
+    """Add the messages of a batch of outbox records to the counters, returns the number counted"""
+    from admin_panel.models import Message, MessageCount, HourlyMessageCount
+
+    ingested_at = {record.message_id: record.created_at for record in records if record.message_id}
+    if not ingested_at:
+        return 0
+
+    daily = Counter()
+    hourly = Counter()
+    rows = Message.objects.filter(id__in=ingested_at).values_list(
+        'id', 'channel_id', 'channel__category_id', 'session_used_id',
+    )
+    for message_id, channel_id, category_id, session_id in rows:
+        moment = ingested_at[message_id]
+        daily[(moment.date(), channel_id, category_id, session_id)] += 1
+        hourly[_hour(moment)] += 1
+
+    with transaction.atomic():
+        for (day, channel_id, category_id, session_id), count in daily.items():
+            _increment(MessageCount, count, day=day, channel_id=channel_id, category_id=category_id, session_id=session_id)
+        for hour, count in hourly.items():
+            _increment(HourlyMessageCount, count, hour=hour)
+    return sum(hourly.values())
+
+def rebuild():
+    """Recompute all counters from the messages by their date, returns the number of messages counted"""
+    from admin_panel.models import Message, MessageCount, HourlyMessageCount
+
+    daily = (
+        Message.objects.annotate(day=TruncDate('created_at'))
+        .values('day', 'channel_id', 'channel__category_id', 'session_used_id')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    hourly = (
+        Message.objects.annotate(hour=TruncHour('created_at'))
+        .values('hour')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    with transaction.atomic():
+        MessageCount.objects.all().delete()
+        HourlyMessageCount.objects.all().delete()
+        MessageCount.objects.bulk_create([
+            MessageCount(
+                day=row['day'], channel_id=row['channel_id'], category_id=row['channel__category_id'],
+                session_id=row['session_used_id'], count=row['total'],
+            )
+            for row in daily
+        ], batch_size=1000)
+        HourlyMessageCount.objects.bulk_create([
+            HourlyMessageCount(hour=row['hour'], count=row['total']) for row in hourly
+        ], batch_size=1000)
+    return HourlyMessageCount.objects.aggregate(total=Sum('count'))['total'] or 0
+
+def totals():
+    from admin_panel.models import MessageCount, HourlyMessageCount
+
+    now = timezone.now()
+    return {
+        'messages': MessageCount.objects.aggregate(total=Sum('count'))['total'] or 0,
+        'today': MessageCount.objects.filter(day=now.date()).aggregate(total=Sum('count'))['total'] or 0,
+        'last_24h': HourlyMessageCount.objects.filter(
+            hour__gt=_hour(now) - timedelta(hours=24),
+        ).aggregate(total=Sum('count'))['total'] or 0,
+    }
+
+def by_category():
+    from admin_panel.models import MessageCount
+
+    return list(
+        MessageCount.objects.values('category_id', name=F('category__name'))
+        .annotate(total=Sum('count'))
+        .order_by('-total')
+    )
+
+def by_channel(limit=10):
+    from admin_panel.models import MessageCount
+
+    return list(
+        MessageCount.objects.values('channel_id', name=F('channel__name'))
+        .annotate(total=Sum('count'))
+        .order_by('-total')[:limit]
+    )
+
+def by_session():
+    from admin_panel.models import MessageCount
+
+    return list(
+        MessageCount.objects.values('session_id', phone=F('session__phone'))
+        .annotate(total=Sum('count'))
+        .order_by('-total')
+    )
+
+def daily(days=30):
+    """[(date, count)] of the last days, oldest first, days without messages included"""
+    from admin_panel.models import MessageCount
+
+    today = timezone.now().date()
+    first = today - timedelta(days=days - 1)
+    counts = dict(
+        MessageCount.objects.filter(day__gte=first).values('day').annotate(total=Sum('count')).values_list('day', 'total')
+    )
+    return [(first + timedelta(days=offset), counts.get(first + timedelta(days=offset), 0)) for offset in range(days)]
+
+def hourly(hours=48):
+    """[(hour, count)] of the last hours, oldest first, hours without messages included"""
+    from admin_panel.models import HourlyMessageCount
+
+    first = _hour(timezone.now()) - timedelta(hours=hours - 1)
+    counts = dict(HourlyMessageCount.objects.filter(hour__gte=first).values_list('hour', 'count'))
+    return [(first + timedelta(hours=offset), counts.get(first + timedelta(hours=offset), 0)) for offset in range(hours)]
+
+def summary(days=30, hours=48):
+    """Everything the dashboard and the stats API show"""
+    return {
+        'totals': totals(),
+        'categories': by_category(),
+        'channels': by_channel(),
+        'sessions': by_session(),
+        'daily': daily(days),
+        'hourly': hourly(hours),
+    }
@@ -0,0 +1,110 @@
+"""
+Durable hand-off of parsed messages from the parser to the downstream stages.
+
+The parser appends a compact JSON record to the OutboxRecord table in the same
+transaction that saves the Message. Consumers read the table in id order from
+their own offset (OutboxOffset) in batches and move the offset forward only
+after a batch was processed, so a crash of either side loses nothing: work is
+picked up again from the last committed offset (at-least-once).
+"""
+import time
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from tg_bot.config import OUTBOX_RETENTION_HOURS, OUTBOX_GAP_TIMEOUT
+
+logger = logging.getLogger('outbox')
+
+def append(message_info, category_id=None, message=None):
+    """Add a parsed message to the outbox, call inside the transaction that saves the message"""
+    from admin_panel.models import OutboxRecord
+
+    return OutboxRecord.objects.create(
+        message=message,
+        category_id=category_id,
+        payload=message_info,
+    )
+
+def prune(retention_hours=OUTBOX_RETENTION_HOURS):
+    """Delete old records that every consumer has already processed"""
+    from admin_panel.models import OutboxRecord, OutboxOffset
+
+    processed = OutboxOffset.objects.aggregate(position=Min('position'))['position']
+    if not processed:
+        return 0
+    cutoff = timezone.now() - timedelta(hours=retention_hours)
+    deleted, _ = OutboxRecord.objects.filter(id__lte=processed, created_at__lt=cutoff).delete()
+    if deleted:
+        logger.info(f"Pruned {deleted} processed outbox record(s)")
+    return deleted
+
+class OutboxConsumer:
+    """
+    Reads the outbox in batches from the committed offset of one named consumer.
+
+    Record ids are taken before the transaction commits, so with several
+    parser processes a lower id can become visible after a higher one, or
+    never when its transaction rolls back. A batch therefore ends before the
+    first missing id. The gap is waited for until it has been open for
+    gap_timeout seconds, longer than any parser transaction takes, and only
+    then is it taken for a rollback and read past.
+    """
+    def __init__(self, name, gap_timeout=OUTBOX_GAP_TIMEOUT):
+        from admin_panel.models import OutboxOffset
+
+        self.name = name
+        self.gap_timeout = gap_timeout
+        self.gaps = {}  # first missing id: monotonic time it was first seen
+        # a new consumer starts where the others are, not at the start of the retained records
+        start = OutboxOffset.objects.aggregate(position=Min('position'))['position'] or 0
+        offset, _ = OutboxOffset.objects.get_or_create(consumer=name, defaults={'position': start})
+        self.position = offset.position
+
+    def _gap_closed(self, start, end):
+        """Whether the missing ids start..end-1 can be read past"""
+        seen = self.gaps.setdefault(start, time.monotonic())
+        if time.monotonic() - seen < self.gap_timeout:
+            return False
+        logger.warning(f"Outbox {self.name}: records {start}..{end - 1} never committed, reading past them")
+        del self.gaps[start]
+        return True
+
+    def read_batch(self, limit=100):
+        """Committed records after the offset with no missing id before them, oldest first"""
+        from admin_panel.models import OutboxRecord
+
+        records = list(OutboxRecord.objects.filter(id__gt=self.position).order_by('id')[:limit])
+        expected = self.position + 1
+        for index, record in enumerate(records):
+            if record.id != expected and not self._gap_closed(expected, record.id):
+                return records[:index]
+            expected = record.id + 1
+        return records
+
+    def commit(self, records):
+        """Mark the records (and everything before them) as processed"""
+        from admin_panel.models import OutboxOffset
+
+        if not records:
+            return
+        position = max(record.id for record in records)
+        with transaction.atomic():
+            OutboxOffset.objects.filter(consumer=self.name, position__lt=position).update(
+                position=position, updated_at=timezone.now(),
+            )
+        self.position = position
+        self.gaps = {start: seen for start, seen in self.gaps.items() if start > position}
+
+    def lag(self):
+        """(records, seconds) the consumer is behind the head of the outbox"""
+        from admin_panel.models import OutboxRecord
+
+        pending = OutboxRecord.objects.filter(id__gt=self.position)
+        oldest = pending.order_by('id').values_list('created_at', flat=True).first()
+        if not oldest:
+            return 0, 0
+        return pending.count(), (timezone.now() - oldest).total_seconds()
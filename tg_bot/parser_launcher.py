@@ -0,0 +1,99 @@
+"""
+Supervisor for a sharded parser.
+
+Starts PARSER_WORKERS telethon_worker_process processes, each owning one of
+the PARSER_SHARDS shards of the sessions and channels (see parser_shards and
+parser_lease), and restarts a worker that dies, with exponential backoff.
+SIGTERM / SIGINT stop all workers.
+"""
+import time
+import signal
+import logging
+import multiprocessing
+
+logger = logging.getLogger('parser_launcher')
+
+RESTART_BACKOFF_MAX = 60  # seconds
+STABLE_RUNTIME = 300  # a worker that ran this long restarts without backoff
+
+class ShardedParser:
+    def __init__(self, queue, workers, shard_count=None):
+        self.queue = queue
+        self.workers = workers
+        self.shard_count = shard_count or workers
+        self.processes = {}
+        self.started_at = {}
+        self.failures = {}
+        self.restart_at = {}
+        self.stopping = False
+
+    def _start(self, worker_index):
+        from tg_bot.telethon_worker import telethon_worker_process
+
+        process = multiprocessing.Process(
+            target=telethon_worker_process,
+            args=(self.queue, worker_index % self.shard_count, self.shard_count),
+            name=f"parser-worker-{worker_index}",
+        )
+        process.daemon = True
+        process.start()
+        self.processes[worker_index] = process
+        self.started_at[worker_index] = time.monotonic()
+        self.restart_at.pop(worker_index, None)
+        logger.info(f"Parser worker {worker_index + 1}/{self.workers} started (PID: {process.pid})")
+
+    def _check(self):
+        now = time.monotonic()
+        for worker_index, process in list(self.processes.items()):
+            if process.is_alive() or worker_index in self.restart_at:
+                continue
+            if now - self.started_at[worker_index] >= STABLE_RUNTIME:
+                self.failures[worker_index] = 0
+            self.failures[worker_index] = self.failures.get(worker_index, 0) + 1
+            delay = min(RESTART_BACKOFF_MAX, 2 ** self.failures[worker_index])
+            logger.error(f"Parser worker {worker_index + 1}/{self.workers} exited with code {process.exitcode}, restarting in {delay}s")
+            self.restart_at[worker_index] = now + delay
+
+        for worker_index, restart_at in list(self.restart_at.items()):
+            if now >= restart_at:
+                self._start(worker_index)
+
+    def stop(self, *args):
+        self.stopping = True
+
+    def run(self):
+        from django.db import connections
+
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+
+        # the workers must not share the DB connections of this process
+        connections.close_all()
+        for worker_index in range(self.workers):
+            self._start(worker_index)
+
+        try:
+            while not self.stopping:
+                self._check()
+                time.sleep(1)
+        finally:
+            self.shutdown()
+
+    def shutdown(self, timeout=10):
+        logger.info(f"Stopping {len(self.processes)} parser worker(s)...")
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in self.processes.values():
+            process.join(max(0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Parser worker {process.name} did not stop, killing it")
+                process.kill()
+                process.join(1)
+
+def run_sharded_parser(queue, workers, shard_count=None):
+    """Run the parser as `workers` supervised processes, blocks until stopped"""
+    from tg_bot.config import PARSER_SHARDS
+
+    ShardedParser(queue, workers, shard_count or max(PARSER_SHARDS, workers)).run()
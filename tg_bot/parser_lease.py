@@ -0,0 +1,114 @@
+"""
+DB leases on parser shards.
+
+Every parser process, on any node, must hold the lease of a shard before it
+polls the shard's sessions and channels. A lease is renewed by heartbeats
+and expires after PARSER_LEASE_TTL seconds, after which another process can
+take the shard over. Processes that find no free shard wait as hot standby.
+Acquiring and renewing are single conditional UPDATEs, so two processes can
+never both hold a lease. Every timestamp is the database's clock (Now()),
+never the node's, so clock skew between hosts can't make a live lease look
+expired.
+"""
+import os
+import time
+import uuid
+import socket
+import logging
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.db.models import DateTimeField, ExpressionWrapper
+from django.db.models.functions import Now
+
+from tg_bot.config import PARSER_LEASE_TTL
+
+logger = logging.getLogger('parser_lease')
+
+def lease_name(shard_index, shard_count):
+    return f"parser-shard-{shard_index}-of-{shard_count}"
+
+def _expires(ttl):
+    return ExpressionWrapper(Now() + timedelta(seconds=ttl), output_field=DateTimeField())
+
+def make_owner_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+class ShardLease:
+    """The shard lease of one parser process"""
+    def __init__(self, shard_count, ttl=PARSER_LEASE_TTL, owner=None):
+        self.shard_count = shard_count
+        self.ttl = ttl
+        self.owner = owner or make_owner_id()
+        self.shard_index = None
+        # monotonic time of the last acquire or renewal, taken before the query
+        self.renewed_at = None
+
+    @property
+    def name(self):
+        return lease_name(self.shard_index, self.shard_count)
+
+    def _try_acquire(self, shard_index):
+        from admin_panel.models import ParserLease
+
+        started = time.monotonic()
+        name = lease_name(shard_index, self.shard_count)
+        taken = ParserLease.objects.filter(name=name, expires_at__lt=Now()).update(
+            owner=self.owner, acquired_at=Now(), heartbeat_at=Now(), expires_at=_expires(self.ttl),
+        )
+        if not taken:
+            try:
+                with transaction.atomic():
+                    ParserLease.objects.create(
+                        name=name, owner=self.owner, acquired_at=Now(), heartbeat_at=Now(),
+                        expires_at=_expires(self.ttl),
+                    )
+            except IntegrityError:
+                return False
+        self.shard_index = shard_index
+        self.renewed_at = started
+        logger.info(f"Acquired lease {name} as {self.owner}")
+        return True
+
+    def _acquire(self, preferred=0):
+        """Take the preferred shard or any free one, returns the shard index or None"""
+        order = [(preferred + offset) % self.shard_count for offset in range(self.shard_count)]
+        for shard_index in order:
+            if self._try_acquire(shard_index):
+                return shard_index
+        return None
+
+    def _renew(self):
+        """Extend the lease, False if another process took it over"""
+        from admin_panel.models import ParserLease
+
+        started = time.monotonic()
+        renewed = ParserLease.objects.filter(name=self.name, owner=self.owner).update(
+            heartbeat_at=Now(), expires_at=_expires(self.ttl),
+        )
+        if renewed:
+            self.renewed_at = started
+        return bool(renewed)
+
+    def _release(self):
+        from admin_panel.models import ParserLease
+
+        if self.shard_index is None:
+            return
+        # expire right away so a standby process takes over without waiting for the TTL
+        ParserLease.objects.filter(name=self.name, owner=self.owner).update(expires_at=Now())
+        logger.info(f"Released lease {self.name}")
+        self.shard_index = None
+
+    async def acquire(self, preferred=0):
+        return await sync_to_async(self._acquire)(preferred)
+
+    async def renew(self):
+        return await sync_to_async(self._renew)()
+
+    async def release(self):
+        try:
+            await sync_to_async(self._release)()
+        except Exception as e:
+            logger.error(f"Error releasing lease {self.name}: {e}")
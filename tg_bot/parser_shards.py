@@ -0,0 +1,81 @@
+"""
+Partitioning of sessions and channels between parser worker processes.
+
+Shards are placed on a consistent hash ring, so changing the number of
+workers only moves about 1/N of the sessions and channels. A session belongs to
+the shard its id hashes to. A channel pinned to a session by hand follows that
+session. Other channels go to one of the active sessions by rendezvous hashing
+of the channel id and follow it to its shard. A shard that owns no session
+therefore owns no such channel, and adding or removing a session only moves
+the channels that pick it. They are balanced over the sessions of their shard.
+Every worker derives the same partition from the DB rows, so no other
+coordination is needed.
+"""
+import bisect
+import hashlib
+
+VNODES = 160  # points per shard on the ring, evens out the partition sizes
+
+def _hash(value):
+    return int.from_bytes(hashlib.md5(value.encode('utf-8')).digest()[:8], 'big')
+
+class HashRing:
+    def __init__(self, shard_count, vnodes=VNODES):
+        self.shard_count = shard_count
+        points = sorted(
+            (_hash(f"shard-{shard}#{replica}"), shard)
+            for shard in range(shard_count)
+            for replica in range(vnodes)
+        )
+        self._keys = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def get(self, key):
+        """Shard that owns the key"""
+        if self.shard_count <= 1:
+            return 0
+        index = bisect.bisect(self._keys, _hash(str(key))) % len(self._keys)
+        return self._shards[index]
+
+class ShardAssignment:
+    """What one worker process owns"""
+    def __init__(self, shard_index=0, shard_count=1, session_ids=()):
+        self.shard_index = shard_index
+        self.shard_count = max(1, shard_count)
+        self.ring = HashRing(self.shard_count)
+        self.session_ids = sorted(session_ids)
+
+    def update_sessions(self, session_ids):
+        """Ids of the active sessions, the unpinned channels are spread over them"""
+        self.session_ids = sorted(session_ids)
+
+    @property
+    def is_sharded(self):
+        return self.shard_count > 1
+
+    def session_shard(self, session_id):
+        return self.ring.get(f"session:{session_id}")
+
+    def channel_session(self, channel):
+        """Active session an unpinned channel hashes to, None without sessions"""
+        if not self.session_ids:
+            return None
+        return max(self.session_ids, key=lambda session_id: _hash(f"channel:{channel.id}:session:{session_id}"))
+
+    def channel_shard(self, channel):
+        if channel.session_id and not getattr(channel, 'session_auto', False):
+            return self.session_shard(channel.session_id)
+        session_id = self.channel_session(channel)
+        if session_id is None:
+            # only the first shard falls back to the default client
+            return 0
+        return self.session_shard(session_id)
+
+    def owns_session(self, session_id):
+        return self.session_shard(session_id) == self.shard_index
+
+    def owns_channel(self, channel):
+        return self.channel_shard(channel) == self.shard_index
+
+    def __str__(self):
+        return f"shard {self.shard_index + 1}/{self.shard_count}"
@@ -0,0 +1,159 @@
+"""
+Adaptive per-channel polling schedule.
+
+Every channel has a next-due time in a heap. The interval follows an
+exponential moving average of the gaps between its posts, so busy channels
+are polled often and dormant ones rarely, within POLL_MIN_INTERVAL and
+POLL_MAX_INTERVAL. A new post brings the channel back to the minimum
+interval right away, since posts tend to come in bursts. A channel handed
+out by pop_due stays scheduled one interval ahead until record_poll or defer
+reports back, so a poll that fails before reporting never drops it.
+
+Due channels are polled concurrently. SessionPacer spaces the polls of each
+session POLL_CHANNEL_DELAY apart, so every connected session adds polling
+throughput and a busy session doesn't hold up the others.
+"""
+import heapq
+import time
+import asyncio
+
+from tg_bot.config import POLL_MIN_INTERVAL, POLL_MAX_INTERVAL, POLL_CHANNEL_DELAY
+
+EMA_ALPHA = 0.3  # weight of the newest gap
+POLLS_PER_GAP = 4  # polls expected between two posts
+SILENCE_FACTOR = 8  # the interval grows with the time since the last post
+
+class ChannelState:
+    __slots__ = ('ema_gap', 'last_post_at', 'interval', 'due_at')
+
+    def __init__(self, interval, due_at):
+        self.ema_gap = None
+        self.last_post_at = None
+        self.interval = interval
+        self.due_at = due_at
+
+class PollScheduler:
+    """Priority queue of channel ids by next-due time"""
+    def __init__(self, default_interval=30, min_interval=POLL_MIN_INTERVAL, max_interval=POLL_MAX_INTERVAL):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self._heap = []
+        self._states = {}
+
+    def _clamp(self, value):
+        return max(self.min_interval, min(self.max_interval, value))
+
+    def _push(self, channel_id, due_at):
+        state = self._states[channel_id]
+        state.due_at = due_at
+        heapq.heappush(self._heap, (due_at, channel_id))
+
+    def sync(self, channel_ids, now=None):
+        """Add new channels (due right away) and forget the removed ones"""
+        now = now or time.time()
+        channel_ids = set(channel_ids)
+        for channel_id in list(self._states):
+            if channel_id not in channel_ids:
+                del self._states[channel_id]
+        for channel_id in channel_ids:
+            if channel_id not in self._states:
+                self._states[channel_id] = ChannelState(self._clamp(self.default_interval), now)
+                self._push(channel_id, now)
+        # drop stale heap entries once they pile up
+        if len(self._heap) > 4 * max(1, len(self._states)):
+            self._heap = [(due_at, channel_id) for due_at, channel_id in self._heap
+                          if channel_id in self._states and self._states[channel_id].due_at == due_at]
+            heapq.heapify(self._heap)
+
+    def pop_due(self, now=None, limit=None):
+        """Return the ids of the channels that are due, most overdue first, each is due again after its interval"""
+        now = now or time.time()
+        due = []
+        while self._heap and self._heap[0][0] <= now and (limit is None or len(due) < limit):
+            due_at, channel_id = heapq.heappop(self._heap)
+            state = self._states.get(channel_id)
+            # skip entries of removed channels and outdated entries
+            if state is None or state.due_at != due_at:
+                continue
+            # record_poll or defer replace this entry once the poll reports back
+            self._push(channel_id, now + state.interval)
+            due.append(channel_id)
+        return due
+
+    def next_due_in(self, now=None):
+        """Seconds until the next channel is due"""
+        now = now or time.time()
+        while self._heap:
+            due_at, channel_id = self._heap[0]
+            state = self._states.get(channel_id)
+            if state is None or state.due_at != due_at:
+                heapq.heappop(self._heap)
+                continue
+            return max(0, due_at - now)
+        return self.default_interval
+
+    def record_poll(self, channel_id, post_times=(), has_new_post=False, now=None):
+        """
+        Update the channel rate from the post timestamps seen by a poll and schedule the next poll.
+
+        Args:
+            post_times: unix timestamps of the posts returned by the poll
+            has_new_post: the poll found a post that wasn't processed before
+        """
+        now = now or time.time()
+        state = self._states.get(channel_id)
+        if state is None:
+            return None
+
+        for post_at in sorted(post_times):
+            if state.last_post_at is not None and post_at > state.last_post_at:
+                gap = post_at - state.last_post_at
+                state.ema_gap = gap if state.ema_gap is None else EMA_ALPHA * gap + (1 - EMA_ALPHA) * state.ema_gap
+            if state.last_post_at is None or post_at > state.last_post_at:
+                state.last_post_at = post_at
+
+        if has_new_post:
+            # boost: posts come in bursts
+            interval = self.min_interval
+        else:
+            interval = self.default_interval if state.ema_gap is None else state.ema_gap / POLLS_PER_GAP
+            if state.last_post_at is not None:
+                interval = max(interval, (now - state.last_post_at) / SILENCE_FACTOR)
+
+        state.interval = self._clamp(interval)
+        self._push(channel_id, now + state.interval)
+        return state.interval
+
+    def defer(self, channel_id, seconds=None, now=None):
+        """Poll the channel again later without touching its rate (failed poll, session cooling down)"""
+        now = now or time.time()
+        state = self._states.get(channel_id)
+        if state is None:
+            return
+        self._push(channel_id, now + self._clamp(seconds if seconds is not None else state.interval))
+
+    def interval(self, channel_id):
+        state = self._states.get(channel_id)
+        return state.interval if state else None
+
+    def __len__(self):
+        return len(self._states)
+
+class SessionPacer:
+    """Start times of the polls of every session, POLL_CHANNEL_DELAY apart"""
+    def __init__(self, delay=POLL_CHANNEL_DELAY):
+        self.delay = delay
+        self._next_start = {}
+
+    def reserve(self, session_id, now=None):
+        """Reserve the next free start time of the session, returns the seconds to wait for it"""
+        now = now or time.monotonic()
+        start = max(now, self._next_start.get(session_id, now))
+        self._next_start[session_id] = start + self.delay
+        return start - now
+
+    async def wait_turn(self, session_id):
+        wait = self.reserve(session_id)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,168 @@
+"""
+Automatic channel-to-session load balancing.
+
+Every channel gets a weight from its observed post rate and media volume,
+every session a capacity that shrinks with the FloodWait seconds it got
+recently. Channels that have no session, or whose session was picked by the
+balancer (Channel.session_auto), are spread over the connected sessions so
+that load / capacity is as even as possible. Sessions picked by hand are
+never moved, but their channels still count toward the session load.
+"""
+import math
+import time
+import logging
+from datetime import timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from tg_bot.config import BALANCER_WINDOW_HOURS
+
+logger = logging.getLogger('session_balancer')
+
+POLL_COST = 1.0  # every active channel costs one request per cycle
+POST_WEIGHT = 0.5  # per post per hour
+MEDIA_WEIGHT = 2.0  # per media post per hour, downloads are the expensive part
+FLOOD_PENALTY_SECONDS = 300  # this much recent flood wait halves the capacity
+FLOOD_HALF_LIFE = 3600  # recent flood wait seconds decay with this half-life
+STICKINESS = 0.9  # keep a channel on its current session unless the gain is >10%
+
+class FloodStats:
+    """Recent FloodWait seconds per session, decaying over time"""
+    def __init__(self, half_life=FLOOD_HALF_LIFE):
+        self.half_life = half_life
+        self._values = {}
+
+    def _decayed(self, value, recorded_at, now):
+        return value * math.pow(0.5, (now - recorded_at) / self.half_life)
+
+    def record(self, session_id, seconds):
+        if session_id is None:
+            return
+        now = time.monotonic()
+        value, recorded_at = self._values.get(session_id, (0, now))
+        self._values[session_id] = (self._decayed(value, recorded_at, now) + seconds, now)
+
+    def get(self, session_id):
+        if session_id not in self._values:
+            return 0
+        value, recorded_at = self._values[session_id]
+        return self._decayed(value, recorded_at, time.monotonic())
+
+flood_stats = FloodStats()
+
+def session_capacity(flood_seconds):
+    return 1.0 / (1.0 + flood_seconds / FLOOD_PENALTY_SECONDS)
+
+def channel_weight(posts_per_hour, media_per_hour):
+    return POLL_COST + posts_per_hour * POST_WEIGHT + media_per_hour * MEDIA_WEIGHT
+
+def plan_assignments(channel_weights, current, capacities, base_loads=None):
+    """
+    Greedy longest-processing-time assignment.
+
+    Args:
+        channel_weights: {channel_id: weight} of the channels to place
+        current: {channel_id: session_id} current placement (or None)
+        capacities: {session_id: relative capacity}
+        base_loads: {session_id: load of the pinned channels}
+
+    Returns:
+        {channel_id: session_id}
+    """
+    if not capacities:
+        return {}
+
+    loads = {session_id: (base_loads or {}).get(session_id, 0.0) for session_id in capacities}
+    plan = {}
+    for channel_id, weight in sorted(channel_weights.items(), key=lambda item: (-item[1], item[0])):
+        def cost(session_id):
+            value = (loads[session_id] + weight) / capacities[session_id]
+            if current.get(channel_id) == session_id:
+                value *= STICKINESS
+            return value
+
+        best = min(sorted(capacities), key=cost)
+        plan[channel_id] = best
+        loads[best] += weight
+    return plan
+
+def _channel_rates(channel_ids, window_hours=BALANCER_WINDOW_HOURS):
+    """Posts and media posts per hour for each channel over the window"""
+    from admin_panel.models import Message
+
+    since = timezone.now() - timedelta(hours=window_hours)
+    rows = (
+        Message.objects.filter(channel_id__in=channel_ids, created_at__gte=since)
+        .values('channel_id')
+        .annotate(posts=Count('id'), media=Count('id', filter=~Q(media='') & Q(media__isnull=False)))
+    )
+    return {
+        row['channel_id']: (row['posts'] / window_hours, row['media'] / window_hours)
+        for row in rows
+    }
+
+def rebalance(session_ids, stats=flood_stats, channel_filter=None):
+    """
+    Reassign the movable channels across the given sessions and persist the changes.
+
+    Args:
+        session_ids: ids of the sessions that currently have a connected client
+        channel_filter: only balance the channels it accepts (the shard of a parser worker)
+
+    Returns:
+        number of channels whose session changed
+    """
+    from admin_panel.models import Channel
+
+    session_ids = [session_id for session_id in session_ids if session_id is not None]
+    if not session_ids:
+        return 0
+
+    channels = list(Channel.objects.filter(is_active=True).only('id', 'session_id', 'session_auto'))
+    if channel_filter:
+        channels = [channel for channel in channels if channel_filter(channel)]
+    if not channels:
+        return 0
+
+    rates = _channel_rates([channel.id for channel in channels])
+    weights = {
+        channel.id: channel_weight(*rates.get(channel.id, (0.0, 0.0)))
+        for channel in channels
+    }
+
+    movable = []
+    base_loads = {}
+    for channel in channels:
+        if channel.session_id is None or channel.session_auto:
+            movable.append(channel)
+        elif channel.session_id in session_ids:
+            base_loads[channel.session_id] = base_loads.get(channel.session_id, 0.0) + weights[channel.id]
+
+    capacities = {session_id: session_capacity(stats.get(session_id)) for session_id in session_ids}
+    plan = plan_assignments(
+        {channel.id: weights[channel.id] for channel in movable},
+        {channel.id: channel.session_id for channel in movable},
+        capacities,
+        base_loads,
+    )
+
+    changed = []
+    for channel in movable:
+        new_session_id = plan.get(channel.id)
+        if new_session_id and (new_session_id != channel.session_id or not channel.session_auto):
+            channel.session_id = new_session_id
+            channel.session_auto = True
+            changed.append(channel)
+
+    if changed:
+        Channel.objects.bulk_update(changed, ['session', 'session_auto'], batch_size=500)
+
+    loads = dict(base_loads)
+    for channel_id, session_id in plan.items():
+        loads[session_id] = loads.get(session_id, 0.0) + weights[channel_id]
+    load_info = ", ".join(
+        f"{session_id}: {loads.get(session_id, 0.0):.1f}/{capacities[session_id]:.2f}" for session_id in sorted(capacities)
+    )
+    logger.info(f"Rebalanced {len(movable)} channels over {len(session_ids)} sessions, moved {len(changed)} (load/capacity: {load_info})")
+    return len(changed)
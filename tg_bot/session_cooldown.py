@@ -0,0 +1,86 @@
+"""
+Per-session FloodWait cooldowns for the parser.
+
+A FloodWait pauses only the client that got it: the parser skips the session
+until the cooldown ends and reroutes its public channels to healthy sessions.
+Join floods only stop JoinChannelRequest calls. Cooldowns are stored on
+TelegramSession so a restart doesn't hit the same flood again.
+"""
+import time
+import logging
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from asgiref.sync import sync_to_async
+
+logger = logging.getLogger('session_cooldown')
+
+SCOPE_ALL = 'all'
+SCOPE_JOIN = 'join'
+
+# TelegramSession field that stores each scope
+SCOPE_FIELDS = {
+    SCOPE_ALL: 'flood_wait_until',
+    SCOPE_JOIN: 'join_flood_wait_until',
+}
+
+class CooldownRegistry:
+    """Cooldown end times by (session_id, scope), session_id None is the default client"""
+    def __init__(self):
+        self._until = {}
+
+    def load(self):
+        """Restore the cooldowns that are still running from the DB"""
+        from admin_panel.models import TelegramSession
+
+        now = datetime.now(dt_timezone.utc)
+        restored = 0
+        for scope, field in SCOPE_FIELDS.items():
+            rows = TelegramSession.objects.filter(**{f'{field}__gt': now}).values_list('id', field)
+            for session_id, until in rows:
+                self._until[(session_id, scope)] = until.timestamp()
+                restored += 1
+        if restored:
+            logger.info(f"Restored {restored} session cooldown(s) from the database")
+        return restored
+
+    def set(self, session_id, seconds, scope=SCOPE_ALL):
+        """Start a cooldown, returns its end time"""
+        until = time.time() + seconds
+        key = (session_id, scope)
+        self._until[key] = max(self._until.get(key, 0), until)
+        logger.warning(f"Session {session_id or 'default'} cooling down ({scope}) for {timedelta(seconds=int(seconds))}")
+        return datetime.fromtimestamp(self._until[key], dt_timezone.utc)
+
+    def remaining(self, session_id, scope=SCOPE_ALL):
+        until = self._until.get((session_id, scope))
+        if not until:
+            return 0
+        left = until - time.time()
+        if left <= 0:
+            del self._until[(session_id, scope)]
+            return 0
+        return left
+
+    def is_cooling(self, session_id, scope=SCOPE_ALL):
+        return self.remaining(session_id, scope) > 0
+
+def _persist_cooldown(session_id, scope, until):
+    from admin_panel.models import TelegramSession
+
+    if session_id is None:
+        return
+    # update() keeps updated_at untouched, so this is not seen as a session change
+    TelegramSession.objects.filter(id=session_id).update(**{SCOPE_FIELDS[scope]: until})
+
+cooldowns = CooldownRegistry()
+load_cooldowns = sync_to_async(cooldowns.load)
+persist_cooldown = sync_to_async(_persist_cooldown)
+
+async def start_cooldown(session_id, seconds, scope=SCOPE_ALL):
+    """Register a FloodWait for the session and store it in the DB"""
+    until = cooldowns.set(session_id, seconds, scope)
+    try:
+        await persist_cooldown(session_id, scope, until)
+    except Exception as e:
+        logger.error(f"Error saving cooldown of session {session_id}: {e}")
+    return until
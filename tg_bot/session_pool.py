@@ -0,0 +1,175 @@
+"""
+In-memory Telethon sessions for the parser.
+
+Clients are built on StringSession loaded from TelegramSession.session_string,
+or from session_data (base64 of a StringSession string or of a SQLite
+.session file). A session that only exists as a file on disk is read once and
+converted. Nothing is written to disk: session strings that changed (new
+auth key, DC migration) are written back to the DB in one batch by flush().
+"""
+import os
+import base64
+import sqlite3
+import logging
+import tempfile
+
+from asgiref.sync import sync_to_async
+from telethon.crypto import AuthKey
+from telethon.sessions import StringSession
+
+from tg_bot.session_manager import decode_session_data
+
+logger = logging.getLogger('session_pool')
+
+SQLITE_HEADER = b'SQLite format 3\x00'
+DEFAULT_SESSION_FILES = ('telethon_user_session', 'telethon_session')
+
+def _read_sqlite_session(connection):
+    row = connection.execute('SELECT dc_id, server_address, port, auth_key FROM sessions').fetchone()
+    if not row or not row[3]:
+        return None
+    session = StringSession()
+    session.set_dc(row[0], row[1], row[2])
+    session.auth_key = AuthKey(row[3])
+    return session.save()
+
+def sqlite_to_string_session(data):
+    """Convert the content of a Telethon SQLite .session file to a StringSession string"""
+    try:
+        connection = sqlite3.connect(':memory:')
+        if hasattr(connection, 'deserialize'):
+            connection.deserialize(data)
+            try:
+                return _read_sqlite_session(connection)
+            finally:
+                connection.close()
+        connection.close()
+
+        # Python < 3.11 can't open a database from memory
+        with tempfile.NamedTemporaryFile(suffix='.session') as f:
+            f.write(data)
+            f.flush()
+            connection = sqlite3.connect(f.name)
+            try:
+                return _read_sqlite_session(connection)
+            finally:
+                connection.close()
+    except Exception as e:
+        logger.error(f"Failed to read SQLite session data: {e}")
+        return None
+
+def session_file_to_string(session_filename):
+    """Read a .session file (read only) and convert it to a StringSession string"""
+    path = session_filename if session_filename.endswith('.session') else f'{session_filename}.session'
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return sqlite_to_string_session(f.read())
+
+def _is_valid_string_session(value):
+    try:
+        return bool(value) and StringSession(value).auth_key is not None
+    except Exception:
+        return False
+
+def _decode_stored_session(session):
+    """StringSession string from the session_string / session_data fields"""
+    if _is_valid_string_session(session.session_string):
+        return session.session_string
+
+    if session.session_data:
+        try:
+            raw = base64.b64decode(session.session_data + '=' * (-len(session.session_data) % 4))
+        except Exception:
+            raw = b''
+        if raw.startswith(SQLITE_HEADER):
+            return sqlite_to_string_session(raw)
+        decoded = decode_session_data(session.session_data)
+        if _is_valid_string_session(decoded):
+            return decoded
+    return None
+
+class SessionPool:
+    """Session strings of the connected clients and their DB write-back"""
+    def __init__(self):
+        self._clients = {}
+        self._saved = {}
+
+    def candidates(self, session=None, session_filename=None):
+        """
+        StringSession strings for a TelegramSession (or the default session file), best first.
+
+        A TelegramSession only gets its own DB fields and its own session_file.
+        The default session files hold another account: a session that fell
+        back to them would connect as that account, and flush() would store
+        its auth key in the wrong row. They are tried for the default client
+        (session None) only.
+
+        Returns:
+            list of (string, source) where source is 'db' or 'file'
+        """
+        found = []
+        if session is not None:
+            value = _decode_stored_session(session)
+            if value:
+                found.append((value, 'db'))
+            filenames = [session.session_file] if session.session_file else []
+        else:
+            filenames = [session_filename] if session_filename else []
+            filenames.extend(DEFAULT_SESSION_FILES)
+        for filename in filenames:
+            value = session_file_to_string(filename)
+            if value and value not in [string for string, _ in found]:
+                logger.debug(f"Found session {getattr(session, 'id', None) or 'default'} in file {filename}")
+                found.append((value, 'file'))
+        return found
+
+    def load(self, session=None, session_filename=None):
+        """The best StringSession string and its source, (None, None) if nothing was found"""
+        found = self.candidates(session, session_filename)
+        return found[0] if found else (None, None)
+
+    def track(self, session_id, client, saved_string=None):
+        """
+        Watch the client's session for changes. saved_string is what the DB
+        holds now, None makes the next flush write the session.
+        """
+        if session_id is None:
+            return
+        self._clients[session_id] = client
+        self._saved[session_id] = saved_string
+
+    def untrack(self, session_id):
+        self._clients.pop(session_id, None)
+        self._saved.pop(session_id, None)
+
+    def _flush(self):
+        from admin_panel.models import TelegramSession
+
+        changed = []
+        for session_id, client in list(self._clients.items()):
+            try:
+                value = client.session.save()
+            except Exception as e:
+                logger.error(f"Error serializing session {session_id}: {e}")
+                continue
+            if value and value != self._saved.get(session_id):
+                changed.append(TelegramSession(id=session_id, session_string=value))
+
+        if changed:
+            # bulk_update doesn't touch updated_at, session reloads only follow real edits
+            TelegramSession.objects.bulk_update(changed, ['session_string'], batch_size=100)
+            for session in changed:
+                self._saved[session.id] = session.session_string
+            logger.info(f"Saved {len(changed)} updated session string(s) to the database")
+        return len(changed)
+
+    async def flush(self):
+        """Write the changed session strings to the DB in one batch"""
+        try:
+            return await sync_to_async(self._flush)()
+        except Exception as e:
+            logger.error(f"Error saving session strings: {e}")
+            return 0
+
+session_pool = SessionPool()
@@ -3,19 +3,28 @@ import json
 import os
 import signal
 import re
+import time
 import logging
 import traceback
 from datetime import datetime
 import django
+from django.db import transaction, IntegrityError
+from django.db.models import BigIntegerField, Max
+from django.db.models.functions import Cast
 from typing import Dict, Optional, Tuple
 
 from telethon import TelegramClient, errors, client
+from telethon.sessions import StringSession
 from telethon.tl.functions.channels import JoinChannelRequest
+from telethon.tl.functions.updates import GetStateRequest
 from telethon.tl.types import MessageMediaPhoto, MessageMediaDocument, MessageMediaWebPage
 from asgiref.sync import sync_to_async
 from tg_bot.config import (
     API_ID, API_HASH, FILE_JSON, MAX_MESSAGES,
-    CATEGORIES_JSON, DATA_FOLDER, MESSAGES_FOLDER
+    CATEGORIES_JSON, DATA_FOLDER, MESSAGES_FOLDER,
+    BALANCER_INTERVAL, CLIENT_INIT_DEADLINE,
+    SESSION_FLUSH_INTERVAL, SESSION_RELOAD_INTERVAL, HEALTH_CHECK_INTERVAL,
+    PARSER_SHARDS
 )
 
 # configuration of logging
@@ -32,40 +41,84 @@ django.setup()
 
 # import models
 from admin_panel import models
+from tg_bot.session_balancer import rebalance, flood_stats
+from tg_bot.session_cooldown import cooldowns, load_cooldowns, start_cooldown, SCOPE_JOIN
+from tg_bot.poll_scheduler import PollScheduler, SessionPacer
+from tg_bot.session_pool import session_pool
+from tg_bot.client_health import breakers
+from tg_bot.parser_shards import ShardAssignment
+from tg_bot.parser_lease import ShardLease
+from tg_bot import outbox
+from tg_bot.heartbeat import Heartbeat
+from tg_bot.entity_index import entities_from_message, index_message
+from admin_panel.feed_cache import bump_feed_version
 
-def _save_message_to_db(message_data):
+def _save_message_to_db(message_data, category_id=None):
     """
-    save message to db
+    save message to db with its entity index and add it to the outbox for the downstream stages,
+    the cached index feed is invalidated
     """
     try:
-        channel = models.Channel.objects.get(name=message_data['channel_name'])
-        message = models.Message(
-            text=message_data['text'],
-            media=message_data['media'],
-            media_type=message_data['media_type'],
-            telegram_message_id=message_data['message_id'],
-            telegram_channel_id=message_data['channel_id'],
-            telegram_link=message_data['link'],
-            channel=channel,
-            created_at=message_data['date'],
-            session_used=message_data.get('session_used')
-        )
-        message.save()
-        session_info = f" (via {message_data.get('session_used').phone})" if message_data.get('session_used') else ""
-        logger.info(f"Saved message: channel '{channel.name}', message ID {message_data['message_id']}{session_info}")
+        with transaction.atomic():
+            channel = models.Channel.objects.get(name=message_data['channel_name'])
+            # the post was saved before (restart, lease loss, shard move), the subscribers had it
+            if models.Message.objects.filter(channel=channel, telegram_message_id=str(message_data['message_id'])).exists():
+                logger.info(f"Message {message_data['message_id']} of channel '{channel.name}' is already saved")
+                return None
+            message = models.Message(
+                text=message_data['text'],
+                media=message_data['media'],
+                media_type=message_data['media_type'],
+                telegram_message_id=message_data['message_id'],
+                telegram_channel_id=message_data['channel_id'],
+                telegram_link=message_data['link'],
+                channel=channel,
+                created_at=message_data['date'],
+                session_used_id=message_data.get('session_id')
+            )
+            message.save()
+            index_message(message, message_data.get('entities'))
+            outbox.append(message_data, category_id, message)
+        bump_feed_version()
+        logger.info(f"Saved message: channel '{channel.name}', message ID {message_data['message_id']}")
         return message
+    except IntegrityError:
+        # saved by another process in the meantime
+        logger.info(f"Message {message_data['message_id']} of channel '{message_data['channel_name']}' is already saved")
+        return None
     except Exception as e:
         logger.error(f"Error saving message: {e}")
+        # the subscribers still get the message
+        try:
+            outbox.append(message_data, category_id)
+        except Exception as outbox_error:
+            logger.error(f"Error adding message to the outbox: {outbox_error}")
         return None
 
 def _get_channels():
     channels = list(models.Channel.objects.all().select_related('category', 'session').order_by('id'))
+    if shard.is_sharded:
+        shard.update_sessions(models.TelegramSession.objects.filter(is_active=True).values_list('id', flat=True))
+        channels = [channel for channel in channels if shard.owns_channel(channel)]
     return channels
 
 def _get_telegram_sessions():
     sessions = list(models.TelegramSession.objects.filter(is_active=True).order_by('id'))
+    if shard.is_sharded:
+        shard.update_sessions(session.id for session in sessions)
+        sessions = [session for session in sessions if shard.owns_session(session.id)]
     return sessions
 
+def _get_last_message_id(channel):
+    """Highest Telegram message id saved for the channel, None before its first message"""
+    return models.Message.objects.filter(channel=channel, telegram_message_id__regex=r'^[0-9]+$').aggregate(
+        last=Max(Cast('telegram_message_id', BigIntegerField()))
+    )['last']
+
+def _get_polling_interval():
+    settings = models.BotSettings.objects.first()
+    return settings.polling_interval if settings and settings.polling_interval else 30
+
 def _get_session_by_id(session_id):
     if not session_id:
         return None
@@ -95,15 +148,44 @@ get_channels = sync_to_async(_get_channels)
 get_category_id = sync_to_async(_get_category_id)
 get_telegram_sessions = sync_to_async(_get_telegram_sessions)
 get_session_by_id = sync_to_async(_get_session_by_id)
+get_polling_interval = sync_to_async(_get_polling_interval)
+get_last_message_id = sync_to_async(_get_last_message_id)
+rebalance_channels = sync_to_async(rebalance)
+get_session_candidates = sync_to_async(session_pool.candidates)
 
 last_processed_message_ids = {}
 
+# seconds between reloads of the channel list
+CHANNELS_REFRESH_INTERVAL = 30
+
+# polls started ahead per connected session, the pacer spaces them out
+POLLS_PER_SESSION = 2
+
 # flag for stop bot
 stop_event = False
 
+# part of the sessions and channels this process works on (see parser_shards)
+shard = ShardAssignment()
+
+# set when the shard lease was lost, the parser restarts and acquires a shard again
+lease_lost = False
+
 # Dictionary to store Telethon clients for different sessions
 telethon_clients = {}
 
+# errors that mean the client itself is broken (dropped connection, revoked authorization)
+AUTH_REVOKED_ERRORS = (errors.UnauthorizedError, errors.AuthKeyDuplicatedError)
+CLIENT_FAILURE_ERRORS = (ConnectionError,) + AUTH_REVOKED_ERRORS
+
+# session id -> task of a connection in progress
+connecting_sessions = {}
+
+# session id -> updated_at of the record that failed to connect
+failed_sessions = {}
+
+# status heartbeat of this parser shard, created once the shard lease is acquired
+heartbeat = None
+
 async def get_channel_messages(client, channel_identifier):
     """
     getting messages from the specified channel
@@ -117,6 +199,12 @@ async def get_channel_messages(client, channel_identifier):
     except errors.ChannelInvalidError:
         logger.warning(f"Channel {channel_identifier} not found or unavailable")
         return [], None
+    except errors.FloodError:
+        # handled by the caller, it pauses only this session
+        raise
+    except CLIENT_FAILURE_ERRORS:
+        # the session is broken, not the channel
+        raise
     except Exception as e:
         logger.error(f"Error getting messages from channel {channel_identifier}: {e}")
         return [], None
@@ -145,7 +233,8 @@ async def download_media(client, message, media_dir):
 
 async def save_message_to_data(message, channel, queue, category_id=None, client=None, session=None):
     """
-    saving the message and sending information to the queue
+    saving the message and handing it to the downstream stages through the outbox.
+    queue is no longer used, it is kept for the existing callers
     """
     try:        
         # data about media
@@ -184,17 +273,14 @@ async def save_message_to_data(message, channel, queue, category_id=None, client
             'channel_name': channel_name,
             'link': f"https://t.me/c/{message.peer_id.channel_id}/{message.id}",
             'date': message.date.strftime("%Y-%m-%d %H:%M:%S"),
-            'session_used': session
+            'session_id': session.id if session else None,
+            'entities': entities_from_message(message)
         }
         
-        # save to DB
-        await save_message_to_db(message_info)
-        
-        # send to queue
-        queue.put({
-            'message_info': message_info, 
-            'category_id': category_id
-        })
+        # save to DB, the outbox record is written in the same transaction
+        await save_message_to_db(message_info, category_id)
+        if heartbeat:
+            heartbeat.record_messages()
         
         session_info = f" (via {session.phone})" if session else ""
         logger.info(f"Saved message {message.id} from channel '{channel_name}'{session_info}")
@@ -211,61 +297,88 @@ def extract_username_from_link(link):
         return username_match.group(1)
     return None
 
+def is_private_link(link):
+    """invite and /c/ links are only reachable by the session that joined them"""
+    return bool(re.search(r'(?:t|telegram)\.me/(?:joinchat/|\+|c/)', link or ''))
+
+def is_unavailable(session_id):
+    """Session in FloodWait cooldown or with an open circuit breaker"""
+    return cooldowns.is_cooling(session_id) or breakers.is_open(session_id)
+
+def select_client(channel):
+    """
+    Pick the client for the channel: its assigned session, the default client
+    or the first one. A session in FloodWait cooldown or with an open circuit
+    breaker is replaced by a healthy one for public channels, private channels
+    wait for their own session.
+    """
+    channel_session_id = getattr(channel, 'session_id', None)
+    client_info = None
+    
+    if channel_session_id and str(channel_session_id) in telethon_clients:
+        # Use the channel's assigned session
+        client_info = telethon_clients[str(channel_session_id)]
+        logger.debug(f"Using assigned session {channel_session_id} for channel '{channel.name}'")
+    elif 'default' in telethon_clients:
+        # Use the default client if available
+        client_info = telethon_clients['default']
+        logger.debug(f"Using default session for channel '{channel.name}'")
+    elif telethon_clients:
+        # Use the first available client
+        first_key = next(iter(telethon_clients))
+        client_info = telethon_clients[first_key]
+        logger.debug(f"Using first available session for channel '{channel.name}'")
+    else:
+        return None
+    
+    if not is_unavailable(client_info['session_id']):
+        return client_info
+    
+    if is_private_link(channel.url):
+        logger.debug(f"Session of private channel '{channel.name}' is unavailable, skipping")
+        return None
+    
+    healthy = [info for info in telethon_clients.values() if not is_unavailable(info['session_id'])]
+    if not healthy:
+        return None
+    
+    rerouted = healthy[channel.id % len(healthy)]
+    logger.debug(f"Session {client_info['session_id'] or 'default'} is unavailable, channel '{channel.name}' rerouted to {rerouted['session_id'] or 'default'}")
+    return rerouted
+
 async def initialize_client(session_id=None, session_filename=None):
     """Initialize a Telethon client for a specific session"""
-    # If session_id is provided, look up the DB record
+    session = None
     if session_id:
         session = await get_session_by_id(session_id)
-        if session and session.session_file:
-            session_filename = session.session_file
-            # If it's a custom session file from our DB
-            if not os.path.exists(f'{session_filename}.session'):
-                # Fall back to default session files
-                if os.path.exists('telethon_user_session.session'):
-                    session_filename = 'telethon_user_session'
-                elif os.path.exists('telethon_session.session'):
-                    session_filename = 'telethon_session'
-                else:
-                    logger.error(f"No session file found for session ID {session_id}")
-                    return None, None
-        else:
-            # Default session files if the session record doesn't specify one
-            if os.path.exists('telethon_user_session.session'):
-                session_filename = 'telethon_user_session'
-            elif os.path.exists('telethon_session.session'):
-                session_filename = 'telethon_session'
-            else:
-                logger.error(f"No default session file found")
-                return None, None
-    elif not session_filename:
-        # Default to checking normal session files
-        if os.path.exists('telethon_user_session.session'):
-            session_filename = 'telethon_user_session'
-        elif os.path.exists('telethon_session.session'):
-            session_filename = 'telethon_session'
-        else:
-            logger.error("No session file found")
+        if session is None:
+            # never fall back to the default session files for a session that is gone
+            logger.error(f"Session ID {session_id} not found")
             return None, None
     
-    # Session file with a unique suffix to avoid conflicts
-    unique_session = f"{session_filename}_{session_id or 'default'}_{os.getpid()}"
+    # Sessions live in memory, loaded from the DB or converted from the session's own file.
+    # A session re-authorized through the bot may only have a fresh file, so both are tried in turn
+    candidates = await get_session_candidates(session, session_filename)
+    session_label = f"ID {session_id}" if session_id else (session_filename or 'default')
+    if not candidates:
+        logger.error(f"No session data or session file found for session {session_label}")
+        return None, None
     
+    for session_string, source in candidates:
+        client, me = await _connect_client(session_string, session_label)
+        if client:
+            # A session converted from its own file is stored in the DB on the next flush,
+            # the default client (session_id None) is never written back
+            session_pool.track(session_id, client, session_string if source == 'db' else None)
+            return client, me
+    return None, None
+
+async def _connect_client(session_string, session_label):
+    """Connect a client on the session string and check its authorization"""
+    client = None
     try:
-        # Copy the session file to prevent concurrent access
-        if os.path.exists(f'{session_filename}.session'):
-            import shutil
-            try:
-                shutil.copy2(f'{session_filename}.session', f'{unique_session}.session')
-                logger.debug(f"Created temporary session file: {unique_session}.session")
-            except Exception as e:
-                logger.error(f"Error copying session file: {e}")
-                # Continue with original file if copy fails
-                unique_session = session_filename
-        else:
-            unique_session = session_filename
-        
-        # Create Telethon client with the session file
-        client = TelegramClient(unique_session, API_ID, API_HASH)
+        # Create Telethon client with the in-memory session
+        client = TelegramClient(StringSession(session_string), API_ID, API_HASH)
         
         # Connect with timeout and retry logic
         max_retries = 3
@@ -282,7 +395,7 @@ async def initialize_client(session_id=None, session_filename=None):
                 except asyncio.TimeoutError:
                     retry_count += 1
                     backoff = retry_count * 2  # Exponential backoff
-                    logger.warning(f"Connection timeout for session {session_filename}. Retry {retry_count}/{max_retries} in {backoff}s")
+                    logger.warning(f"Connection timeout for session {session_label}. Retry {retry_count}/{max_retries} in {backoff}s")
                     
                     if not connect_task.done():
                         connect_task.cancel()
@@ -290,14 +403,14 @@ async def initialize_client(session_id=None, session_filename=None):
                     if retry_count < max_retries:
                         await asyncio.sleep(backoff)
                     else:
-                        logger.error(f"Failed to connect after {max_retries} attempts for session {session_filename}")
+                        logger.error(f"Failed to connect after {max_retries} attempts for session {session_label}")
                         await client.disconnect()
                         return None, None
                         
             except Exception as e:
                 retry_count += 1
                 backoff = retry_count * 2
-                logger.error(f"Error connecting to Telegram for session {session_filename}: {e}")
+                logger.error(f"Error connecting to Telegram for session {session_label}: {e}")
                 
                 if retry_count < max_retries:
                     logger.info(f"Retrying in {backoff} seconds... ({retry_count}/{max_retries})")
@@ -312,62 +425,452 @@ async def initialize_client(session_id=None, session_filename=None):
         
         # Check authorization
         if not await client.is_user_authorized():
-            logger.error(f"Session {session_filename} exists but is not authorized")
+            logger.error(f"Session {session_label} exists but is not authorized")
             await client.disconnect()
             return None, None
             
         # Get user info
         try:
             me = await client.get_me()
-            logger.info(f"Initialized client for session {session_filename} as: {me.first_name} (@{me.username}) [ID: {me.id}]")
-            
-            # If we have a session_id, update the DB record with username info
-            if session_id:
-                @sync_to_async
-                def update_session_info():
-                    try:
-                        session = models.TelegramSession.objects.get(id=session_id)
-                        if not session.session_file:
-                            session.session_file = session_filename
-                            session.save()
-                    except Exception as e:
-                        logger.error(f"Error updating session info: {e}")
-                
-                await update_session_info()
-            
+            logger.info(f"Initialized client for session {session_label} as: {me.first_name} (@{me.username}) [ID: {me.id}]")
             return client, me
         except Exception as e:
-            logger.error(f"Error getting account information for session {session_filename}: {e}")
+            logger.error(f"Error getting account information for session {session_label}: {e}")
             await client.disconnect()
             return None, None
             
+    except asyncio.CancelledError:
+        # connection deadline of start_clients
+        if client:
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
+        raise
     except Exception as e:
-        logger.error(f"Error initializing client for session {session_filename}: {e}")
-        try:
-            await client.disconnect()
-        except:
-            pass
+        logger.error(f"Error initializing client for session {session_label}: {e}")
+        if client:
+            try:
+                await client.disconnect()
+            except:
+                pass
+        return None, None
+
+async def _connect_session(session):
+    """Initialize the client of one session and add it to the pool"""
+    client, me = await initialize_client(session_id=session.id)
+    if not client:
+        logger.error(f"Failed to initialize client for session {session.phone} (ID: {session.id})")
+        # not retried by reload_sessions until the session record changes
+        failed_sessions[session.id] = session.updated_at
+        return False
+    failed_sessions.pop(session.id, None)
+    telethon_clients[str(session.id)] = {
+        'client': client,
+        'user': me,
+        'session_id': session.id,
+        'session': session,
+        'updated_at': session.updated_at
+    }
+    logger.info(f"Initialized client for session {session.phone} (ID: {session.id})")
+    return True
+
+def spawn_connect(session, deadline=None):
+    """Connect a session in the background, the client joins telethon_clients when it is up"""
+    coro = _connect_session(session)
+    if deadline:
+        coro = asyncio.wait_for(coro, deadline)
+    task = asyncio.create_task(coro)
+    connecting_sessions[session.id] = task
+
+    def forget(finished):
+        if connecting_sessions.get(session.id) is finished:
+            del connecting_sessions[session.id]
+        if not finished.cancelled() and isinstance(finished.exception(), asyncio.TimeoutError):
+            logger.warning(f"Session {session.phone} (ID: {session.id}) did not connect within {deadline}s")
+
+    task.add_done_callback(forget)
+    return task
+
+async def remove_client(key):
+    """Take a client out of the pool and disconnect it, the other clients keep running"""
+    client_info = telethon_clients.pop(key, None)
+    if not client_info:
+        return
+    # keep an auth key that changed since the last flush
+    await session_pool.flush()
+    session_pool.untrack(client_info['session_id'])
+    breakers.forget(client_info['session_id'])
+    try:
+        await asyncio.wait_for(client_info['client'].disconnect(), timeout=5)
+        logger.info(f"Client for session {key} disconnected")
+    except Exception as e:
+        logger.error(f"Error disconnecting client for session {key}: {e}")
+
+def _mark_session_unauthorized(session_id):
+    # update() keeps updated_at, the session is retried once it is re-authorized
+    models.TelegramSession.objects.filter(id=session_id).update(needs_auth=True, is_authorized=False)
+
+mark_session_unauthorized = sync_to_async(_mark_session_unauthorized)
+
+async def check_client(key, client_info):
+    """Ping one client, reconnect it if the connection dropped"""
+    session_id = client_info['session_id']
+    client = client_info['client']
+    try:
+        if not client.is_connected():
+            logger.warning(f"Client of session {key} is disconnected, reconnecting")
+            await asyncio.wait_for(client.connect(), timeout=15)
+        await asyncio.wait_for(client(GetStateRequest()), timeout=15)
+        breakers.record_success(session_id)
+    except AUTH_REVOKED_ERRORS as e:
+        logger.error(f"Authorization of session {key} was revoked ({e}), removing it from the parser")
+        await remove_client(key)
+        if session_id:
+            failed_sessions[session_id] = client_info.get('updated_at')
+            try:
+                await mark_session_unauthorized(session_id)
+            except Exception as db_error:
+                logger.error(f"Error marking session {session_id} as unauthorized: {db_error}")
+    except errors.FloodWaitError as e:
+        flood_stats.record(session_id, e.seconds)
+        await start_cooldown(session_id, e.seconds)
+    except Exception as e:
+        breakers.record_failure(session_id, str(e) or type(e).__name__)
+
+async def supervise_clients():
+    """
+    Background health checks of all clients. Sessions with an open breaker are
+    left alone until its backoff ends, then probed again (half-open).
+    """
+    while not stop_event:
+        checks = [
+            check_client(key, client_info)
+            for key, client_info in list(telethon_clients.items())
+            if not breakers.is_open(client_info['session_id'])
+        ]
+        if checks:
+            await asyncio.gather(*checks, return_exceptions=True)
+        await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+
+async def reload_sessions():
+    """
+    Apply the session changes made by the bot or the web panel without a restart:
+    connect new and re-activated sessions, drop deactivated or deleted ones and
+    reconnect those whose record changed (re-authorization, new session data).
+    Changes are detected by TelegramSession.updated_at, writes of the parser
+    itself (cooldowns, session strings) don't touch it.
+    """
+    try:
+        sessions = await get_telegram_sessions()
+    except Exception as e:
+        logger.error(f"Error reading sessions for reload: {e}")
+        return
+    active = {session.id: session for session in sessions}
+
+    for session_id, task in list(connecting_sessions.items()):
+        if session_id not in active:
+            task.cancel()
+
+    for key, client_info in list(telethon_clients.items()):
+        session_id = client_info.get('session_id')
+        if session_id is None:
+            continue
+        if session_id not in active:
+            logger.info(f"Session {session_id} was deactivated or removed, disconnecting it")
+            await remove_client(key)
+        elif client_info.get('updated_at') != active[session_id].updated_at:
+            logger.info(f"Session {session_id} was changed, reconnecting it")
+            await remove_client(key)
+
+    for session_id, session in active.items():
+        if str(session_id) in telethon_clients or session_id in connecting_sessions:
+            continue
+        if failed_sessions.get(session_id) == session.updated_at:
+            continue
+        logger.info(f"Connecting session {session.phone} (ID: {session_id})")
+        spawn_connect(session, CLIENT_INIT_DEADLINE)
+
+async def _wait_for_clients(tasks, deadline):
+    """Let the connections finish until the deadline, then cancel the ones still hanging"""
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.warning(f"{len(pending)} session(s) did not connect within {deadline}s")
+    connected = sum(1 for task in done if not task.cancelled() and task.exception() is None and task.result())
+    logger.info(f"Client initialization finished: {connected}/{len(tasks)} session(s) connected")
+
+async def start_clients(sessions, deadline=CLIENT_INIT_DEADLINE):
+    """
+    Connect the clients of all sessions concurrently.
+
+    Returns as soon as the first client is in telethon_clients (or every attempt
+    failed). Slower sessions keep connecting in the background and join the
+    pool when ready, attempts still running after `deadline` seconds are cancelled.
+
+    Returns:
+        the task that waits for the remaining connections
+    """
+    tasks = [spawn_connect(session) for session in sessions]
+    init_task = asyncio.create_task(_wait_for_clients(tasks, deadline))
+    while not telethon_clients and not init_task.done():
+        await asyncio.sleep(0.5)
+    return init_task
+
+async def poll_channel(channel, queue, pacer=None):
+    """
+    Poll one channel and save its new messages. With a pacer the poll waits
+    for its turn on the session it uses.
+
+    Returns:
+        (post_times, has_new_post) for the poll scheduler, None if the channel
+        could not be polled (no client, session cooling down, bad link, errors)
+    """
+    client_info = None
+    try:
+        # Get the appropriate client for this channel
+        client_info = select_client(channel)
+        
+        if not client_info:
+            if telethon_clients:
+                logger.debug(f"All sessions for channel '{channel.name}' are cooling down or failing")
+            else:
+                logger.error(f"No client available for channel '{channel.name}'")
+            return None
+        
+        if pacer:
+            await pacer.wait_turn(client_info['session_id'])
+            if is_unavailable(client_info['session_id']):
+                logger.debug(f"Session of channel '{channel.name}' became unavailable while waiting for its turn")
+                return None
+        
+        client = client_info['client']
+        session = client_info.get('session')
+        
+        # use channel link
+        channel_link = channel.url
+        
+        if not channel_link or not channel_link.startswith('https://t.me/'):
+            logger.warning(f"Channel '{channel.name}' has no valid link")
+            return None
+                
+        # first try to join channel
+        if cooldowns.is_cooling(client_info['session_id'], SCOPE_JOIN):
+            logger.debug(f"Joins are paused for this session, not joining '{channel.name}'")
+        else:
+            try:
+                # extract username from link
+                username = extract_username_from_link(channel_link)
+                if username:
+                    entity = await client.get_entity(username)
+                    await client(JoinChannelRequest(entity))
+                    logger.info(f"Successfully joined channel: @{username}")
+                else:
+                    logger.warning(f"Unable to get identifier from link: {channel_link}")
+            except errors.FloodWaitError as e:
+                hours, remainder = divmod(e.seconds, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                time_str = f"{hours}h {minutes}m {seconds}s" if hours > 0 else f"{minutes}m {seconds}s"
+                logger.warning(f"Flood wait for {time_str} when joining channel. Joins paused for this session.")
+                flood_stats.record(client_info['session_id'], e.seconds)
+                await start_cooldown(client_info['session_id'], e.seconds, SCOPE_JOIN)
+            except Exception as e:
+                logger.error(f"Error joining channel {channel_link}: {e}")
+
+        # Get messages with retry logic
+        retry_count = 0
+        max_retries = 3
+        messages = None
+        tg_channel = None
         
-        # Clean up temporary session file if it exists and differs from original
-        if unique_session != session_filename and os.path.exists(f'{unique_session}.session'):
+        while retry_count < max_retries and not messages:
             try:
-                os.remove(f'{unique_session}.session')
-                logger.debug(f"Removed temporary session file: {unique_session}.session")
+                # get messages from channel
+                messages, tg_channel = await get_channel_messages(client, channel_link)
+                if not messages or not tg_channel:
+                    retry_count += 1
+                    if retry_count < max_retries:
+                        logger.warning(f"Retry {retry_count}/{max_retries} getting messages from '{channel.name}'")
+                        await asyncio.sleep(retry_count * 2)  # Exponential backoff
+                    else:
+                        logger.error(f"Failed to get messages from '{channel.name}' after {max_retries} attempts")
+            except errors.FloodError:
+                raise
+            except CLIENT_FAILURE_ERRORS as e:
+                # fail fast, the health supervisor reconnects the client
+                logger.warning(f"Client of session {client_info['session_id'] or 'default'} failed on '{channel.name}': {e}")
+                breakers.record_failure(client_info['session_id'], str(e) or type(e).__name__)
+                return None
             except Exception as e:
-                logger.error(f"Error removing temporary session file: {e}")
+                logger.error(f"Error getting messages from channel '{channel.name}': {e}")
+                retry_count += 1
+                if retry_count < max_retries:
+                    await asyncio.sleep(retry_count * 2)
                 
-        return None, None
+        if not messages or not tg_channel:
+            logger.warning(f"Unable to get messages from channel: '{channel.name}'")
+            return None
+
+        # keyed by link only, a rerouted channel must not repeat its last message
+        channel_identifier = channel_link
+        last_message_id = last_processed_message_ids.get(channel_identifier)
+        if last_message_id is None:
+            # after a start, a lease loss or a shard move carry on from the last saved post
+            last_message_id = await get_last_message_id(channel)
+            if last_message_id is not None:
+                last_processed_message_ids[channel_identifier] = last_message_id
+        has_new_post = False
+        
+        # every post since the last poll, a channel may post several times between two polls;
+        # a channel polled for the first time starts from its latest post
+        if last_message_id is None:
+            new_messages = messages[:1]
+        else:
+            new_messages = [message for message in messages if message.id > last_message_id]
+        
+        if new_messages:
+            # get category id
+            category_id = None
+            if hasattr(channel, 'category_id'):
+                category_id = await get_category_id(channel)
+            session_info = f" (via {session.phone})" if session else ""
+            for message in sorted(new_messages, key=lambda message: message.id):
+                # send message to save
+                logger.info(f"New message in channel '{channel.name}' [ID: {message.id}]{session_info}")
+                await save_message_to_data(message, channel, queue, category_id, client, session)
+                last_processed_message_ids[channel_identifier] = message.id
+            # the first poll of a channel only sets the baseline, it is not a fresh post
+            has_new_post = last_message_id is not None
+        else:
+            logger.debug(f"Message from channel '{channel.name}' already processed")
+
+        post_times = [message.date.timestamp() for message in messages if getattr(message, 'date', None)]
+        return post_times, has_new_post
+
+    except errors.FloodError as e:
+        wait_seconds = getattr(e, 'seconds', None) or 60
+        hours, remainder = divmod(wait_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        time_str = f"{hours}h {minutes}m {seconds}s" if hours > 0 else f"{minutes}m {seconds}s"
+        if client_info:
+            # pause only this session, the others keep polling
+            logger.warning(f"Rate limit exceeded for session {client_info['session_id'] or 'default'}. Pausing it for {time_str}")
+            flood_stats.record(client_info['session_id'], wait_seconds)
+            await start_cooldown(client_info['session_id'], wait_seconds)
+        else:
+            logger.warning(f"Rate limit exceeded. Waiting {time_str}")
+            await asyncio.sleep(wait_seconds)
+        return None
+
+    except Exception as e:
+        logger.error(f"Error in telethon_task for channel '{channel.name}': {e}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        if heartbeat:
+            heartbeat.record_error(f"{channel.name}: {e}")
+        return None
+
+def session_states():
+    """State of every session of this shard for the heartbeat"""
+    states = {}
+    for key, client_info in list(telethon_clients.items()):
+        session_id = client_info.get('session_id')
+        session = client_info.get('session')
+        if cooldowns.is_cooling(session_id):
+            state = 'cooling'
+        elif breakers.is_open(session_id):
+            state = 'circuit_open'
+        else:
+            state = 'connected'
+        states[key] = {
+            'phone': session.phone if session else None,
+            'state': state,
+            'cooldown_seconds': int(cooldowns.remaining(session_id)) or None,
+            'failures': breakers.get(session_id).failures,
+        }
+    for session_id in list(connecting_sessions):
+        states.setdefault(str(session_id), {'state': 'connecting'})
+    for session_id in list(failed_sessions):
+        states.setdefault(str(session_id), {'state': 'failed'})
+    return {'shard': str(shard), 'sessions': states}
+
+async def wait_for_lease(lease, preferred=0):
+    """Acquire a shard lease, waiting as standby while every shard is owned by another process"""
+    standby_logged = False
+    while not stop_event:
+        try:
+            shard_index = await lease.acquire(preferred)
+            if shard_index is not None:
+                return shard_index
+            if not standby_logged:
+                logger.info(f"All {lease.shard_count} parser shard(s) are owned by other processes, waiting as standby")
+                standby_logged = True
+        except Exception as e:
+            logger.error(f"Error acquiring parser lease: {e}")
+        await asyncio.sleep(max(1, lease.ttl / 2))
+    return None
+
+async def keep_lease(lease):
+    """
+    Heartbeat of the shard lease. If the lease was taken over, or couldn't be
+    renewed for half its TTL, the parser stops at once, well before another
+    process can take the shard over, so two processes never poll the same
+    shard; telethon_worker_process then tries to acquire a shard again.
+    """
+    global stop_event, lease_lost
+    stop_after = lease.ttl / 2
+    while not stop_event:
+        await asyncio.sleep(lease.ttl / 4)
+        try:
+            # a renewal that hangs past the deadline counts as failed
+            remaining = lease.renewed_at + stop_after - time.monotonic()
+            if await asyncio.wait_for(lease.renew(), timeout=max(remaining, 0.1)):
+                continue
+            logger.error(f"Lease {lease.name} was taken over by another process, stopping this shard")
+        except Exception as e:
+            logger.error(f"Error renewing lease {lease.name}: {e!r}")
+            if time.monotonic() - lease.renewed_at < stop_after:
+                continue
+            logger.error(f"Lease {lease.name} could not be renewed within half its TTL, stopping this shard")
+        lease_lost = True
+        stop_event = True
+        return
 
 async def telethon_task(queue):
     global stop_event, telethon_clients
     """
     background task for parsing messages with Telethon.
     """
+    global shard, heartbeat
+    init_task = None
+    health_task = None
+    heartbeat_task = None
+    lease = None
+    lease_task = None
+    polls = {}  # channel id -> task of its poll in progress
     try:
+        # Own a shard before touching any session, other parser processes or nodes may run too
+        lease = ShardLease(shard.shard_count)
+        shard_index = await wait_for_lease(lease, shard.shard_index)
+        if shard_index is None:
+            return
+        shard = ShardAssignment(shard_index, shard.shard_count)
+        lease_task = asyncio.create_task(keep_lease(lease))
+        heartbeat = Heartbeat(lease.name, 'parser')
+        heartbeat_task = asyncio.create_task(heartbeat.run(session_states))
+
         # Get all active sessions from the database
         sessions = await get_telegram_sessions()
         
-        if not sessions:
+        if not sessions and shard.shard_index > 0:
+            logger.warning(f"No active Telegram sessions in {shard}, waiting for one to be added...")
+        elif not sessions:
             logger.warning("No active Telegram sessions found in the database")
             # Try to initialize a default client
             default_client, default_me = await initialize_client()
@@ -379,25 +882,13 @@ async def telethon_task(queue):
                 }
                 logger.info("Initialized default client as no sessions were found in database")
             else:
-                logger.error("Failed to initialize default client and no sessions in database. Parser cannot run.")
-                return
+                logger.error("Failed to initialize default client and no sessions in database. Waiting for a session to be added...")
         else:
-            # Initialize clients for all active sessions
-            for session in sessions:
-                client, me = await initialize_client(session_id=session.id)
-                if client:
-                    telethon_clients[str(session.id)] = {
-                        'client': client,
-                        'user': me,
-                        'session_id': session.id,
-                        'session': session
-                    }
-                    logger.info(f"Initialized client for session {session.phone} (ID: {session.id})")
-                else:
-                    logger.error(f"Failed to initialize client for session {session.phone} (ID: {session.id})")
+            # Connect all sessions at once, polling starts with the first one that is up
+            init_task = await start_clients(sessions)
             
-            # If no clients were initialized, try with default session
-            if not telethon_clients:
+            # If no clients were initialized, try with default session (one shard only, they would share it)
+            if not telethon_clients and shard.shard_index == 0:
                 default_client, default_me = await initialize_client()
                 if default_client:
                     telethon_clients['default'] = {
@@ -407,158 +898,131 @@ async def telethon_task(queue):
                     }
                     logger.info("Initialized default client as fallback")
                 else:
-                    logger.error("Failed to initialize any client. Parser cannot run.")
-                    return
+                    logger.error("Failed to initialize any client. Waiting for a working session...")
         
         logger.info("====== Telethon Parser started ======")
         logger.info(f"Initialized {len(telethon_clients)} client(s)")
+        last_rebalance = 0
+        rebalanced_session_ids = None
+        last_channels_refresh = 0
+        last_session_flush = 0
+        last_session_reload = time.monotonic()
+        channels_by_id = {}
+        scheduler = PollScheduler()
+        pacer = SessionPacer()
+        polled = 0
+        
+        async def poll_and_schedule(channel):
+            nonlocal polled
+            try:
+                poll_started = time.monotonic()
+                result = await poll_channel(channel, queue, pacer)
+                heartbeat.record_cycle(time.monotonic() - poll_started, channels_polled=1)
+                polled += 1
+                if result is None:
+                    scheduler.defer(channel.id)
+                else:
+                    post_times, has_new_post = result
+                    interval = scheduler.record_poll(channel.id, post_times, has_new_post)
+                    logger.debug(f"Next poll of channel '{channel.name}' in {interval:.0f}s")
+            except Exception as e:
+                logger.error(f"Error polling channel '{channel.name}': {e}")
+                heartbeat.record_error(e)
+            finally:
+                polls.pop(channel.id, None)
+        
+        health_task = asyncio.create_task(supervise_clients())
+        
+        # Don't hit the floods that were still running before the restart
+        try:
+            await load_cooldowns()
+        except Exception as e:
+            logger.error(f"Error loading session cooldowns: {e}")
 
         while not stop_event:
             try:
-                channels = await get_channels()
-                if not channels:
-                    logger.warning("No channels found for parsing. Waiting before retrying...")
-                    await asyncio.sleep(30)
-                    continue
-                
-                logger.info(f"Found {len(channels)} channels for parsing")
-                
-                active_channels = sum(1 for channel in channels if channel.is_active)
-                logger.info(f"Active channels: {active_channels}/{len(channels)}")
-                
-                for channel in channels:
-                    # Check if stop event was set during iteration
-                    if stop_event:
-                        break
-                        
-                    if not channel.is_active:
-                        logger.debug(f"Channel '{channel.name}' is not active for parsing")
-                        continue
-                        
-                    try:
-                        # Get the appropriate client for this channel
-                        channel_session_id = getattr(channel, 'session_id', None)
-                        client_info = None
-                        
-                        if channel_session_id and str(channel_session_id) in telethon_clients:
-                            # Use the channel's assigned session
-                            client_info = telethon_clients[str(channel_session_id)]
-                            logger.debug(f"Using assigned session {channel_session_id} for channel '{channel.name}'")
-                        elif 'default' in telethon_clients:
-                            # Use the default client if available
-                            client_info = telethon_clients['default']
-                            logger.debug(f"Using default session for channel '{channel.name}'")
-                        elif telethon_clients:
-                            # Use the first available client
-                            first_key = next(iter(telethon_clients))
-                            client_info = telethon_clients[first_key]
-                            logger.debug(f"Using first available session for channel '{channel.name}'")
-                        else:
-                            logger.error(f"No client available for channel '{channel.name}'")
-                            continue
-                        
-                        client = client_info['client']
-                        session = client_info.get('session')
-                        
-                        # use channel link
-                        channel_link = channel.url
-                        
-                        if not channel_link or not channel_link.startswith('https://t.me/'):
-                            logger.warning(f"Channel '{channel.name}' has no valid link")
-                            continue
-                                
-                        # first try to join channel
+                init_finished = init_task is None or init_task.done()
+
+                # Pick up sessions added, changed or removed through the bot or the web panel
+                if init_finished and time.monotonic() - last_session_reload >= SESSION_RELOAD_INTERVAL:
+                    await reload_sessions()
+                    last_session_reload = time.monotonic()
+
+                # Spread the channels over the connected sessions by load, once all of them had the chance to connect,
+                # and again when the set of connected sessions changes
+                connected_session_ids = sorted(info['session_id'] for info in telethon_clients.values() if info.get('session_id'))
+                pool_changed = rebalanced_session_ids is not None and connected_session_ids != rebalanced_session_ids
+                if init_finished and not connecting_sessions and (pool_changed or time.monotonic() - last_rebalance >= BALANCER_INTERVAL):
+                    if connected_session_ids:
                         try:
-                            # extract username from link
-                            username = extract_username_from_link(channel_link)
-                            if username:
-                                entity = await client.get_entity(username)
-                                await client(JoinChannelRequest(entity))
-                                logger.info(f"Successfully joined channel: @{username}")
-                            else:
-                                logger.warning(f"Unable to get identifier from link: {channel_link}")
-                        except errors.FloodWaitError as e:
-                            hours, remainder = divmod(e.seconds, 3600)
-                            minutes, seconds = divmod(remainder, 60)
-                            time_str = f"{hours}h {minutes}m {seconds}s" if hours > 0 else f"{minutes}m {seconds}s"
-                            logger.warning(f"Flood wait for {time_str} when joining channel. Skipping.")
-                            continue
+                            await rebalance_channels(connected_session_ids, channel_filter=shard.owns_channel if shard.is_sharded else None)
                         except Exception as e:
-                            logger.error(f"Error joining channel {channel_link}: {e}")
+                            logger.error(f"Error rebalancing channels between sessions: {e}")
+                    last_rebalance = time.monotonic()
+                    rebalanced_session_ids = connected_session_ids
 
-                        # Get messages with retry logic
-                        retry_count = 0
-                        max_retries = 3
-                        messages = None
-                        tg_channel = None
-                        
-                        while retry_count < max_retries and not messages:
-                            try:
-                                # get messages from channel
-                                messages, tg_channel = await get_channel_messages(client, channel_link)
-                                if not messages or not tg_channel:
-                                    retry_count += 1
-                                    if retry_count < max_retries:
-                                        logger.warning(f"Retry {retry_count}/{max_retries} getting messages from '{channel.name}'")
-                                        await asyncio.sleep(retry_count * 2)  # Exponential backoff
-                                    else:
-                                        logger.error(f"Failed to get messages from '{channel.name}' after {max_retries} attempts")
-                            except Exception as e:
-                                logger.error(f"Error getting messages from channel '{channel.name}': {e}")
-                                retry_count += 1
-                                if retry_count < max_retries:
-                                    await asyncio.sleep(retry_count * 2)
-                                
-                        if messages and tg_channel:
-                            # check if message is new
-                            latest_message = messages[0]
-                            channel_identifier = f"{channel_link}_{client_info['session_id'] if client_info['session_id'] else 'default'}"
-                            last_message_id = last_processed_message_ids.get(channel_identifier)
-                            
-                            if not last_message_id or latest_message.id > last_message_id:
-                                # get category id
-                                category_id = None
-                                if hasattr(channel, 'category_id'):
-                                    category_id = await get_category_id(channel)
-                                # send message to save
-                                session_info = f" (via {session.phone})" if session else ""
-                                logger.info(f"New message in channel '{channel.name}' [ID: {latest_message.id}]{session_info}")
-                                await save_message_to_data(latest_message, channel, queue, category_id, client, session)
-                                last_processed_message_ids[channel_identifier] = latest_message.id
-                            else:
-                                logger.debug(f"Message from channel '{channel.name}' already processed")
-                        else:
-                            logger.warning(f"Unable to get messages from channel: '{channel.name}'")
-
-                    except errors.FloodError as e:
-                        hours, remainder = divmod(e.seconds, 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        time_str = f"{hours}h {minutes}m {seconds}s" if hours > 0 else f"{minutes}m {seconds}s"
-                        logger.warning(f"Rate limit exceeded. Waiting {time_str}")
-                        await asyncio.sleep(e.seconds)
+                # Store changed auth keys in the DB, one batch for all sessions
+                if time.monotonic() - last_session_flush >= SESSION_FLUSH_INTERVAL:
+                    await session_pool.flush()
+                    last_session_flush = time.monotonic()
 
-                    except Exception as e:
-                        logger.error(f"Error in telethon_task for channel '{channel.name}': {e}")
-                        logger.error(f"Traceback: {traceback.format_exc()}")
+                # Reload the channel list and settings, new channels are polled right away
+                if time.monotonic() - last_channels_refresh >= CHANNELS_REFRESH_INTERVAL:
+                    channels = await get_channels()
+                    channels_by_id = {channel.id: channel for channel in channels if channel.is_active}
+                    scheduler.default_interval = await get_polling_interval()
+                    scheduler.sync(channels_by_id)
+                    last_channels_refresh = time.monotonic()
+                    logger.info(f"Active channels: {len(channels_by_id)}/{len(channels)}, polled {polled} time(s) since the last check")
+                    polled = 0
 
-                    # Small sleep between processing channels to avoid rate limiting
-                    await asyncio.sleep(5)
-                    
-                # End of channels loop
-                if stop_event:
-                    break
-                    
-                logger.info("Parsing cycle completed. Waiting 30 seconds for the next cycle...")
-                await asyncio.sleep(30)  # pause between checks
+                if not channels_by_id:
+                    logger.warning("No channels found for parsing. Waiting before retrying...")
+                    last_channels_refresh = 0
+                    await asyncio.sleep(30)
+                    continue
+                
+                # Poll the due channels concurrently, the pacer spaces the polls of each session
+                capacity = POLLS_PER_SESSION * max(1, len(telethon_clients)) - len(polls)
+                due_channel_ids = scheduler.pop_due(limit=capacity) if capacity > 0 else []
+                for channel_id in due_channel_ids:
+                    if channel_id in channels_by_id and channel_id not in polls:
+                        polls[channel_id] = asyncio.create_task(poll_and_schedule(channels_by_id[channel_id]))
+                
+                if not due_channel_ids:
+                    # wait for the next due channel, or for a poll to finish while all sessions are busy
+                    timeout = CHANNELS_REFRESH_INTERVAL if capacity <= 0 else min(scheduler.next_due_in(), CHANNELS_REFRESH_INTERVAL)
+                    if polls:
+                        await asyncio.wait(list(polls.values()), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    else:
+                        await asyncio.sleep(timeout)
                 
             except Exception as e:
                 logger.error(f"Error reading or processing channels: {e}")
+                heartbeat.record_error(e)
                 await asyncio.sleep(30)  # Wait before retrying
                 
     except Exception as e:
         logger.error(f"Error in telethon_task: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
     finally:
+        if init_task and not init_task.done():
+            init_task.cancel()
+            try:
+                await init_task
+            except asyncio.CancelledError:
+                pass
+        if health_task:
+            health_task.cancel()
+        running_polls = list(polls.values())
+        for task in running_polls:
+            task.cancel()
+        await asyncio.gather(*running_polls, return_exceptions=True)
+        pending_connections = list(connecting_sessions.values())
+        for task in pending_connections:
+            task.cancel()
+        await asyncio.gather(*pending_connections, return_exceptions=True)
+        await session_pool.flush()
         # Ensure all clients are properly disconnected
         for session_id, client_info in list(telethon_clients.items()):
             if client_info and 'client' in client_info:
@@ -576,20 +1040,38 @@ async def telethon_task(queue):
                         logger.error(f"Error disconnecting client for session {session_id}: {e}")
                 except Exception as e:
                     logger.error(f"Error disconnecting client for session {session_id}: {e}")
+            session_pool.untrack(client_info.get('session_id'))
+        telethon_clients.clear()
+        failed_sessions.clear()
+        if heartbeat_task:
+            heartbeat_task.cancel()
+        if heartbeat:
+            await heartbeat.astop()
+            heartbeat = None
+        if lease_task:
+            lease_task.cancel()
+        if lease:
+            await lease.release()
 
 def handle_interrupt(signum, frame):
     global stop_event
     logger.info("Received signal to stop Telethon...")
     stop_event = True
 
-def telethon_worker_process(queue):
+def telethon_worker_process(queue, shard_index=0, shard_count=None):
     """
     start background task Telethon in separate process.
+    With shard_count > 1 the process only handles its part of the sessions and channels,
+    shard_index is the preferred shard, another free one is taken if it is owned already.
     """
-    global stop_event
+    global stop_event, shard, lease_lost
     stop_event = False
+    shard = ShardAssignment(shard_index, shard_count or PARSER_SHARDS)
     
-    logger.info("Starting Telethon parser process...")
+    if shard.is_sharded:
+        logger.info(f"Starting Telethon parser process ({shard})...")
+    else:
+        logger.info("Starting Telethon parser process...")
     signal.signal(signal.SIGINT, handle_interrupt)
     signal.signal(signal.SIGTERM, handle_interrupt)
 
@@ -598,6 +1080,11 @@ def telethon_worker_process(queue):
     asyncio.set_event_loop(loop)
     try:
         loop.run_until_complete(telethon_task(queue))
+        while lease_lost:
+            lease_lost = False
+            stop_event = False
+            logger.info("Restarting the parser to acquire a shard lease again...")
+            loop.run_until_complete(telethon_task(queue))
     except KeyboardInterrupt:
         logger.info("Parser process completed by user (KeyboardInterrupt)")
         stop_event = True
@@ -21,6 +21,52 @@ def api_channels(request):
         'channels': []  # Empty list as fallback
     })
 
+def api_search_messages(request):
+    """
+    Search messages by text, hashtag or linked domain, newest first.
+    Reposts are collapsed into the first message, when it is among the
+    results as well, unless duplicates=1
+    """
+    from admin_panel.models import Message
+    from tg_bot import entity_index
+    from tg_bot.dedup import collapse_duplicates
+
+    query = request.GET.get('q', '').strip()
+    hashtag = request.GET.get('hashtag', '').strip()
+    domain = request.GET.get('domain', '').strip()
+    try:
+        limit = min(max(int(request.GET.get('limit', 20)), 1), 100)
+    except ValueError:
+        limit = 20
+
+    if hashtag:
+        messages = entity_index.messages_with_hashtag(hashtag)
+    elif domain:
+        messages = entity_index.messages_linking_domain(domain)
+    else:
+        messages = Message.objects.all()
+    if query:
+        messages = messages.filter(text__icontains=query)
+    if request.GET.get('duplicates') != '1':
+        messages = collapse_duplicates(messages, filtered=bool(hashtag or domain or query))
+
+    messages = messages.select_related('channel').order_by('-created_at')[:limit]
+    return JsonResponse({
+        'status': 'ok',
+        'messages': [
+            {
+                'id': message.id,
+                'text': message.text[:500],
+                'channel': message.channel.name,
+                'link': message.telegram_link,
+                'created_at': message.created_at.isoformat(),
+                'duplicate_of': message.duplicate_of_id,
+                'reposts': message.duplicate_count,
+            }
+            for message in messages
+        ],
+    })
+
 def bot_status(request):
     """Return status information about the bot."""
     return JsonResponse({
@@ -40,6 +86,7 @@ def webhook_info(request):
 urlpatterns = [
     path('', api_root, name='api_root'),
     path('channels/', api_channels, name='api_channels'),
+    path('messages/search/', api_search_messages, name='api_search_messages'),
     path('status/', bot_status, name='bot_status'),
     path('webhook/info/', webhook_info, name='webhook_info'),
 ] 
\ No newline at end of file
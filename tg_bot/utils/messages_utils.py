@@ -24,16 +24,16 @@ def parse_username_from_text(text):
     if username_match:
         return username_match.group(1)
     
+    # Try to match private invite links (before usernames, 'joinchat' looks like one)
+    invite_match = re.search(r'(?:https?://)?(?:t|telegram)\.me/(?:joinchat|join)/([a-zA-Z0-9_-]+)', text)
+    if invite_match:
+        return 'joinchat/' + invite_match.group(1)
+    
     # Try to match t.me or telegram.me links
     url_match = re.search(r'(?:https?://)?(?:t|telegram)\.me/([a-zA-Z0-9_]{5,32})', text)
     if url_match:
         return url_match.group(1)
     
-    # Try to match private invite links
-    invite_match = re.search(r'(?:https?://)?(?:t|telegram)\.me/(?:joinchat|join)/([a-zA-Z0-9_-]+)', text)
-    if invite_match:
-        return 'joinchat/' + invite_match.group(1)
-    
     # Try to match private channel links with ID
     private_match = re.search(r'(?:https?://)?(?:t|telegram)\.me/c/(\d+)', text)
     if private_match: